@@ -1,25 +1,62 @@
 # backend/app/database.py
-from sqlalchemy import create_engine
+from fastapi import Request
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 import os
 from pathlib import Path
 
+from .services.replica import READ_REPLICA, ReadReplica
+
 # Set the database path in the scripts directory
 SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
 DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{SCRIPTS_DIR}/ipa_symbols.db")
+# In WAL mode a long read (a streamed export, say) does not block writers
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "wal")
 
 engine = create_engine(
     DATABASE_URL, connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+if engine.dialect.name == "sqlite" and SQLITE_JOURNAL_MODE:
+    @event.listens_for(engine, "connect")
+    def set_journal_mode(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"PRAGMA journal_mode={SQLITE_JOURNAL_MODE}")
+        cursor.close()
+
 Base = declarative_base()
 
-# Dependency for routes
-def get_db():
-    db = SessionLocal()
+# Sessions for routes that only read: an in-memory copy of the database with
+# READ_REPLICA=true (SQLite only), otherwise the same database as SessionLocal
+if READ_REPLICA and engine.dialect.name == "sqlite":
+    read_replica = ReadReplica(engine, Base.metadata)
+    # A connection per session; opening one on the in-memory copy costs microseconds
+    read_engine = create_engine("sqlite://", creator=read_replica.connect, poolclass=NullPool)
+else:
+    read_replica = None
+    read_engine = engine
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+def _session(request, factory):
+    # Sub-requests of a sequential /api/batch call share the batch's session
+    shared = request.scope.get("state", {}).get("batch_db")
+    if shared is not None:
+        yield shared
+        return
+    
+    db = factory()
     try:
         yield db
     finally:
         db.close()
+
+# Dependency for routes
+def get_db(request: Request):
+    yield from _session(request, SessionLocal)
+
+# Dependency for routes that never write
+def get_read_db(request: Request):
+    yield from _session(request, ReadSessionLocal)
@@ -1,24 +1,37 @@
 # backend/app/main.py
-from fastapi import FastAPI, Request, HTTPException, Depends
+from fastapi import FastAPI, Request, HTTPException
 from fastapi.responses import HTMLResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.templating import Jinja2Templates
+from starlette.concurrency import run_in_threadpool
 import os
+import asyncio
+import logging
 from pathlib import Path
 from datetime import datetime
-from sqlalchemy.orm import Session
 
-from .routers import languages, phonemes, audio, proposals, discussions, notifications
-from .database import engine, Base, get_db
-from .models.notification import Notification
-from .models.discussion import DiscussionTopic
-from .models.proposal import Proposal
-from .models.phoneme import Phoneme, PhonemeType
-from .models.language import Language
+from .routers import languages, phonemes, audio, proposals, discussions, notifications, metrics, batch, inventories, images as images_router, jobs as jobs_router, exports, changes as changes_router
+from .database import engine, read_engine, SessionLocal, ReadSessionLocal
+from .migrations import check_schema
+from .services.metrics import MetricsMiddleware, instrument_engine
+from .services import sql_profiler, sampling_profiler, notification_retention, jobs, proposal_tasks, images, audio_catalog  # noqa: F401 - registers job handlers
+from .services import invalidation  # noqa: F401 - bumps cache generations when sessions commit writes
+from .services import changes  # noqa: F401 - logs writes to synced tables for /api/changes
+from .services import admission, leader
+from .services.grid import get_language_grids, build_grids
+from .services.language_registry import find_language, get_registry
+from .services.assets import ASSETS_URL, DIST_DIR, ImmutableStaticFiles, asset_url
+from .services.invalidation import generation
+from .services.singleflight import single_flight
+from .services.projections import INDEX_PROPOSALS, INDEX_TOPICS, NOTIFICATION_LIST, UNREAD_COUNT, with_replies
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+logger = logging.getLogger(__name__)
+
+# Tables are created by `python init_db.py migrate`, never at import time.
+# DB_SCHEMA_CHECK=warn|strict compares the recorded schema version on startup.
+DB_SCHEMA_CHECK = os.getenv("DB_SCHEMA_CHECK", "off").lower()
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
 
 # Define application
 app = FastAPI(
@@ -30,6 +43,11 @@ app = FastAPI(
     openapi_url="/api/openapi.json"
 )
 
+# Per-class concurrency limits, bounded queues and write rate limits; innermost so
+# rejections still get CORS headers and show up in the metrics
+if admission.ADMISSION_ENABLED:
+    app.add_middleware(admission.AdmissionMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -39,157 +57,200 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-route latency, SQL statement counts and pool gauges, exposed on /metrics
+if METRICS_ENABLED:
+    instrument_engine(engine)
+    if read_engine is not engine:
+        instrument_engine(read_engine, "replica")
+    app.add_middleware(MetricsMiddleware)
+
+# Opt-in statement recording and N+1 detection for development (SQL_DEBUG=true)
+if sql_profiler.SQL_DEBUG:
+    sql_profiler.instrument_engine(engine)
+    if read_engine is not engine:
+        sql_profiler.instrument_engine(read_engine)
+    app.add_middleware(sql_profiler.SQLProfilerMiddleware)
+
+# Sampled stack profiles of a fraction of requests, or of those sent with X-Profile
+if sampling_profiler.PROFILER_ENABLED:
+    app.add_middleware(sampling_profiler.ProfilerMiddleware)
+
 # Get base directory for static files
 BASE_DIR = Path(__file__).resolve().parent.parent
 STATIC_DIR = BASE_DIR / "static"
 
-# Mount static files
+# Mount static files; built, content-hashed assets are cacheable forever (scripts/build_assets.py)
+app.mount(ASSETS_URL, ImmutableStaticFiles(directory=DIST_DIR, check_dir=False), name="assets")
 app.mount("/css", StaticFiles(directory=os.path.join(STATIC_DIR, "css")), name="css")
 app.mount("/js", StaticFiles(directory=os.path.join(STATIC_DIR, "js")), name="js")
 app.mount("/images", StaticFiles(directory=os.path.join(STATIC_DIR, "images")), name="images")
-app.mount("/audio", StaticFiles(directory=os.path.join(STATIC_DIR, "audio")), name="audio")
+app.mount("/audio", audio_catalog.CatalogStaticFiles(directory=os.path.join(STATIC_DIR, "audio"), reference_prefix="audio/"), name="audio")
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
 # Setup templates
 templates = Jinja2Templates(directory=os.path.join(BASE_DIR, "templates"))
+templates.env.globals["asset_url"] = asset_url
+templates.env.globals["audio_info"] = audio_catalog.audio_info
 
 # Include API routers
 app.include_router(languages.router, prefix="/api", tags=["languages"])
 app.include_router(phonemes.router, prefix="/api", tags=["phonemes"])
+app.include_router(inventories.router, prefix="/api", tags=["inventories"])
 app.include_router(audio.router, prefix="/api", tags=["audio"])
+app.include_router(images_router.router, prefix="/api", tags=["images"])
 app.include_router(proposals.router, prefix="/api", tags=["proposals"])
 app.include_router(discussions.router, prefix="/api", tags=["discussions"])
 app.include_router(notifications.router, prefix="/api", tags=["notifications"])
+app.include_router(jobs_router.router, prefix="/api", tags=["jobs"])
+app.include_router(exports.router, prefix="/api", tags=["export"])
+app.include_router(changes_router.router, prefix="/api", tags=["changes"])
+app.include_router(batch.router, prefix="/api", tags=["batch"])
+if METRICS_ENABLED:
+    app.include_router(metrics.router, tags=["metrics"])
+# Debugging routers are only imported when their flag is set
+if sql_profiler.SQL_DEBUG:
+    from .routers import debug
+    app.include_router(debug.router, prefix="/api", tags=["debug"])
+# Only with a token to guard them; a sample rate alone collects profiles but serves none
+if sampling_profiler.PROFILE_TOKEN:
+    from .routers import profiler
+    app.include_router(profiler.router, prefix="/api", tags=["debug"])
 
-def organize_phonemes(phonemes, phoneme_type):
+@app.on_event("startup")
+async def size_threadpool():
     """
-    Organize phonemes into a grid for display in templates
+    Make room in the threadpool for every request admission control lets through
     """
-    if phoneme_type == PhonemeType.consonant:
-        # Define consonant grid structure
-        rows = [
-            "Nasal", "Plosive", "Implosive", "Sibilant fricative", 
-            "Non-sibilant fricative", "Approximant", "Flap", "Trill", 
-            "Fricative trill", "Lateral approximant"
-        ]
-        
-        # Initialize grid
-        grid = [[{"manner": row} for _ in range(28)] for row in rows]
-        
-        # Place phonemes in grid
-        for phoneme in phonemes:
-            if phoneme.row_position < len(rows) and phoneme.column_position < 28:
-                cell = {
-                    "symbol": phoneme.symbol,
-                    "manner": rows[phoneme.row_position],
-                    "description": phoneme.description,
-                    "audio_url": phoneme.audio_file,
-                    "impossible": phoneme.impossibility_reason is not None
-                }
-                grid[phoneme.row_position][phoneme.column_position] = cell
+    if admission.ADMISSION_ENABLED:
+        admission.size_threadpool()
+
+@app.on_event("startup")
+def check_database_schema():
+    """
+    Optionally verify the schema version with a single query
+    """
+    if DB_SCHEMA_CHECK not in ("warn", "strict"):
+        return
     
-    elif phoneme_type == PhonemeType.vowel:
-        # Define vowel grid structure
-        rows = ["Near-close", "Mid", "Near-open", "Open"]
+    current, latest = check_schema(engine)
+    if current != latest:
+        message = f"Database schema is at version {current}, expected {latest}; run 'python init_db.py migrate'"
+        if DB_SCHEMA_CHECK == "strict":
+            raise RuntimeError(message)
+        logger.warning(message)
+
+@app.on_event("startup")
+def load_language_registry():
+    """
+    Load the language registry so the first requests resolve language codes without a query
+    """
+    db = ReadSessionLocal()
+    try:
+        get_registry(db)
+    except Exception as e:
+        logger.warning("Could not preload languages: %s", e)
+    finally:
+        db.close()
+
+@app.on_event("startup")
+async def start_notification_retention():
+    """
+    Run notification roll-up and pruning periodically when NOTIFICATION_RETENTION_INTERVAL is set,
+    in one worker process per host
+    """
+    async def run_retention():
+        await leader.wait_until_leader("notification-retention")
+        await notification_retention.retention_loop(SessionLocal)
+
+    if notification_retention.RETENTION_INTERVAL > 0:
+        app.state.retention_task = asyncio.create_task(run_retention())
+
+@app.on_event("shutdown")
+async def stop_notification_retention():
+    task = getattr(app.state, "retention_task", None)
+    if task is not None:
+        task.cancel()
+        leader.release("notification-retention")
+
+@app.on_event("startup")
+async def start_job_workers():
+    """
+    Start in-process background job workers in one worker process per host
+    (JOB_WORKERS=0 leaves them to scripts/run_jobs.py)
+    """
+    async def run_job_workers():
+        await leader.wait_until_leader("job-workers")
+        app.state.job_workers = jobs.WorkerPool(SessionLocal)
+        # Requeues stale jobs before the threads start
+        await run_in_threadpool(app.state.job_workers.start)
+
+    if jobs.JOB_WORKERS > 0:
+        app.state.job_workers_task = asyncio.create_task(run_job_workers())
+
+@app.on_event("shutdown")
+def stop_job_workers():
+    task = getattr(app.state, "job_workers_task", None)
+    if task is not None:
+        task.cancel()
+    pool = getattr(app.state, "job_workers", None)
+    if pool is not None:
+        pool.stop()
+    leader.release("job-workers")
+
+# Tables the main page is built from; a write to any of them changes the page
+INDEX_TABLES = ("proposals", "discussion_topics", "discussion_replies", "notifications", "phonemes", "languages", "audio_files")
+
+def render_index(current_date):
+    """
+    Query everything the main page shows and render it, in its own session
+    (the render may be shared by several concurrent requests)
+    """
+    db = ReadSessionLocal()
+    try:
+        # Phoneme charts (default to English), cached per data version
+        language = find_language(db, "english")
+        if language is not None:
+            grids = get_language_grids(db, language)
+        else:
+            grids = build_grids(db, "english", None)
         
-        # Initialize grid
-        grid = [[{"height": row} for _ in range(6)] for row in rows]
+        # Proposals, topics and notifications as column rows; nothing here is modified
+        proposals = db.execute(INDEX_PROPOSALS).all()
+        topics = with_replies(db, db.execute(INDEX_TOPICS))
+        recent_notifications = db.execute(NOTIFICATION_LIST.limit(3)).all()
+        unread_count = db.execute(UNREAD_COUNT).scalar()
         
-        # Place phonemes in grid
-        for phoneme in phonemes:
-            if phoneme.row_position < len(rows) and phoneme.column_position < 6:
-                cell = {
-                    "symbol": phoneme.symbol,
-                    "height": rows[phoneme.row_position],
-                    "description": phoneme.description,
-                    "audio_url": phoneme.audio_file,
-                }
-                grid[phoneme.row_position][phoneme.column_position] = cell
-    
-    return grid
+        # Prepare context data for template
+        context = {
+            "consonants": grids.rows("consonants"),
+            "vowels": grids.rows("vowels"),
+            "impossible_consonants": grids.rows("impossible"),
+            "other_consonants": grids.other_consonants,
+            "other_vowels": grids.other_vowels,
+            "proposals": proposals,
+            "topics": topics,
+            "notifications": recent_notifications,  # Only the 3 most recent for initial display
+            "unread_notifications": unread_count,
+            "current_date": current_date,
+            "current_language": "english"
+        }
+        
+        return templates.get_template("index.html").render(context)
+    finally:
+        db.close()
 
 @app.get("/", response_class=HTMLResponse)
-async def root(request: Request, db: Session = Depends(get_db)):
+async def root():
     """
     Serve the main HTML page with dynamic data from the database
     """
-    # Get language (default to English)
-    language = db.query(Language).filter(Language.code == "english").first()
-    if not language:
-        language_id = None
-    else:
-        language_id = language.id
-    
-    # Get phoneme data
-    consonants = db.query(Phoneme).filter(
-        Phoneme.language_id == language_id,
-        Phoneme.type == PhonemeType.consonant,
-        Phoneme.impossibility_reason == None,
-        Phoneme.is_extended == True
-    ).all()
-    
-    vowels = db.query(Phoneme).filter(
-        Phoneme.language_id == language_id,
-        Phoneme.type == PhonemeType.vowel,
-        Phoneme.is_extended == True
-    ).all()
-    
-    impossible_phonemes = db.query(Phoneme).filter(
-        Phoneme.language_id == language_id,
-        Phoneme.impossibility_reason != None
-    ).all()
-    
-    # Get special phonemes for "Other ones" sections
-    other_consonants = []
-    for consonant in consonants:
-        # Use criteria to decide if it should be in "Other ones"
-        if consonant.description and ("bunched" in consonant.description.lower() or 
-                                     "click" in consonant.description.lower() or
-                                     "compressed" in consonant.description.lower() or
-                                     "creaky" in consonant.description.lower() or
-                                     "lateral approximant" in consonant.description.lower()):
-            other_consonants.append(consonant)
-    
-    other_vowels = []
-    for vowel in vowels:
-        if "near-" in vowel.description.lower() or "close" in vowel.description.lower():
-            other_vowels.append(vowel)
-    
-    # Organize phonemes into grids
-    consonant_grid = organize_phonemes(consonants, PhonemeType.consonant)
-    vowel_grid = organize_phonemes(vowels, PhonemeType.vowel)
-    impossible_grid = organize_phonemes(impossible_phonemes, PhonemeType.consonant)
-    
-    # Get proposals
-    proposals = db.query(Proposal).order_by(Proposal.submitted_date.desc()).all()
-    
-    # Get discussion topics
-    topics = db.query(DiscussionTopic).order_by(DiscussionTopic.created_date.desc()).all()
-    
-    # Get notifications
-    all_notifications = db.query(Notification).order_by(Notification.created_date.desc()).all()
-    unread_count = db.query(Notification).filter(Notification.is_read == False).count()
-    
     # Format dates and times for template
     current_date = datetime.now().strftime('%B %d, %Y')
     
-    # Prepare context data for template
-    context = {
-        "request": request,
-        "consonants": consonant_grid,
-        "vowels": vowel_grid,
-        "impossible_consonants": impossible_grid,
-        "other_consonants": other_consonants,
-        "other_vowels": other_vowels,
-        "proposals": proposals,
-        "topics": topics,
-        "notifications": all_notifications[:3],  # Only send the 3 most recent for initial display
-        "unread_notifications": unread_count,
-        "current_date": current_date,
-        "current_language": "english"
-    }
-    
-    return templates.TemplateResponse("index.html", context)
+    # Concurrent requests for the same data version share one query-and-render pass
+    key = ("index", current_date, generation(*INDEX_TABLES))
+    html = await single_flight.run(key, render_index, current_date)
+    return HTMLResponse(html)
 
 @app.get("/api", response_class=HTMLResponse)
 async def api_documentation(request: Request):
@@ -0,0 +1,129 @@
+# backend/app/migrations.py
+"""
+Schema migrations.
+
+Migrations are applied in order by `python init_db.py migrate` and every applied
+version is recorded in the schema_versions table. The app itself never creates
+or reflects tables; at most it compares the recorded version with
+LATEST_VERSION, which is a single indexed query.
+"""
+from datetime import datetime
+from sqlalchemy import inspect, select, func, insert, text
+from sqlalchemy.exc import DBAPIError
+
+from .database import Base
+from . import models  # noqa: F401 - registers every model with Base
+from .models.schema_version import SchemaVersion
+from .models.discussion import DiscussionTopic, DiscussionReply
+from .models.notification import Notification
+from .models.proposal import Proposal
+
+def add_column(conn, table_name, column_name, column_ddl):
+    """Add a column unless it already exists (fresh databases get it from create_all)."""
+    columns = [column["name"] for column in inspect(conn).get_columns(table_name)]
+    if column_name not in columns:
+        conn.exec_driver_sql(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_ddl}")
+
+def create_index(conn, index):
+    """Create an index declared on a model unless it already exists."""
+    index.create(bind=conn, checkfirst=True)
+
+def get_index(table, name):
+    return next(index for index in table.indexes if index.name == name)
+
+def create_tables(conn):
+    """Create any table that does not exist yet."""
+    Base.metadata.create_all(bind=conn)
+
+def add_discussion_reply_stats(conn):
+    """Denormalize reply_count/last_reply_at onto topics and index replies for keyset pagination."""
+    add_column(conn, "discussion_topics", "reply_count", "INTEGER NOT NULL DEFAULT 0")
+    add_column(conn, "discussion_topics", "last_reply_at", "DATETIME")
+    conn.execute(text("""
+        UPDATE discussion_topics SET
+            reply_count = (
+                SELECT COUNT(*) FROM discussion_replies
+                WHERE discussion_replies.topic_id = discussion_topics.id
+            ),
+            last_reply_at = (
+                SELECT MAX(created_date) FROM discussion_replies
+                WHERE discussion_replies.topic_id = discussion_topics.id
+            )
+    """))
+    create_index(conn, get_index(DiscussionTopic.__table__, "ix_discussion_topics_created_date"))
+    create_index(conn, get_index(DiscussionReply.__table__, "ix_discussion_replies_topic_created"))
+
+def add_notification_retention(conn):
+    """Create the digest table and the indexes retention and unread listings scan."""
+    create_tables(conn)
+    create_index(conn, get_index(Notification.__table__, "ix_notifications_is_read_created"))
+    create_index(conn, get_index(Notification.__table__, "ix_notifications_created_date"))
+
+def add_background_jobs(conn):
+    """Create the durable background job table."""
+    create_tables(conn)
+
+def add_proposal_leaderboard_index(conn):
+    """Index proposals by (status, votes) for the vote-ranked leaderboard."""
+    create_index(conn, get_index(Proposal.__table__, "ix_proposals_status_votes"))
+
+def add_change_log(conn):
+    """Create the change log behind /api/changes."""
+    create_tables(conn)
+
+def add_audio_catalog(conn):
+    """Create the audio file catalog."""
+    create_tables(conn)
+
+# (version, description, function) - append only, never renumber
+MIGRATIONS = [
+    (1, "Create initial tables", create_tables),
+    (2, "Discussion reply counts and reply pagination index", add_discussion_reply_stats),
+    (3, "Notification digests and retention indexes", add_notification_retention),
+    (4, "Background job queue", add_background_jobs),
+    (5, "Proposal leaderboard index", add_proposal_leaderboard_index),
+    (6, "Change log for incremental sync", add_change_log),
+    (7, "Audio file catalog", add_audio_catalog),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+def get_current_version(conn):
+    """Return the highest applied migration, or 0 for an unmanaged database."""
+    try:
+        return conn.execute(select(func.max(SchemaVersion.version))).scalar() or 0
+    except DBAPIError:
+        conn.rollback()
+        return 0
+
+def check_schema(engine):
+    """Return (current_version, LATEST_VERSION) without touching anything else."""
+    with engine.connect() as conn:
+        return get_current_version(conn), LATEST_VERSION
+
+def migrate(engine, force=False):
+    """
+    Apply all pending migrations and return the list of applied versions.
+
+    With force=True every table is dropped and the schema is rebuilt from scratch.
+    """
+    if force:
+        Base.metadata.drop_all(bind=engine)
+
+    applied = []
+    with engine.begin() as conn:
+        SchemaVersion.__table__.create(bind=conn, checkfirst=True)
+        current = get_current_version(conn)
+
+        for version, description, apply in MIGRATIONS:
+            if version <= current:
+                continue
+            apply(conn)
+            conn.execute(insert(SchemaVersion).values(
+                version=version,
+                description=description,
+                applied_date=datetime.utcnow()
+            ))
+            applied.append(version)
+
+    return applied
@@ -4,4 +4,8 @@ from .phoneme import Phoneme, PhonemeType
 from .allophone import Allophone
 from .proposal import Proposal
 from .discussion import DiscussionTopic, DiscussionReply
-from .notification import Notification
+from .notification import Notification, NotificationDigest
+from .schema_version import SchemaVersion
+from .job import Job
+from .change import Change
+from .audio_file import AudioFile
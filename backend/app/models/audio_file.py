@@ -0,0 +1,17 @@
+# app/models/audio_file.py
+from sqlalchemy import Column, String, DateTime, BigInteger, Float
+from datetime import datetime
+from ..database import Base
+
+class AudioFile(Base):
+    """An audio file identified from its headers (see app.services.audio_catalog)."""
+    __tablename__ = "audio_files"
+    
+    path = Column(String, primary_key=True)  # reference as stored in audio_file columns
+    size = Column(BigInteger, nullable=False)
+    mtime_ns = Column(BigInteger, nullable=False)
+    codec = Column(String, nullable=False)  # e.g. "mp3", "vorbis", "opus", "pcm"
+    mime_type = Column(String, nullable=False)
+    duration = Column(Float)  # seconds, when the headers tell
+    sha256 = Column(String(64), nullable=False)
+    checked_date = Column(DateTime, default=datetime.utcnow)
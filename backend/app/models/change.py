@@ -0,0 +1,21 @@
+# app/models/change.py
+from sqlalchemy import Column, String, DateTime, Integer, Index
+from datetime import datetime
+from ..database import Base
+from ..utils.uuid_utils import SqliteUUID
+
+class Change(Base):
+    """One write to a synced entity; `version` orders the change feed."""
+    __tablename__ = "changes"
+    
+    version = Column(Integer, primary_key=True, autoincrement=True)
+    entity_type = Column(String, nullable=False)  # dataset name, e.g. "proposals", "replies"
+    entity_id = Column(SqliteUUID, nullable=False)
+    operation = Column(String, nullable=False)  # "upsert" or "delete"
+    changed_date = Column(DateTime, nullable=False, default=datetime.utcnow)
+    
+    # AUTOINCREMENT: versions are never reused, even after the newest rows are pruned
+    __table_args__ = (
+        Index("ix_changes_changed_date", "changed_date"),
+        {"sqlite_autoincrement": True},
+    )
@@ -1,5 +1,5 @@
 # app/models/discussion.py
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Integer, Index
 from sqlalchemy.orm import relationship
 import uuid
 from datetime import datetime
@@ -14,7 +14,11 @@ class DiscussionTopic(Base):
     content = Column(Text, nullable=False)
     author_name = Column(String)
     author_email = Column(String)
-    created_date = Column(DateTime, default=datetime.utcnow)
+    created_date = Column(DateTime, default=datetime.utcnow, index=True)
+    
+    # Denormalized reply statistics, maintained by add_reply/delete_reply
+    reply_count = Column(Integer, nullable=False, default=0, server_default="0")
+    last_reply_at = Column(DateTime, nullable=True)
     
     replies = relationship("DiscussionReply", back_populates="topic")
 
@@ -28,3 +32,8 @@ class DiscussionReply(Base):
     created_date = Column(DateTime, default=datetime.utcnow)
     
     topic = relationship("DiscussionTopic", back_populates="replies")
+    
+    # Keyset pagination of a topic's replies in (created_date, id) order
+    __table_args__ = (
+        Index("ix_discussion_replies_topic_created", "topic_id", "created_date", "id"),
+    )
@@ -0,0 +1,27 @@
+# app/models/job.py
+from sqlalchemy import Column, String, Text, DateTime, Integer, Index
+import uuid
+from datetime import datetime
+from ..database import Base
+from ..utils.uuid_utils import SqliteUUID
+
+class Job(Base):
+    __tablename__ = "background_jobs"
+    
+    id = Column(SqliteUUID, primary_key=True, default=uuid.uuid4)
+    kind = Column(String, nullable=False)
+    payload = Column(Text, nullable=False, default="{}")  # JSON
+    status = Column(String, nullable=False, default="queued")  # queued, running, done, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    run_after = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_date = Column(DateTime, default=datetime.utcnow)
+    started_date = Column(DateTime)
+    finished_date = Column(DateTime)
+    locked_by = Column(String)
+    last_error = Column(Text)
+    
+    # Workers claim the oldest runnable job with this index
+    __table_args__ = (
+        Index("ix_background_jobs_status_run_after", "status", "run_after"),
+    )
@@ -1,5 +1,5 @@
 # app/models/notification.py
-from sqlalchemy import Column, String, Text, DateTime, Boolean
+from sqlalchemy import Column, String, Text, DateTime, Boolean, Integer, Index
 import uuid
 from datetime import datetime
 from ..database import Base
@@ -15,3 +15,26 @@ class Notification(Base):
     related_entity_id = Column(SqliteUUID)
     is_read = Column(Boolean, default=False)
     created_date = Column(DateTime, default=datetime.utcnow)
+    
+    # Unread listings and retention both scan by (is_read, created_date)
+    __table_args__ = (
+        Index("ix_notifications_is_read_created", "is_read", "created_date"),
+        Index("ix_notifications_created_date", "created_date"),
+    )
+
+class NotificationDigest(Base):
+    """Compact roll-up of old read notifications about the same entity."""
+    __tablename__ = "notification_digests"
+    
+    id = Column(SqliteUUID, primary_key=True, default=uuid.uuid4)
+    related_entity_type = Column(String)
+    related_entity_id = Column(SqliteUUID)
+    notification_count = Column(Integer, nullable=False, default=0)
+    latest_title = Column(String)
+    first_created_date = Column(DateTime)
+    last_created_date = Column(DateTime)
+    updated_date = Column(DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        Index("ix_notification_digests_entity", "related_entity_type", "related_entity_id"),
+    )
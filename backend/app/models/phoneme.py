@@ -6,7 +6,7 @@ import enum
 from ..database import Base
 from ..utils.uuid_utils import SqliteUUID
 
-class PhonemeType(enum.Enum):
+class PhonemeType(str, enum.Enum):
     consonant = "consonant"
     vowel = "vowel"
 
@@ -1,5 +1,5 @@
 # app/models/proposal.py
-from sqlalchemy import Column, String, Integer, Text, DateTime
+from sqlalchemy import Column, String, Integer, Text, DateTime, Index
 import uuid
 from datetime import datetime
 from ..database import Base
@@ -19,3 +19,8 @@ class Proposal(Base):
     submitted_date = Column(DateTime, default=datetime.utcnow)
     status = Column(String, default="pending")
     votes = Column(Integer, default=0)
+    
+    # Leaderboard reads: highest votes first within a status, oldest first on ties
+    __table_args__ = (
+        Index("ix_proposals_status_votes", status, votes.desc(), submitted_date),
+    )
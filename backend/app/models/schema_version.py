@@ -0,0 +1,11 @@
+# app/models/schema_version.py
+from sqlalchemy import Column, Integer, String, DateTime
+from datetime import datetime
+from ..database import Base
+
+class SchemaVersion(Base):
+    __tablename__ = "schema_versions"
+    
+    version = Column(Integer, primary_key=True)
+    description = Column(String)
+    applied_date = Column(DateTime, default=datetime.utcnow)
@@ -2,14 +2,18 @@ from fastapi import APIRouter, HTTPException
 from fastapi.responses import FileResponse
 import os
 from pathlib import Path
+from ..services.audio_catalog import media_type, resolve_reference, sniff
 
 router = APIRouter()
 
 # Define base directory for audio files
 AUDIO_DIR = Path(__file__).resolve().parent.parent.parent / "audio"
 
+# Sync routes: resolving the file and sniffing an uncataloged one read the disk,
+# so they run in the threadpool rather than on the event loop
+
 @router.get("/audio/{lang_code}/{filename}")
-async def get_audio(lang_code: str, filename: str):
+def get_audio(lang_code: str, filename: str):
     """
     Serve an audio file for a specific language.
     
@@ -20,22 +24,23 @@ async def get_audio(lang_code: str, filename: str):
     Returns:
     - Audio file as a streaming response
     """
-    # Construct file path
-    file_path = AUDIO_DIR / lang_code / filename
+    # Construct file path, refusing names that lead outside the language's directory
+    language_dir = (AUDIO_DIR / lang_code).resolve()
+    file_path = (language_dir / filename).resolve()
     
     # Check if file exists
-    if not file_path.exists():
+    if not file_path.is_relative_to(language_dir) or not file_path.is_file():
         raise HTTPException(status_code=404, detail="Audio file not found")
     
-    # Return file
+    # Language directories are not cataloged; the type is read from the file's headers
     return FileResponse(
         path=str(file_path),
-        media_type="audio/mpeg",  # Assumes MP3, but will be overridden by content type detection
+        media_type=sniff(file_path)[1],
         filename=filename
     )
 
 @router.get("/audio/proposals/{filename}")
-async def get_proposal_audio(filename: str):
+def get_proposal_audio(filename: str):
     """
     Serve an audio file for a proposal.
     
@@ -45,16 +50,17 @@ async def get_proposal_audio(filename: str):
     Returns:
     - Audio file as a streaming response
     """
-    # Construct file path
-    file_path = AUDIO_DIR / "proposals" / filename
+    # Proposal uploads are cataloged as "proposals/<filename>"
+    reference = f"proposals/{filename}"
+    file_path = resolve_reference(reference)
     
     # Check if file exists
-    if not file_path.exists():
+    if file_path is None:
         raise HTTPException(status_code=404, detail="Proposal audio file not found")
     
-    # Return file
+    # Return file with the cataloged type, or the one read from its headers if not cataloged yet
     return FileResponse(
         path=str(file_path),
-        media_type="audio/mpeg",  # Assumes MP3, but will be overridden by content type detection
+        media_type=media_type(reference, file_path),
         filename=filename
     )
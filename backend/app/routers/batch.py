@@ -0,0 +1,114 @@
+# File: backend/app/routers/batch.py
+import asyncio
+import json
+from urllib.parse import urlsplit
+
+from fastapi import APIRouter, Request, HTTPException
+
+from ..database import SessionLocal
+from ..schemas.batch import BatchRequest, BatchResponse
+
+router = APIRouter()
+
+MAX_BATCH_SIZE = 20
+# Parallel sub-requests each hold a pooled connection; stay well inside the pool
+MAX_PARALLEL = 4
+# Response headers worth passing back to the client
+FORWARDED_HEADERS = ("content-type", "cache-control", "etag", "last-modified")
+# Request headers that describe the batch body, not the sub-requests
+DROPPED_HEADERS = {b"content-length", b"content-type", b"transfer-encoding", b"expect"}
+
+def sub_request_scope(parent, path, query_string, state):
+    """Build the ASGI scope of a GET sub-request from the batch request's scope."""
+    return {
+        "type": "http",
+        "asgi": parent.get("asgi", {"version": "3.0"}),
+        "http_version": parent.get("http_version", "1.1"),
+        "method": "GET",
+        "scheme": parent.get("scheme", "http"),
+        "server": parent.get("server"),
+        "client": parent.get("client"),
+        "root_path": parent.get("root_path", ""),
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query_string.encode(),
+        "headers": [(name, value) for name, value in parent["headers"] if name not in DROPPED_HEADERS],
+        "state": state,
+    }
+
+async def dispatch(app, parent_scope, item, db=None):
+    """Run one GET sub-request through the application in-process and capture its response."""
+    url = urlsplit(item.path)
+    state = dict(parent_scope.get("state") or {})
+    # Already admitted as part of the batch (see app.services.admission)
+    state["batch_subrequest"] = True
+    if db is not None:
+        state["batch_db"] = db
+    scope = sub_request_scope(parent_scope, url.path, url.query, state)
+
+    status = 500
+    headers = {}
+    chunks = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            for name, value in message.get("headers", []):
+                name = name.decode("latin-1").lower()
+                if name in FORWARDED_HEADERS:
+                    headers[name] = value.decode("latin-1")
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await app(scope, receive, send)
+    except Exception:
+        # The error middleware has already logged the exception
+        if db is not None:
+            db.rollback()
+        return {"id": item.id, "path": item.path, "status": 500, "headers": {}, "body": {"detail": "Internal Server Error"}}
+
+    raw = b"".join(chunks)
+    body = raw.decode("utf-8", errors="replace")
+    if headers.get("content-type", "").startswith("application/json") and raw:
+        body = json.loads(raw)
+    return {"id": item.id, "path": item.path, "status": status, "headers": headers, "body": body}
+
+@router.post("/batch", response_model=BatchResponse)
+async def batch(batch_request: BatchRequest, request: Request):
+    """
+    Run several GET requests to /api routes in one round trip.
+
+    By default the sub-requests run one after another and share a single database
+    session. With "parallel": true they run concurrently, each with its own session.
+    Every item gets its own status and body; one failing item does not fail the batch.
+    """
+    items = batch_request.requests
+    if len(items) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"A batch may contain at most {MAX_BATCH_SIZE} requests")
+    for item in items:
+        path = urlsplit(item.path).path
+        if not path.startswith("/api/") or path.rstrip("/") == "/api/batch":
+            raise HTTPException(status_code=400, detail=f"Cannot batch '{item.path}': only GET requests to /api routes are allowed")
+
+    app = request.app
+    if batch_request.parallel:
+        semaphore = asyncio.Semaphore(MAX_PARALLEL)
+
+        async def run(item):
+            async with semaphore:
+                return await dispatch(app, request.scope, item)
+
+        responses = await asyncio.gather(*(run(item) for item in items))
+    else:
+        db = SessionLocal()
+        try:
+            responses = [await dispatch(app, request.scope, item, db) for item in items]
+        finally:
+            db.close()
+
+    return {"responses": responses}
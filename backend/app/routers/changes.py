@@ -0,0 +1,36 @@
+# File: backend/app/routers/changes.py
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from ..database import get_db
+from ..schemas.change import ChangeFeed
+from ..services.changes import TRACKED_TABLES, MAX_LIMIT, ResyncRequired, changes_since, latest_version
+
+router = APIRouter()
+
+@router.get("/changes", response_model=ChangeFeed)
+def get_changes(
+    since: Optional[int] = Query(None, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_LIMIT),
+    types: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Get what changed after version `since`: the current row for inserts and updates,
+    a tombstone for deletes. Without `since`, only the current version is returned.
+    """
+    if since is None:
+        return {"version": latest_version(db)}
+    
+    type_list = None
+    if types:
+        type_list = [name.strip() for name in types.split(",") if name.strip()]
+        unknown = set(type_list) - set(TRACKED_TABLES.values())
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown change types: {', '.join(sorted(unknown))}")
+    
+    try:
+        version, has_more, changes = changes_since(db, since, limit, type_list)
+    except ResyncRequired:
+        raise HTTPException(status_code=410, detail="Version is older than the change log; reload everything")
+    return {"version": version, "has_more": has_more, "changes": changes}
@@ -0,0 +1,27 @@
+# File: backend/app/routers/debug.py
+from fastapi import APIRouter, HTTPException
+from typing import Optional
+from ..services import sql_profiler
+
+router = APIRouter()
+
+@router.get("/debug/sql")
+def get_sql_profiles(limit: int = 20, n_plus_one: bool = False, route: Optional[str] = None):
+    """
+    Get recent per-request SQL summaries, newest first (SQL_DEBUG only)
+    """
+    return {
+        "n_plus_one_threshold": sql_profiler.N_PLUS_ONE_THRESHOLD,
+        "slow_query_ms": sql_profiler.SLOW_QUERY_MS,
+        "requests": sql_profiler.recent_profiles(limit, n_plus_one, route)
+    }
+
+@router.get("/debug/sql/{profile_id}")
+def get_sql_profile(profile_id: str):
+    """
+    Get the SQL summary of one request by its X-SQL-Debug-Id header
+    """
+    profile = sql_profiler.get_profile(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="SQL profile not found")
+    return profile
@@ -1,24 +1,46 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func, or_, and_, select
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from ..database import get_db
+from ..database import get_db, get_read_db
 from ..models.discussion import DiscussionTopic, DiscussionReply
-from ..schemas.discussion import Topic, TopicCreate, Reply, ReplyCreate
+from ..schemas.discussion import Topic, TopicCreate, TopicSummary, Reply, ReplyCreate, ReplyPage
+from ..services.changes import record_changes, record_changes_from
+from ..services.projections import TOPIC_LIST, TOPIC_SUMMARIES, REPLY_LIST, with_replies
+import base64
 import uuid
 from datetime import datetime
 
 router = APIRouter()
 
+def encode_reply_cursor(reply):
+    """Opaque keyset cursor pointing just after `reply` in (created_date, id) order."""
+    raw = f"{reply.created_date.isoformat()}|{reply.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_reply_cursor(cursor):
+    try:
+        created, reply_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created), uuid.UUID(reply_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 @router.get("/discussions", response_model=List[Topic])
-def get_discussions(skip: int = 0, limit: int = 10, db: Session = Depends(get_db)):
+def get_discussions(skip: int = 0, limit: int = 10, db: Session = Depends(get_read_db)):
     """
-    Get all discussion topics with pagination
+    Get all discussion topics with pagination, including their replies.
+    Use /discussions/summaries for listings that only need reply counts.
     """
-    topics = db.query(DiscussionTopic).order_by(
-        DiscussionTopic.created_date.desc()
-    ).offset(skip).limit(limit).all()
+    topics = db.execute(TOPIC_LIST.offset(skip).limit(limit))
     
-    return topics
+    return with_replies(db, topics)
+
+@router.get("/discussions/summaries", response_model=List[TopicSummary])
+def get_discussion_summaries(skip: int = 0, limit: int = 10, db: Session = Depends(get_read_db)):
+    """
+    Get discussion topics with reply counts but without content or replies
+    """
+    return db.execute(TOPIC_SUMMARIES.offset(skip).limit(limit)).all()
 
 @router.post("/discussions", response_model=Topic)
 def create_discussion(topic: TopicCreate, db: Session = Depends(get_db)):
@@ -39,15 +61,52 @@ def create_discussion(topic: TopicCreate, db: Session = Depends(get_db)):
     return db_topic
 
 @router.get("/discussions/{topic_id}", response_model=Topic)
-def get_discussion(topic_id: uuid.UUID, db: Session = Depends(get_db)):
+def get_discussion(topic_id: uuid.UUID, db: Session = Depends(get_read_db)):
     """
-    Get a specific discussion topic with all replies
+    Get a specific discussion topic with all replies.
+    Use /discussions/{topic_id}/replies to page through long threads.
     """
     topic = db.query(DiscussionTopic).filter(DiscussionTopic.id == topic_id).first()
     if topic is None:
         raise HTTPException(status_code=404, detail="Discussion topic not found")
     return topic
 
+@router.get("/discussions/{topic_id}/replies", response_model=ReplyPage)
+def get_replies(
+    topic_id: uuid.UUID,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_read_db)
+):
+    """
+    Get a page of replies to a topic, oldest first.
+    Pass the returned next_cursor to fetch the following page.
+    """
+    query = REPLY_LIST.where(DiscussionReply.topic_id == topic_id)
+    
+    if cursor:
+        after_date, after_id = decode_reply_cursor(cursor)
+        query = query.where(or_(
+            DiscussionReply.created_date > after_date,
+            and_(DiscussionReply.created_date == after_date, DiscussionReply.id > after_id)
+        ))
+    
+    replies = db.execute(query.order_by(
+        DiscussionReply.created_date, DiscussionReply.id
+    ).limit(limit + 1)).all()
+    
+    if not replies and not cursor:
+        topic_exists = db.query(DiscussionTopic.id).filter(DiscussionTopic.id == topic_id).first()
+        if topic_exists is None:
+            raise HTTPException(status_code=404, detail="Discussion topic not found")
+    
+    next_cursor = None
+    if len(replies) > limit:
+        replies = replies[:limit]
+        next_cursor = encode_reply_cursor(replies[-1])
+    
+    return {"replies": replies, "next_cursor": next_cursor}
+
 @router.post("/discussions/{topic_id}/replies", response_model=Reply)
 def add_reply(topic_id: uuid.UUID, reply: ReplyCreate, db: Session = Depends(get_db)):
     """
@@ -67,6 +126,11 @@ def add_reply(topic_id: uuid.UUID, reply: ReplyCreate, db: Session = Depends(get
         created_date=datetime.utcnow()
     )
     db.add(db_reply)
+    
+    # Keep the denormalized counters in step, in the same transaction
+    topic.reply_count = DiscussionTopic.reply_count + 1
+    topic.last_reply_at = db_reply.created_date
+    
     db.commit()
     db.refresh(db_reply)
     return db_reply
@@ -77,6 +141,7 @@ def delete_discussion(topic_id: uuid.UUID, db: Session = Depends(get_db)):
     Delete a discussion topic and all its replies
     """
     # Delete all replies first
+    record_changes_from(db, "discussion_replies", select(DiscussionReply.id).where(DiscussionReply.topic_id == topic_id), "delete")
     db.query(DiscussionReply).filter(DiscussionReply.topic_id == topic_id).delete()
     
     # Delete the topic
@@ -103,6 +168,15 @@ def delete_reply(topic_id: uuid.UUID, reply_id: uuid.UUID, db: Session = Depends
         raise HTTPException(status_code=404, detail="Reply not found")
     
     db.delete(reply)
+    db.flush()
+    
+    # Recompute the topic's counters from the remaining replies
+    remaining = db.query(DiscussionReply).filter(DiscussionReply.topic_id == topic_id)
+    db.query(DiscussionTopic).filter(DiscussionTopic.id == topic_id).update({
+        DiscussionTopic.reply_count: remaining.with_entities(func.count(DiscussionReply.id)).scalar_subquery(),
+        DiscussionTopic.last_reply_at: remaining.with_entities(func.max(DiscussionReply.created_date)).scalar_subquery()
+    }, synchronize_session=False)
+    record_changes(db, "discussion_topics", [topic_id])
     db.commit()
     
     return {"message": "Reply deleted successfully"}
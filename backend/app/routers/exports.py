@@ -0,0 +1,24 @@
+# File: backend/app/routers/exports.py
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from ..services.export import DATASETS, FORMATS, export_stream, export_filename
+
+router = APIRouter()
+
+@router.get("/export/{dataset}")
+def export_dataset(dataset: str, format: str = "ndjson", gzip: bool = False):
+    """
+    Stream a whole dataset as NDJSON or CSV, optionally gzip-compressed
+    """
+    if dataset not in DATASETS:
+        raise HTTPException(status_code=404, detail="Dataset not found")
+    if format not in FORMATS:
+        raise HTTPException(status_code=400, detail="Format must be ndjson or csv")
+
+    media_type = "application/gzip" if gzip else FORMATS[format]
+    filename = export_filename(dataset, format, gzip)
+    return StreamingResponse(
+        export_stream(dataset, format, compress=gzip),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
@@ -0,0 +1,50 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
+from typing import Optional
+import mimetypes
+from ..database import get_read_db
+from ..services import images
+
+router = APIRouter()
+
+# Derivatives are keyed by content hash, originals may be replaced in place
+DERIVATIVE_CACHE_CONTROL = "public, max-age=604800"
+ORIGINAL_CACHE_CONTROL = "public, max-age=300"
+
+@router.get("/images/{name:path}")
+def get_image(
+    name: str,
+    request: Request,
+    w: Optional[int] = Query(None, ge=1, le=4096, description="Display width in pixels"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Serve a chart or proposal image at the requested width, as WebP when the client accepts it.
+    
+    Parameters:
+    - name: Path of the image, e.g. 'proposals/<id>.png' or a file in static/images
+    - w: Width the image is displayed at; the smallest derivative at least this wide is chosen
+    
+    Returns:
+    - The derivative, or the original file until derivatives exist
+    """
+    path = images.resolve_source(name)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Image not found")
+    
+    if images.available():
+        variant = images.choose_variant(path, w, request.headers.get("accept"))
+        if variant is not None:
+            file_path, media_type = variant
+            return FileResponse(
+                path=str(file_path),
+                media_type=media_type,
+                headers={"Cache-Control": DERIVATIVE_CACHE_CONTROL, "Vary": "Accept"}
+            )
+    
+    return FileResponse(
+        path=str(path),
+        media_type=mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+        headers={"Cache-Control": ORIGINAL_CACHE_CONTROL, "Vary": "Accept"}
+    )
@@ -0,0 +1,50 @@
+# File: backend/app/routers/inventories.py
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from ..database import get_read_db
+from ..services.inventory import get_inventories
+
+router = APIRouter()
+
+MAX_COMPARED_LANGUAGES = 100
+
+@router.get("/inventories/compare")
+def compare_inventories(
+    languages: str = Query(..., description="Comma-separated language codes"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Compare the phoneme inventories of two or more languages: shared symbols, union size,
+    symbols unique to each language and pairwise Jaccard similarity
+    """
+    codes = list(dict.fromkeys(code.strip() for code in languages.split(",") if code.strip()))
+    if len(codes) < 2:
+        raise HTTPException(status_code=400, detail="Provide at least two language codes")
+    if len(codes) > MAX_COMPARED_LANGUAGES:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_COMPARED_LANGUAGES} languages can be compared")
+    
+    inventories = get_inventories(db)
+    missing = [code for code in codes if code not in inventories.bitmaps]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Language not found: {', '.join(missing)}")
+    
+    return inventories.compare(codes)
+
+@router.get("/inventories/{lang_code}/similar")
+def get_similar_languages(
+    lang_code: str,
+    limit: int = Query(10, ge=1, le=100),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Rank other languages by Jaccard similarity of their phoneme inventories
+    """
+    inventories = get_inventories(db)
+    if lang_code not in inventories.bitmaps:
+        raise HTTPException(status_code=404, detail="Language not found")
+    
+    return {
+        "code": lang_code,
+        "size": len(inventories.decode(inventories.bitmaps[lang_code])),
+        "similar": inventories.similar(lang_code, limit)
+    }
@@ -0,0 +1,37 @@
+# File: backend/app/routers/jobs.py
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from ..database import get_db
+from ..models.job import Job
+from ..services.jobs import queue_stats
+
+router = APIRouter()
+
+@router.get("/jobs/stats")
+def get_job_stats(db: Session = Depends(get_db)):
+    """
+    Get background queue depth by status and the lag of the oldest runnable job
+    """
+    return queue_stats(db)
+
+@router.get("/jobs/failed")
+def get_failed_jobs(limit: int = 20, db: Session = Depends(get_db)):
+    """
+    Get the most recent jobs that exhausted their retries
+    """
+    jobs = db.query(Job).filter(Job.status == "failed").order_by(
+        Job.finished_date.desc()
+    ).limit(limit).all()
+    
+    return [
+        {
+            "id": job.id,
+            "kind": job.kind,
+            "payload": job.payload,
+            "attempts": job.attempts,
+            "last_error": job.last_error,
+            "created_date": job.created_date,
+            "finished_date": job.finished_date
+        }
+        for job in jobs
+    ]
@@ -1,20 +1,17 @@
 # File: backend/app/routers/languages.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from typing import List
-from ..database import get_db
+from ..database import get_read_db
 from ..schemas.language import Language
-from ..models.language import Language as LanguageModel
+from ..services.language_registry import LanguageEntry, get_language_entry, get_registry
 
 router = APIRouter()
 
 @router.get("/languages", response_model=List[Language])
-def get_languages(db: Session = Depends(get_db)):
-    return db.query(LanguageModel).all()
+def get_languages(db: Session = Depends(get_read_db)):
+    return list(get_registry(db).values())
 
 @router.get("/languages/{lang_code}", response_model=Language)
-def get_language(lang_code: str, db: Session = Depends(get_db)):
-    language = db.query(LanguageModel).filter(LanguageModel.code == lang_code).first()
-    if language is None:
-        raise HTTPException(status_code=404, detail="Language not found")
+def get_language(language: LanguageEntry = Depends(get_language_entry)):
     return language
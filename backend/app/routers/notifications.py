@@ -1,25 +1,58 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select, update, delete
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from ..database import get_db
-from ..models.notification import Notification as NotificationModel
-from ..schemas.notification import Notification, NotificationCreate
+from ..database import get_db, get_read_db
+from ..models.notification import Notification as NotificationModel, NotificationDigest as NotificationDigestModel
+from ..schemas.notification import Notification, NotificationCreate, NotificationDigest, NotificationSelection
+from ..schemas.bulk import BulkResult
+from ..services.bulk import check_selection, load_selection, bulk_result
+from ..services.changes import record_changes, record_changes_from
+from ..services.projections import NOTIFICATION_LIST
 import uuid
 from datetime import datetime
 
 router = APIRouter()
 
 @router.get("/notifications", response_model=List[Notification])
-def get_notifications(is_read: Optional[bool] = None, db: Session = Depends(get_db)):
+def get_notifications(
+    is_read: Optional[bool] = None,
+    skip: int = 0,
+    limit: Optional[int] = None,
+    db: Session = Depends(get_read_db)
+):
     """
-    Get all notifications with optional filter for read/unread
+    Get notifications, newest first, with optional filter for read/unread and pagination
     """
-    query = db.query(NotificationModel)
+    query = NOTIFICATION_LIST
     
     if is_read is not None:
-        query = query.filter(NotificationModel.is_read == is_read)
+        query = query.where(NotificationModel.is_read == is_read)
     
-    return query.order_by(NotificationModel.created_date.desc()).all()
+    query = query.offset(skip)
+    if limit is not None:
+        query = query.limit(limit)
+    
+    return db.execute(query).all()
+
+@router.get("/notifications/digests", response_model=List[NotificationDigest])
+def get_notification_digests(
+    related_entity_type: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 50,
+    db: Session = Depends(get_read_db)
+):
+    """
+    Get roll-ups of old read notifications, most recently active first
+    """
+    query = db.query(NotificationDigestModel)
+    
+    if related_entity_type:
+        query = query.filter(NotificationDigestModel.related_entity_type == related_entity_type)
+    
+    return query.order_by(
+        NotificationDigestModel.last_created_date.desc()
+    ).offset(skip).limit(limit).all()
 
 @router.post("/notifications", response_model=Notification)
 def create_notification(notification: NotificationCreate, db: Session = Depends(get_db)):
@@ -59,6 +92,7 @@ def mark_all_notifications_read(db: Session = Depends(get_db)):
     """
     Mark all notifications as read
     """
+    record_changes_from(db, "notifications", select(NotificationModel.id).where(NotificationModel.is_read == False))
     db.query(NotificationModel).filter(NotificationModel.is_read == False).update(
         {"is_read": True}, synchronize_session=False
     )
@@ -79,3 +113,63 @@ def delete_notification(notification_id: uuid.UUID, db: Session = Depends(get_db
     db.commit()
     
     return {"message": "Notification deleted successfully"}
+
+def filter_conditions(notification_filter):
+    conditions = []
+    if notification_filter.is_read is not None:
+        conditions.append(NotificationModel.is_read == notification_filter.is_read)
+    if notification_filter.related_entity_type:
+        conditions.append(NotificationModel.related_entity_type == notification_filter.related_entity_type)
+    if notification_filter.related_entity_id:
+        conditions.append(NotificationModel.related_entity_id == notification_filter.related_entity_id)
+    if notification_filter.created_before:
+        conditions.append(NotificationModel.created_date < notification_filter.created_before)
+    return conditions
+
+@router.post("/notifications/bulk/read", response_model=BulkResult)
+def bulk_mark_notifications_read(selection: NotificationSelection, db: Session = Depends(get_db)):
+    """
+    Mark many notifications as read, selected by ids or by filter
+    """
+    check_selection(selection)
+    
+    # A repeated filter request moves on to notifications that are still unread
+    conditions = filter_conditions(selection.filter) + [NotificationModel.is_read == False] if selection.filter else []
+    rows, ids, has_more = load_selection(
+        db, NotificationModel.id, [NotificationModel.is_read], selection, conditions, NotificationModel.created_date
+    )
+    outcomes = {row.id: "unchanged" if row.is_read else "updated" for row in rows}
+    changed = [notification_id for notification_id, outcome in outcomes.items() if outcome == "updated"]
+    
+    if changed:
+        db.execute(
+            update(NotificationModel).where(NotificationModel.id.in_(changed)).values(is_read=True),
+            execution_options={"synchronize_session": False}
+        )
+        record_changes(db, "notifications", changed)
+        db.commit()
+    
+    return bulk_result(ids, outcomes, has_more)
+
+@router.post("/notifications/bulk/delete", response_model=BulkResult)
+def bulk_delete_notifications(selection: NotificationSelection, db: Session = Depends(get_db)):
+    """
+    Delete many notifications, selected by ids or by filter
+    """
+    check_selection(selection)
+    
+    conditions = filter_conditions(selection.filter) if selection.filter else []
+    rows, ids, has_more = load_selection(
+        db, NotificationModel.id, [], selection, conditions, NotificationModel.created_date
+    )
+    outcomes = {row.id: "deleted" for row in rows}
+    
+    if rows:
+        db.execute(
+            delete(NotificationModel).where(NotificationModel.id.in_(list(outcomes))),
+            execution_options={"synchronize_session": False}
+        )
+        record_changes(db, "notifications", list(outcomes), "delete")
+        db.commit()
+    
+    return bulk_result(ids, outcomes, has_more)
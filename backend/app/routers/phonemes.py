@@ -1,49 +1,58 @@
 # File: backend/app/routers/phonemes.py
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
-from ..database import get_db
+from ..database import get_read_db, ReadSessionLocal
 from ..schemas.phoneme import Phoneme, PhonemeGrid
-from ..models.language import Language
 from ..models.phoneme import Phoneme as PhonemeModel, PhonemeType
+from ..services.grid import get_language_grids
+from ..services.language_registry import LanguageEntry, get_language_entry
+from ..services.invalidation import generation
+from ..services.singleflight import single_flight
 
 router = APIRouter()
 
 # Existing routes...
 
+# Tables the phoneme lists are built from
+PHONEME_TABLES = ("phonemes", "allophones")
+
+def load_phonemes(language_id, condition):
+    """Phonemes of a language with their allophones, loaded in a session of their own."""
+    db = ReadSessionLocal()
+    try:
+        return db.query(PhonemeModel).options(
+            joinedload(PhonemeModel.allophones)
+        ).filter(
+            PhonemeModel.language_id == language_id,
+            condition
+        ).all()
+    finally:
+        db.close()
+
 @router.get("/languages/{lang_code}/extended-phonemes", response_model=List[Phoneme])
-def get_extended_phonemes(
-    lang_code: str, 
-    db: Session = Depends(get_db)
-):
+async def get_extended_phonemes(language: LanguageEntry = Depends(get_language_entry)):
     """Get all extended IPA phonemes for a specific language."""
-    language = db.query(Language).filter(Language.code == lang_code).first()
-    if language is None:
-        raise HTTPException(status_code=404, detail="Language not found")
-    
-    phonemes = db.query(PhonemeModel).filter(
-        PhonemeModel.language_id == language.id,
-        PhonemeModel.is_extended == True
-    ).all()
-    
-    return phonemes
+    # Identical concurrent requests share one query
+    key = ("extended-phonemes", language.id, generation(*PHONEME_TABLES))
+    return await single_flight.run(key, load_phonemes, language.id, PhonemeModel.is_extended == True)
 
 @router.get("/languages/{lang_code}/impossible-phonemes", response_model=List[Phoneme])
-def get_impossible_phonemes(
-    lang_code: str, 
-    db: Session = Depends(get_db)
-):
+async def get_impossible_phonemes(language: LanguageEntry = Depends(get_language_entry)):
     """Get all impossible phonemes for a specific language."""
-    language = db.query(Language).filter(Language.code == lang_code).first()
-    if language is None:
-        raise HTTPException(status_code=404, detail="Language not found")
-    
-    phonemes = db.query(PhonemeModel).filter(
-        PhonemeModel.language_id == language.id,
-        PhonemeModel.impossibility_reason.isnot(None)
-    ).all()
+    key = ("impossible-phonemes", language.id, generation(*PHONEME_TABLES))
+    return await single_flight.run(key, load_phonemes, language.id, PhonemeModel.impossibility_reason.isnot(None))
+
+@router.get("/languages/{lang_code}/grid", response_model=PhonemeGrid)
+def get_phoneme_grid(
+    language: LanguageEntry = Depends(get_language_entry),
+    db: Session = Depends(get_read_db)
+):
+    """Get the consonant, vowel and impossible-consonant charts of a language, cell by cell."""
+    grids = get_language_grids(db, language)
     
-    return phonemes
+    # Encoded once per data version and served as-is
+    return Response(content=grids.to_json(), media_type="application/json")
 
 @router.get("/phonemes/categories")
 def get_phoneme_categories():
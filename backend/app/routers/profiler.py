@@ -0,0 +1,54 @@
+# File: backend/app/routers/profiler.py
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import PlainTextResponse
+from typing import Optional
+import hmac
+from ..services import sampling_profiler
+
+def require_profile_token(x_profile: Optional[str] = Header(None)):
+    """Profiles name internal code paths and request paths, so they always need the token."""
+    token = sampling_profiler.PROFILE_TOKEN
+    if not token or not hmac.compare_digest((x_profile or "").encode(), token.encode()):
+        raise HTTPException(status_code=403, detail="X-Profile token required")
+
+router = APIRouter(dependencies=[Depends(require_profile_token)])
+
+@router.get("/debug/profiles")
+def get_profiles(order: str = "slowest", route: Optional[str] = None, limit: int = 20):
+    """
+    List kept request profiles, slowest or most recent first
+    """
+    if order not in ("slowest", "recent"):
+        raise HTTPException(status_code=400, detail="Order must be slowest or recent")
+    return {
+        "sample_rate": sampling_profiler.SAMPLE_RATE,
+        "interval_ms": sampling_profiler.INTERVAL * 1000,
+        "profiles": [profile.summary() for profile in sampling_profiler.profiles(order, route, limit)]
+    }
+
+@router.get("/debug/profiles/folded", response_class=PlainTextResponse)
+def get_merged_folded(route: Optional[str] = None, order: str = "slowest", limit: int = 20):
+    """
+    Folded stacks of the kept profiles added together, for flamegraph.pl or speedscope
+    """
+    return sampling_profiler.merged_folded(sampling_profiler.profiles(order, route, limit))
+
+@router.get("/debug/profiles/{profile_id}")
+def get_profile(profile_id: str):
+    """
+    Get one profile by its X-Profile-Id header, with its hottest frames
+    """
+    profile = sampling_profiler.get_profile(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return {**profile.summary(), "hotspots": profile.hotspots()}
+
+@router.get("/debug/profiles/{profile_id}/folded", response_class=PlainTextResponse)
+def get_profile_folded(profile_id: str):
+    """
+    Get one profile's samples as folded stacks ("outer;inner;leaf count" per line)
+    """
+    profile = sampling_profiler.get_profile(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return profile.folded()
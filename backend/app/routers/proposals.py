@@ -1,9 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Form
+from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Form, Query
+from sqlalchemy import update, delete
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from ..database import get_db
-from ..schemas.proposal import Proposal, ProposalCreate
+from ..database import get_db, get_read_db
+from ..schemas.proposal import Proposal, ProposalCreate, ProposalCreated, ProposalSelection, ProposalBulkStatus, DuplicateCandidate
+from ..schemas.bulk import BulkResult
 from ..models.proposal import Proposal as ProposalModel
+from ..services.metrics import record_upload
+from ..services.jobs import enqueue
+from ..services.images import queue_derivatives
+from ..services.audio_catalog import queue_catalog_update
+from ..services.leaderboard import leaderboards, snapshot, MAX_LIMIT
+from ..services.duplicates import duplicates, MAX_LIMIT as MAX_DUPLICATES
+from ..services.bulk import check_selection, load_selection, bulk_result
+from ..services.changes import record_changes
+from ..services.projections import PROPOSAL_LIST
+from starlette.concurrency import run_in_threadpool
 import uuid
 from datetime import datetime
 import os
@@ -11,27 +23,81 @@ import shutil
 
 router = APIRouter()
 
+STATUSES = ["pending", "approved", "rejected"]
+
+def save_upload(upload, directory, name, kind):
+    """Stream an uploaded file to `directory/name` and return the stored path."""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, name)
+    
+    with open(path, "wb") as buffer:
+        shutil.copyfileobj(upload.file, buffer)
+        record_upload(kind, buffer.tell())
+    
+    return path
+
 @router.get("/proposals", response_model=List[Proposal])
 def get_proposals(
     status: Optional[str] = None, 
     category: Optional[str] = None,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Get all proposals with optional filters for status and category
     """
-    query = db.query(ProposalModel)
+    query = PROPOSAL_LIST
     
     if status:
-        query = query.filter(ProposalModel.status == status)
+        query = query.where(ProposalModel.status == status)
     
     if category:
-        query = query.filter(ProposalModel.category == category)
+        query = query.where(ProposalModel.category == category)
     
-    return query.order_by(ProposalModel.submitted_date.desc()).all()
+    return db.execute(query).all()
+
+@router.get("/proposals/top", response_model=List[Proposal])
+def get_top_proposals(
+    status: Optional[str] = None,
+    category: Optional[str] = None,
+    limit: int = Query(10, ge=1, le=MAX_LIMIT),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Get the highest-voted proposals, optionally filtered by status and category
+    """
+    return leaderboards.top(db, status, category, limit)
+
+@router.get("/proposals/duplicates", response_model=List[DuplicateCandidate])
+def find_duplicates(
+    symbol: str,
+    sound_name: Optional[str] = None,
+    category: Optional[str] = None,
+    limit: int = Query(10, ge=1, le=MAX_DUPLICATES),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Get existing proposals and chart phonemes resembling a symbol and sound name, most similar first
+    """
+    return duplicates.find(db, symbol, sound_name, category, limit)
+
+@router.get("/proposals/{proposal_id}/duplicates", response_model=List[DuplicateCandidate])
+def get_proposal_duplicates(
+    proposal_id: uuid.UUID,
+    limit: int = Query(10, ge=1, le=MAX_DUPLICATES),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Get existing proposals and chart phonemes resembling a proposal, most similar first
+    """
+    proposal = db.query(ProposalModel).filter(ProposalModel.id == proposal_id).first()
+    if proposal is None:
+        raise HTTPException(status_code=404, detail="Proposal not found")
+    return duplicates.find(
+        db, proposal.symbol, proposal.sound_name, proposal.category, limit, exclude=("proposal", proposal.id)
+    )
 
 @router.get("/proposals/{proposal_id}", response_model=Proposal)
-def get_proposal(proposal_id: uuid.UUID, db: Session = Depends(get_db)):
+def get_proposal(proposal_id: uuid.UUID, db: Session = Depends(get_read_db)):
     """
     Get a specific proposal by ID
     """
@@ -40,7 +106,7 @@ def get_proposal(proposal_id: uuid.UUID, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Proposal not found")
     return proposal
 
-@router.post("/proposals", response_model=Proposal)
+@router.post("/proposals", response_model=ProposalCreated)
 async def create_proposal(
     symbol: str = Form(...),
     sound_name: str = Form(...),
@@ -52,7 +118,8 @@ async def create_proposal(
     db: Session = Depends(get_db)
 ):
     """
-    Create a new proposal with optional file uploads
+    Create a new proposal with optional file uploads.
+    The response lists likely duplicates among existing proposals and phonemes.
     """
     # Create base proposal
     proposal = ProposalModel(
@@ -67,39 +134,35 @@ async def create_proposal(
         votes=0
     )
     
-    # Handle audio file upload if provided
+    # Store uploads off the event loop; they must be on disk before the row commits
     if audio_file and audio_file.filename:
-        audio_dir = os.path.join("audio", "proposals")
-        os.makedirs(audio_dir, exist_ok=True)
-        
         file_extension = os.path.splitext(audio_file.filename)[1]
         audio_filename = f"{proposal.id}{file_extension}"
-        audio_path = os.path.join(audio_dir, audio_filename)
-        
-        with open(audio_path, "wb") as buffer:
-            shutil.copyfileobj(audio_file.file, buffer)
-        
+        await run_in_threadpool(save_upload, audio_file, os.path.join("audio", "proposals"), audio_filename, "audio")
         proposal.audio_file = f"proposals/{audio_filename}"
+        # Codec, duration and hash are recorded by a background job
+        queue_catalog_update(db, proposal.audio_file)
     
-    # Handle image file upload if provided
     if image_file and image_file.filename:
-        image_dir = os.path.join("images", "proposals")
-        os.makedirs(image_dir, exist_ok=True)
-        
         file_extension = os.path.splitext(image_file.filename)[1]
         image_filename = f"{proposal.id}{file_extension}"
-        image_path = os.path.join(image_dir, image_filename)
-        
-        with open(image_path, "wb") as buffer:
-            shutil.copyfileobj(image_file.file, buffer)
-        
+        await run_in_threadpool(save_upload, image_file, os.path.join("images", "proposals"), image_filename, "image")
         proposal.image_file = f"proposals/{image_filename}"
+        # Thumbnails and WebP versions are generated by a background job
+        queue_derivatives(db, proposal.image_file)
     
     # Save proposal to database
     db.add(proposal)
+    token = duplicates.token()
     db.commit()
     db.refresh(proposal)
-    return proposal
+    duplicates.record(token, added=[proposal])
+    
+    # May rebuild the index, so off the event loop
+    similar = await run_in_threadpool(
+        duplicates.find, db, symbol, sound_name, category, exclude=("proposal", proposal.id)
+    )
+    return {**snapshot(proposal), "duplicates": similar}
 
 @router.put("/proposals/{proposal_id}/vote", response_model=Proposal)
 def vote_proposal(
@@ -118,8 +181,12 @@ def vote_proposal(
         raise HTTPException(status_code=404, detail="Proposal not found")
     
     proposal.votes += vote
+    token = leaderboards.token()
+    duplicates_token = duplicates.token()
     db.commit()
     db.refresh(proposal)
+    leaderboards.record(proposal, token)
+    duplicates.record(duplicates_token)
     return proposal
 
 @router.put("/proposals/{proposal_id}/status", response_model=Proposal)
@@ -131,16 +198,24 @@ def update_proposal_status(
     """
     Update the status of a proposal (admin only)
     """
-    if status not in ["pending", "approved", "rejected"]:
+    if status not in STATUSES:
         raise HTTPException(status_code=400, detail="Status must be pending, approved, or rejected")
     
     proposal = db.query(ProposalModel).filter(ProposalModel.id == proposal_id).first()
     if proposal is None:
         raise HTTPException(status_code=404, detail="Proposal not found")
     
+    if proposal.status == status:
+        return proposal
+    
     proposal.status = status
+    enqueue(db, "proposal_status_notification", {"proposal_id": str(proposal.id), "status": status})
+    token = leaderboards.token()
+    duplicates_token = duplicates.token()
     db.commit()
     db.refresh(proposal)
+    leaderboards.record(proposal, token)
+    duplicates.record(duplicates_token, added=[proposal], removed=[proposal.id])
     return proposal
 
 @router.delete("/proposals/{proposal_id}")
@@ -152,18 +227,88 @@ def delete_proposal(proposal_id: uuid.UUID, db: Session = Depends(get_db)):
     if proposal is None:
         raise HTTPException(status_code=404, detail="Proposal not found")
     
-    # Remove associated files if they exist
+    # Remove associated files in the background once the delete has committed
+    paths = []
     if proposal.audio_file:
-        audio_path = os.path.join("audio", proposal.audio_file)
-        if os.path.exists(audio_path):
-            os.remove(audio_path)
-    
+        paths.append(os.path.join("audio", proposal.audio_file))
     if proposal.image_file:
-        image_path = os.path.join("images", proposal.image_file)
-        if os.path.exists(image_path):
-            os.remove(image_path)
+        paths.append(os.path.join("images", proposal.image_file))
+    if paths:
+        enqueue(db, "delete_files", {"paths": paths})
     
     db.delete(proposal)
+    token = duplicates.token()
     db.commit()
+    duplicates.record(token, removed=[proposal_id])
     
     return {"message": "Proposal deleted successfully"}
+
+def filter_conditions(proposal_filter):
+    conditions = []
+    if proposal_filter.status:
+        conditions.append(ProposalModel.status == proposal_filter.status)
+    if proposal_filter.category:
+        conditions.append(ProposalModel.category == proposal_filter.category)
+    return conditions
+
+@router.post("/proposals/bulk/status", response_model=BulkResult)
+def bulk_update_proposal_status(change: ProposalBulkStatus, db: Session = Depends(get_db)):
+    """
+    Update the status of many proposals, selected by ids or by filter (admin only)
+    """
+    if change.status not in STATUSES:
+        raise HTTPException(status_code=400, detail="Status must be pending, approved, or rejected")
+    check_selection(change)
+    
+    # A repeated filter request moves on to proposals that still need the change
+    conditions = filter_conditions(change.filter) + [ProposalModel.status != change.status] if change.filter else []
+    rows, ids, has_more = load_selection(
+        db, ProposalModel.id, [ProposalModel.status], change, conditions, ProposalModel.submitted_date
+    )
+    outcomes = {row.id: "unchanged" if row.status == change.status else "updated" for row in rows}
+    changed = [proposal_id for proposal_id, outcome in outcomes.items() if outcome == "updated"]
+    
+    if changed:
+        db.execute(
+            update(ProposalModel).where(ProposalModel.id.in_(changed)).values(status=change.status),
+            execution_options={"synchronize_session": False}
+        )
+        record_changes(db, "proposals", changed)
+        enqueue(db, "proposal_status_notifications", {
+            "proposal_ids": [str(proposal_id) for proposal_id in changed], "status": change.status
+        })
+        db.commit()
+    
+    return bulk_result(ids, outcomes, has_more)
+
+@router.post("/proposals/bulk/delete", response_model=BulkResult)
+def bulk_delete_proposals(selection: ProposalSelection, db: Session = Depends(get_db)):
+    """
+    Delete many proposals, selected by ids or by filter
+    """
+    check_selection(selection)
+    
+    conditions = filter_conditions(selection.filter) if selection.filter else []
+    rows, ids, has_more = load_selection(
+        db, ProposalModel.id, [ProposalModel.audio_file, ProposalModel.image_file], selection,
+        conditions, ProposalModel.submitted_date
+    )
+    outcomes = {row.id: "deleted" for row in rows}
+    
+    if rows:
+        # Remove associated files in the background once the delete has committed
+        paths = [os.path.join("audio", row.audio_file) for row in rows if row.audio_file]
+        paths += [os.path.join("images", row.image_file) for row in rows if row.image_file]
+        if paths:
+            enqueue(db, "delete_files", {"paths": paths})
+        
+        db.execute(
+            delete(ProposalModel).where(ProposalModel.id.in_(list(outcomes))),
+            execution_options={"synchronize_session": False}
+        )
+        record_changes(db, "proposals", list(outcomes), "delete")
+        token = duplicates.token()
+        db.commit()
+        duplicates.record(token, removed=list(outcomes))
+    
+    return bulk_result(ids, outcomes, has_more)
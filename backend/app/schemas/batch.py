@@ -0,0 +1,21 @@
+# File: backend/app/schemas/batch.py
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+
+class BatchItem(BaseModel):
+    path: str
+    id: Optional[str] = None
+
+class BatchRequest(BaseModel):
+    requests: List[BatchItem] = Field(..., min_length=1)
+    parallel: bool = False
+
+class BatchItemResult(BaseModel):
+    id: Optional[str] = None
+    path: str
+    status: int
+    headers: Dict[str, str] = {}
+    body: Any = None
+
+class BatchResponse(BaseModel):
+    responses: List[BatchItemResult]
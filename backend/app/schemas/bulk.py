@@ -0,0 +1,18 @@
+# File: backend/app/schemas/bulk.py
+from pydantic import BaseModel
+from typing import List
+from uuid import UUID
+
+# Rows one bulk request may select, by ids or by filter
+MAX_BULK_ITEMS = 500
+
+class BulkItemResult(BaseModel):
+    id: UUID
+    result: str  # "updated", "unchanged", "deleted" or "not_found"
+
+class BulkResult(BaseModel):
+    matched: int
+    changed: int
+    # A filter matched more rows than one request handles; repeat it for the rest
+    has_more: bool = False
+    results: List[BulkItemResult]
@@ -0,0 +1,17 @@
+# File: backend/app/schemas/change.py
+from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+class ChangeEntry(BaseModel):
+    version: int
+    type: str
+    id: UUID
+    op: str  # "upsert" or "delete"
+    data: Optional[Dict[str, Any]] = None
+
+class ChangeFeed(BaseModel):
+    # Pass as `since` on the next call
+    version: int
+    has_more: bool = False
+    changes: List[ChangeEntry] = []
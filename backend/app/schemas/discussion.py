@@ -28,10 +28,27 @@ class TopicBase(BaseModel):
 class TopicCreate(TopicBase):
     pass
 
+class ReplyPage(BaseModel):
+    replies: List[Reply]
+    next_cursor: Optional[str] = None
+
 class Topic(TopicBase):
     id: UUID
     created_date: datetime
+    reply_count: int = 0
+    last_reply_at: Optional[datetime] = None
     replies: List[Reply] = []
     
     class Config:
         orm_mode = True
+
+class TopicSummary(BaseModel):
+    id: UUID
+    title: str
+    author_name: Optional[str] = None
+    created_date: datetime
+    reply_count: int = 0
+    last_reply_at: Optional[datetime] = None
+    
+    class Config:
+        orm_mode = True
@@ -1,6 +1,6 @@
 # File: backend/app/schemas/notification.py
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 
@@ -21,3 +21,27 @@ class Notification(NotificationBase):
     class Config:
         orm_mode = True
 
+
+class NotificationDigest(BaseModel):
+    id: UUID
+    related_entity_type: Optional[str] = None
+    related_entity_id: Optional[UUID] = None
+    notification_count: int
+    latest_title: Optional[str] = None
+    first_created_date: Optional[datetime] = None
+    last_created_date: Optional[datetime] = None
+    
+    class Config:
+        orm_mode = True
+
+
+class NotificationFilter(BaseModel):
+    is_read: Optional[bool] = None
+    related_entity_type: Optional[str] = None
+    related_entity_id: Optional[UUID] = None
+    created_before: Optional[datetime] = None
+
+class NotificationSelection(BaseModel):
+    """Notifications to act on: explicit ids or a filter, not both."""
+    ids: Optional[List[UUID]] = Field(None, min_length=1)
+    filter: Optional[NotificationFilter] = None
@@ -50,7 +50,20 @@ class Phoneme(PhonemeBase):
     class Config:
         orm_mode = True
 
+class GridCell(BaseModel):
+    id: UUID
+    symbol: str
+    description: Optional[str] = None
+    audio_file: Optional[str] = None
+    impossibility_reason: Optional[str] = None
+
+class GridSection(BaseModel):
+    rows: List[str]
+    columns: int
+    cells: List[List[Optional[GridCell]]]
+
 class PhonemeGrid(BaseModel):
-    consonants: List[List[Optional[Phoneme]]]
-    vowels: List[List[Optional[Phoneme]]]
-    impossible: Optional[List[Phoneme]] = []
+    language: str
+    consonants: GridSection
+    vowels: GridSection
+    impossible: GridSection
@@ -1,6 +1,6 @@
 # File: backend/app/schemas/proposal.py
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 
@@ -24,3 +24,30 @@ class Proposal(ProposalBase):
     
     class Config:
         orm_mode = True
+
+class DuplicateCandidate(BaseModel):
+    """An existing proposal or chart phoneme resembling a proposal."""
+    type: str
+    id: UUID
+    symbol: Optional[str] = None
+    name: Optional[str] = None
+    category: Optional[str] = None
+    status: Optional[str] = None
+    languages: Optional[int] = None
+    score: float
+
+class ProposalCreated(Proposal):
+    duplicates: List[DuplicateCandidate] = []
+
+
+class ProposalFilter(BaseModel):
+    status: Optional[str] = None
+    category: Optional[str] = None
+
+class ProposalSelection(BaseModel):
+    """Proposals to act on: explicit ids or a filter, not both."""
+    ids: Optional[List[UUID]] = Field(None, min_length=1)
+    filter: Optional[ProposalFilter] = None
+
+class ProposalBulkStatus(ProposalSelection):
+    status: str
@@ -0,0 +1,17 @@
+# backend/app/server.py
+"""
+Gunicorn worker class for production (see gunicorn.conf.py).
+
+Gunicorn supervises the worker processes and handles graceful restarts
+(`kill -HUP <master pid>` replaces workers without dropping requests); each
+worker serves the app with uvicorn on uvloop and httptools.
+"""
+from uvicorn.workers import UvicornWorker
+
+class ProductionWorker(UvicornWorker):
+    CONFIG_KWARGS = {
+        "loop": "uvloop",
+        "http": "httptools",
+        "lifespan": "on",
+        "proxy_headers": True,
+    }
@@ -0,0 +1 @@
+# Services hold business logic shared between routers, scripts and the app itself
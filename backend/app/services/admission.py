@@ -0,0 +1,210 @@
+# backend/app/services/admission.py
+"""
+Admission control and load shedding.
+
+Requests are sorted into three classes before routing:
+
+    upload  multipart requests (proposal files)
+    write   any other POST/PUT/PATCH/DELETE
+    read    everything else, including POST /api/batch
+
+Each class has its own concurrency limit and a bounded queue in every worker
+process. A request waits for a slot in its class for at most
+ADMISSION_QUEUE_TIMEOUT seconds; when the queue is full or the wait times out it
+is answered at once with 503 and Retry-After instead of piling up in the
+threadpool. Writes all contend for SQLite's single write lock, so their limit is
+small. That keeps write spikes from taking the threads that cheap reads need.
+The threadpool is sized at startup to hold every admitted request at once
+(size_threadpool), so requests wait in these queues, where they are counted and
+shed, rather than unseen in anyio's.
+
+Writes can additionally be rate limited per client address with a token bucket
+(ADMISSION_WRITE_RATE per second, bursts of ADMISSION_WRITE_BURST); clients over
+their budget get 429 with Retry-After. The limit is off by default: the client
+address is the peer of the connection, which behind a proxy is the proxy itself
+unless the server trusts its forwarded headers (FORWARDED_ALLOW_IPS for
+gunicorn, --forwarded-allow-ips for uvicorn). Otherwise all users would share
+one bucket.
+"""
+import asyncio
+import json
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import anyio.to_thread
+
+from .metrics import REGISTRY, Counter, Gauge
+
+ADMISSION_ENABLED = os.getenv("ADMISSION_ENABLED", "true").lower() == "true"
+QUEUE_TIMEOUT = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", "5"))
+RETRY_AFTER = int(os.getenv("ADMISSION_RETRY_AFTER", "2"))
+# Per-client writes per second; 0 disables the rate limit
+WRITE_RATE = float(os.getenv("ADMISSION_WRITE_RATE", "0"))
+WRITE_BURST = float(os.getenv("ADMISSION_WRITE_BURST", "20"))
+MAX_CLIENTS = 10000
+
+# (concurrency, queue size) per class
+LIMITS = {
+    "read": (int(os.getenv("ADMISSION_READ_CONCURRENCY", "64")), int(os.getenv("ADMISSION_READ_QUEUE", "256"))),
+    "write": (int(os.getenv("ADMISSION_WRITE_CONCURRENCY", "4")), int(os.getenv("ADMISSION_WRITE_QUEUE", "32"))),
+    "upload": (int(os.getenv("ADMISSION_UPLOAD_CONCURRENCY", "2")), int(os.getenv("ADMISSION_UPLOAD_QUEUE", "8"))),
+}
+# Never limited: scrapes must keep working when the service is overloaded
+EXEMPT_PATHS = ("/metrics",)
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+READ_POSTS = ("/api/batch",)
+
+def size_threadpool():
+    """Give anyio's default threadpool a thread for every request the gates admit at once."""
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    admitted = sum(concurrency for concurrency, _ in LIMITS.values())
+    if limiter.total_tokens < admitted:
+        limiter.total_tokens = admitted
+    return limiter.total_tokens
+
+rejections = REGISTRY.register(Counter(
+    "admission_rejections_total", "Requests rejected by admission control.", ("request_class", "reason")
+))
+
+class Gate:
+    """Concurrency limit with a bounded FIFO wait queue, used from one event loop."""
+
+    def __init__(self, limit, queue_size):
+        self.limit = limit
+        self.queue_size = queue_size
+        self.active = 0
+        self.waiters = []
+
+    async def acquire(self, timeout):
+        """Return True once admitted, False if the queue is full or the wait timed out."""
+        if self.active < self.limit and not self.waiters:
+            self.active += 1
+            return True
+        if len(self.waiters) >= self.queue_size:
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout)
+            return True
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # Admitted just as the timeout fired; hand the slot on
+                self.release()
+            return False
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            if waiter in self.waiters:
+                self.waiters.remove(waiter)
+
+    def release(self):
+        while self.waiters:
+            waiter = self.waiters.pop(0)
+            if not waiter.done():
+                # The slot passes straight to the next waiter
+                waiter.set_result(True)
+                return
+        self.active -= 1
+
+class TokenBuckets:
+    """Per-client token buckets, keeping the most recently seen MAX_CLIENTS clients."""
+
+    def __init__(self, rate, burst, max_clients=MAX_CLIENTS):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self.buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, client, now=None):
+        """Spend one token; return 0 if allowed, else the seconds until one is available."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            tokens, updated = self.buckets.pop(client, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            if tokens >= 1:
+                tokens -= 1
+                wait = 0.0
+            else:
+                wait = (1 - tokens) / self.rate
+            self.buckets[client] = (tokens, now)
+            if len(self.buckets) > self.max_clients:
+                self.buckets.popitem(last=False)
+        return wait
+
+def request_class(scope):
+    method = scope["method"]
+    if method not in WRITE_METHODS or scope["path"] in READ_POSTS:
+        return "read"
+    for name, value in scope["headers"]:
+        if name == b"content-type" and value.startswith(b"multipart/"):
+            return "upload"
+    return "write"
+
+def client_key(scope):
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+class AdmissionMiddleware:
+    """Pure ASGI middleware applying the per-class gates and the write rate limit."""
+
+    def __init__(self, app, limits=None, write_rate=WRITE_RATE, write_burst=WRITE_BURST):
+        self.app = app
+        self.gates = {name: Gate(*limit) for name, limit in (limits or LIMITS).items()}
+        self.buckets = TokenBuckets(write_rate, write_burst) if write_rate > 0 else None
+        REGISTRY.register(Gauge(
+            "admission_in_flight", "Admitted requests being served, by class.", ("request_class",),
+            callback=lambda: [((name,), gate.active) for name, gate in self.gates.items()]
+        ))
+        REGISTRY.register(Gauge(
+            "admission_queued", "Requests waiting for admission, by class.", ("request_class",),
+            callback=lambda: [((name,), len(gate.waiters)) for name, gate in self.gates.items()]
+        ))
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["path"] in EXEMPT_PATHS
+            # Sub-requests of /api/batch run inside the already admitted batch request
+            or (scope.get("state") or {}).get("batch_subrequest")
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        kind = request_class(scope)
+        if kind != "read" and self.buckets is not None:
+            wait = self.buckets.take(client_key(scope))
+            if wait:
+                rejections.inc(kind, "rate_limited")
+                await reject(send, 429, "Too many write requests, slow down", math.ceil(wait))
+                return
+
+        gate = self.gates[kind]
+        if not await gate.acquire(QUEUE_TIMEOUT):
+            rejections.inc(kind, "overloaded")
+            await reject(send, 503, "Server is busy, retry later", RETRY_AFTER)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            gate.release()
+
+async def reject(send, status, detail, retry_after):
+    body = json.dumps({"detail": detail}).encode()
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", str(retry_after).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,67 @@
+# backend/app/services/assets.py
+"""
+Fingerprinted static assets.
+
+scripts/build_assets.py minifies the stylesheets and scripts into static/dist
+under content-hashed names and writes static/dist/manifest.json:
+
+    {"css/style.css": "style.1a2b3c4d.css", "js/app.js": "app.5e6f7a8b.js"}
+
+Templates call asset_url("css/style.css"), which returns /assets/<hashed name>
+when the asset has been built and the plain /css/style.css otherwise, so
+development works without a build step. Hashed files under /assets are served
+with a one-year immutable Cache-Control, since a changed file gets a new name,
+never new content; anything else there (manifest.json) is revalidated.
+"""
+import json
+import os
+import re
+from pathlib import Path
+
+from fastapi.staticfiles import StaticFiles
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+DIST_DIR = BASE_DIR / "static" / "dist"
+MANIFEST_FILE = DIST_DIR / "manifest.json"
+ASSETS_URL = "/assets"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+# Names written by scripts/build_assets.py: <stem>.<8 hex digits of the content hash>.<ext>
+HASHED_NAME = re.compile(r"\.[0-9a-f]{8}\.[a-z0-9]+$")
+
+# (mtime, manifest); reloaded when a build replaces the file
+_manifest = (None, {})
+
+def load_manifest():
+    global _manifest
+    try:
+        mtime = os.stat(MANIFEST_FILE).st_mtime_ns
+    except FileNotFoundError:
+        _manifest = (None, {})
+        return _manifest[1]
+    if mtime != _manifest[0]:
+        with open(MANIFEST_FILE, encoding="utf-8") as manifest:
+            _manifest = (mtime, json.load(manifest))
+    return _manifest[1]
+
+def asset_url(path):
+    """URL of a static asset, fingerprinted when a build exists."""
+    built = load_manifest().get(path)
+    if built is None:
+        return f"/{path}"
+    return f"{ASSETS_URL}/{built}"
+
+class ImmutableStaticFiles(StaticFiles):
+    """StaticFiles for content-hashed files, which can be cached forever, and the manifest."""
+
+    async def check_config(self):
+        # static/dist only exists after a build; until then every lookup is a 404
+        if os.path.isdir(self.directory):
+            await super().check_config()
+
+    def file_response(self, full_path, *args, **kwargs):
+        response = super().file_response(full_path, *args, **kwargs)
+        if response.status_code == 200:
+            hashed = HASHED_NAME.search(os.path.basename(full_path))
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL if hashed else REVALIDATE_CACHE_CONTROL
+        return response
@@ -0,0 +1,328 @@
+# backend/app/services/audio_catalog.py
+"""
+Catalog of the audio files the charts and proposals refer to.
+
+Files are identified from their headers, not their names (most chart samples
+are MP3s named *.ogg.mp3 or *.wav.mp3, and one is an Ogg Vorbis file), and
+stored in the audio_files table under the reference the data uses:
+
+    audio/Voiceless_Bilabial_Nasal.ogg.mp3   static/audio/...
+    proposals/<id>.mp3                       audio/proposals/... (uploads)
+
+with size, modification time, codec, MIME type, duration and SHA-256.
+build_catalog() rescans the directories and re-reads only files whose size or
+mtime changed. Audio routes and the /audio mount take Content-Type from the
+catalog, templates use it for preload hints, and dangling_references() lists
+rows whose audio_file has no file behind it.
+
+Run scripts/build_audio_catalog.py after adding files; the import scripts and
+proposal uploads update it themselves.
+"""
+import hashlib
+import mimetypes
+import os
+import struct
+from datetime import datetime
+from pathlib import Path
+
+from fastapi.responses import FileResponse
+from fastapi.staticfiles import StaticFiles
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import select, delete
+
+from ..database import ReadSessionLocal
+from ..models.allophone import Allophone
+from ..models.audio_file import AudioFile
+from ..models.phoneme import Phoneme
+from ..models.proposal import Proposal
+from .invalidation import GenerationCache
+from .jobs import enqueue, job_handler
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+# Reference prefix -> directory holding the files (uploads: see routers/proposals.py)
+AUDIO_SOURCES = {
+    "audio/": BASE_DIR / "static" / "audio",
+    "proposals/": Path("audio") / "proposals",
+}
+# Files up to this size are small enough to fetch whole with the page
+PRELOAD_AUTO_BYTES = int(os.getenv("AUDIO_PRELOAD_AUTO_BYTES", "65536"))
+HEADER_BYTES = 64 * 1024
+
+class AudioEntry:
+    """A cataloged audio file."""
+    __slots__ = ("path", "size", "codec", "mime_type", "duration", "sha256")
+
+    def __init__(self, path, size, codec, mime_type, duration, sha256):
+        self.path = path
+        self.size = size
+        self.codec = codec
+        self.mime_type = mime_type
+        self.duration = duration
+        self.sha256 = sha256
+
+    @property
+    def preload(self):
+        return "auto" if self.size <= PRELOAD_AUTO_BYTES else "metadata"
+
+# Header sniffing
+
+MP3_BITRATES = {
+    (1, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (1, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (1, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (2, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (2, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (2, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+def mp3_duration(data, size):
+    """Duration of an MPEG audio stream from its first frame (Xing/Info/VBRI or constant bitrate)."""
+    start = 0
+    if data[:3] == b"ID3" and len(data) >= 10:
+        # Syncsafe tag size, plus the 10-byte header (and footer if flagged)
+        start = 10 + ((data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9])
+        if data[5] & 0x10:
+            start += 10
+    position = data.find(b"\xff", start)
+    while 0 <= position < len(data) - 4:
+        b1, b2, b3 = data[position + 1], data[position + 2], data[position + 3]
+        version_bits, layer_bits = (b1 >> 3) & 3, (b1 >> 1) & 3
+        bitrate_index, rate_index = b2 >> 4, (b2 >> 2) & 3
+        if (b1 & 0xE0) == 0xE0 and version_bits != 1 and layer_bits and 0 < bitrate_index < 15 and rate_index < 3:
+            version = 1 if version_bits == 3 else 2
+            layer = 4 - layer_bits
+            sample_rate = MP3_SAMPLE_RATES[version_bits][rate_index]
+            bitrate = MP3_BITRATES[(version, layer)][bitrate_index] * 1000
+            samples = 384 if layer == 1 else (576 if layer == 3 and version == 2 else 1152)
+            mono = (b3 >> 6) == 3
+            side_info = (17 if mono else 32) if version == 1 else (9 if mono else 17)
+
+            xing = position + 4 + side_info
+            if data[xing:xing + 4] in (b"Xing", b"Info") and struct.unpack(">I", data[xing + 4:xing + 8])[0] & 1:
+                frames = struct.unpack(">I", data[xing + 8:xing + 12])[0]
+                return frames * samples / sample_rate
+            vbri = position + 36
+            if data[vbri:vbri + 4] == b"VBRI":
+                frames = struct.unpack(">I", data[vbri + 14:vbri + 18])[0]
+                return frames * samples / sample_rate
+            return (size - position) * 8 / bitrate
+        position = data.find(b"\xff", position + 1)
+    return None
+
+def ogg_info(data, tail):
+    """(codec, duration) of an Ogg stream from its first page and the granule of its last one."""
+    packet = data[27 + data[26]:] if len(data) > 27 else b""
+    if packet[:7] == b"\x01vorbis":
+        codec, rate, pre_skip = "vorbis", struct.unpack("<I", packet[12:16])[0], 0
+    elif packet[:8] == b"OpusHead":
+        codec, rate, pre_skip = "opus", 48000, struct.unpack("<H", packet[10:12])[0]
+    elif packet[:5] == b"\x7fFLAC":
+        codec, rate, pre_skip = "flac", (packet[27] << 12 | packet[28] << 4 | packet[29] >> 4), 0
+    else:
+        return "ogg", None
+    last = tail.rfind(b"OggS")
+    if last < 0 or len(tail) < last + 14 or not rate:
+        return codec, None
+    granule = struct.unpack("<q", tail[last + 6:last + 14])[0]
+    return codec, max(granule - pre_skip, 0) / rate
+
+def wav_duration(data):
+    byte_rate = None
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk, length = data[offset:offset + 4], struct.unpack("<I", data[offset + 4:offset + 8])[0]
+        if chunk == b"fmt ":
+            byte_rate = struct.unpack("<I", data[offset + 16:offset + 20])[0]
+        elif chunk == b"data":
+            return length / byte_rate if byte_rate else None
+        offset += 8 + length + (length & 1)
+    return None
+
+def flac_duration(data):
+    info = data[8:42]
+    if len(info) < 18:
+        return None
+    rate = info[10] << 12 | info[11] << 4 | info[12] >> 4
+    total = (info[13] & 0x0F) << 32 | struct.unpack(">I", info[14:18])[0]
+    return total / rate if rate and total else None
+
+def sniff(path):
+    """Return (codec, mime_type, duration in seconds or None) from a file's headers."""
+    size = os.path.getsize(path)
+    with open(path, "rb") as source:
+        data = source.read(HEADER_BYTES)
+        tail = b""
+        if data[:4] == b"OggS":
+            source.seek(max(size - HEADER_BYTES, 0))
+            tail = source.read()
+
+    if data[:4] == b"OggS":
+        codec, duration = ogg_info(data, tail)
+        return codec, "audio/ogg", duration
+    if data[:4] == b"RIFF" and data[8:12] == b"WAVE":
+        return "pcm", "audio/wav", wav_duration(data)
+    if data[:4] == b"fLaC":
+        return "flac", "audio/flac", flac_duration(data)
+    if data[4:8] == b"ftyp":
+        return "aac", "audio/mp4", None
+    if data[:4] == b"\x1aE\xdf\xa3":
+        return "webm", "audio/webm", None
+    if len(data) > 1 and data[0] == 0xFF and (data[1] & 0xF6) == 0xF0:
+        return "aac", "audio/aac", None
+    duration = mp3_duration(data, size) if data[:3] == b"ID3" or data[:1] == b"\xff" else None
+    if duration is not None:
+        return "mp3", "audio/mpeg", duration
+    return "unknown", mimetypes.guess_type(str(path))[0] or "application/octet-stream", None
+
+def file_sha256(path):
+    sha = hashlib.sha256()
+    with open(path, "rb") as source:
+        for chunk in iter(lambda: source.read(1 << 16), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+# The catalog
+
+def normalize_reference(reference):
+    return reference.lstrip("/") if reference else reference
+
+def resolve_reference(reference):
+    """Map a reference such as "audio/x.mp3" to a file, refusing paths outside the source directories."""
+    reference = normalize_reference(reference)
+    for prefix, root in AUDIO_SOURCES.items():
+        if reference and reference.startswith(prefix):
+            root = root.resolve()
+            path = (root / reference[len(prefix):]).resolve()
+            if path.is_relative_to(root) and path.is_file():
+                return path
+    return None
+
+def scan_files():
+    """Yield (reference, path, stat) for every file in the source directories."""
+    for prefix, root in AUDIO_SOURCES.items():
+        if not root.is_dir():
+            continue
+        for path in sorted(root.rglob("*")):
+            if path.is_file() and not path.name.startswith("."):
+                yield prefix + path.relative_to(root).as_posix(), path, path.stat()
+
+def catalog_row(reference, path, stat):
+    codec, mime_type, duration = sniff(path)
+    return AudioFile(
+        path=reference,
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        codec=codec,
+        mime_type=mime_type,
+        duration=round(duration, 3) if duration is not None else None,
+        sha256=file_sha256(path),
+        checked_date=datetime.utcnow()
+    )
+
+def build_catalog(db):
+    """
+    Bring the catalog in line with the directories (the caller commits).
+    Returns counts of added, updated, unchanged and removed files.
+    """
+    known = {row.path: row for row in db.execute(
+        select(AudioFile.path, AudioFile.size, AudioFile.mtime_ns)
+    )}
+    stats = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0}
+    seen = set()
+    for reference, path, stat in scan_files():
+        seen.add(reference)
+        row = known.get(reference)
+        if row is not None and row.size == stat.st_size and row.mtime_ns == stat.st_mtime_ns:
+            stats["unchanged"] += 1
+            continue
+        db.merge(catalog_row(reference, path, stat))
+        stats["updated" if row is not None else "added"] += 1
+
+    missing = [reference for reference in known if reference not in seen]
+    if missing:
+        db.execute(delete(AudioFile).where(AudioFile.path.in_(missing)))
+        stats["removed"] = len(missing)
+    return stats
+
+def catalog_file(db, reference):
+    """Add or refresh one file, e.g. a new upload (the caller commits). Returns False if it does not exist."""
+    path = resolve_reference(reference)
+    if path is None:
+        return False
+    db.merge(catalog_row(normalize_reference(reference), path, path.stat()))
+    return True
+
+catalog_cache = GenerationCache("audio_files", name="audio_catalog")
+
+def load_catalog(db):
+    return {
+        row.path: AudioEntry(row.path, row.size, row.codec, row.mime_type, row.duration, row.sha256)
+        for row in db.execute(select(
+            AudioFile.path, AudioFile.size, AudioFile.codec, AudioFile.mime_type, AudioFile.duration, AudioFile.sha256
+        ))
+    }
+
+def get_catalog(db=None):
+    """The catalog by reference, reloaded when the audio_files table changes."""
+    def compute():
+        if db is not None:
+            return load_catalog(db)
+        session = ReadSessionLocal()
+        try:
+            return load_catalog(session)
+        finally:
+            session.close()
+    return catalog_cache.get("all", compute)
+
+def audio_info(reference):
+    """Catalog entry for a reference, or None when no such file is known (template global)."""
+    if not reference:
+        return None
+    return get_catalog().get(normalize_reference(reference))
+
+def media_type(reference, path):
+    """Content-Type for a file: from the catalog, or sniffed if it is not cataloged yet."""
+    entry = audio_info(reference)
+    if entry is not None:
+        return entry.mime_type
+    return sniff(path)[1]
+
+def dangling_references(db):
+    """(table, id, reference) for every audio_file value with no cataloged file."""
+    catalog = get_catalog(db)
+    dangling = []
+    for model in (Phoneme, Allophone, Proposal):
+        rows = db.execute(
+            select(model.id, model.audio_file).where(model.audio_file.isnot(None), model.audio_file != "")
+        )
+        for row_id, reference in rows:
+            if normalize_reference(reference) not in catalog:
+                dangling.append((model.__tablename__, row_id, reference))
+    return dangling
+
+def queue_catalog_update(db, reference):
+    enqueue(db, "audio_catalog", {"reference": reference})
+
+@job_handler("audio_catalog")
+def update_catalog(db, payload):
+    """Catalog a newly stored file."""
+    catalog_file(db, payload["reference"])
+
+class CatalogStaticFiles(StaticFiles):
+    """StaticFiles for an audio source directory, with Content-Type from the catalog."""
+
+    def __init__(self, *args, reference_prefix, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reference_prefix = reference_prefix
+
+    async def get_response(self, path, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code == 200 and isinstance(response, FileResponse):
+            # A catalog reload queries the database and an uncataloged file is read; not on the event loop
+            response.headers["content-type"] = await run_in_threadpool(self.content_type, response.path)
+        return response
+
+    def content_type(self, full_path):
+        relative = Path(full_path).resolve().relative_to(Path(self.directory).resolve()).as_posix()
+        return media_type(self.reference_prefix + relative, full_path)
@@ -0,0 +1,51 @@
+# backend/app/services/bulk.py
+"""
+Helpers for bulk mutation endpoints.
+
+A bulk request selects rows by explicit ids or by a filter. The selection is
+read with one SELECT of the columns the operation needs, the change is applied
+with one set-based UPDATE or DELETE, and the response reports what happened to
+each id. A filter selects at most MAX_BULK_ITEMS rows per request, oldest
+first; the response sets has_more when the caller should repeat it.
+"""
+from fastapi import HTTPException
+from sqlalchemy import select
+
+from ..schemas.bulk import MAX_BULK_ITEMS, BulkItemResult, BulkResult
+
+def check_selection(selection):
+    if (selection.ids is None) == (selection.filter is None):
+        raise HTTPException(status_code=400, detail="Give either a list of ids or a filter")
+    if selection.ids is not None and len(selection.ids) > MAX_BULK_ITEMS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_ITEMS} ids can be given at once")
+    if selection.filter is not None and not selection.filter.model_dump(exclude_none=True):
+        raise HTTPException(status_code=400, detail="The filter must set at least one field")
+
+def load_selection(db, id_column, columns, selection, conditions, order_by):
+    """
+    Return (rows, requested ids, has_more). With a filter, `conditions` are the
+    filter's conditions and the requested ids are the rows found.
+    """
+    query = select(id_column, *columns)
+    if selection.ids is not None:
+        # Keep the caller's order, once per id
+        ids = list(dict.fromkeys(selection.ids))
+        rows = db.execute(query.where(id_column.in_(ids))).all()
+        return rows, ids, False
+
+    rows = db.execute(
+        query.where(*conditions).order_by(order_by, id_column).limit(MAX_BULK_ITEMS + 1)
+    ).all()
+    has_more = len(rows) > MAX_BULK_ITEMS
+    rows = rows[:MAX_BULK_ITEMS]
+    return rows, [row[0] for row in rows], has_more
+
+def bulk_result(ids, outcomes, has_more=False):
+    """Per-id results; ids without an outcome were not found."""
+    results = [BulkItemResult(id=row_id, result=outcomes.get(row_id, "not_found")) for row_id in ids]
+    return BulkResult(
+        matched=len(outcomes),
+        changed=sum(1 for outcome in outcomes.values() if outcome != "unchanged"),
+        has_more=has_more,
+        results=results
+    )
@@ -0,0 +1,155 @@
+# backend/app/services/changes.py
+"""
+Change log behind the incremental sync feed (GET /api/changes).
+
+Every write to a synced table adds a row to the changes table in the same
+transaction: an "upsert" when a row is inserted or updated, a "delete"
+tombstone when it is removed. Writes through the ORM unit of work are recorded
+by a session listener; set-based UPDATE/DELETE statements do not say which rows
+they touched, so code issuing them calls record_changes() with the ids, or
+record_changes_from() with a query selecting them. Notification retention
+removes old rows without tombstones.
+
+Clients keep the highest version they have seen and ask for what happened
+after it, which is one range scan of the primary key. Versions come from an
+AUTOINCREMENT key, and SQLite commits one writer at a time, so a version never
+becomes visible after a higher one.
+
+The log is pruned after CHANGELOG_TTL_DAYS; a client whose version is older
+than the oldest remaining change is told to reload everything.
+"""
+import os
+from datetime import datetime, timedelta
+
+from sqlalchemy import event, select, delete, insert, func, literal
+from sqlalchemy.orm import Session
+
+from ..models.change import Change
+from .export import DATASETS, plain
+
+TTL_DAYS = int(os.getenv("CHANGELOG_TTL_DAYS", "30"))
+MAX_LIMIT = 500
+
+# Synced tables and the dataset names clients see them under
+TRACKED_TABLES = {
+    "languages": "languages",
+    "phonemes": "phonemes",
+    "allophones": "allophones",
+    "proposals": "proposals",
+    "discussion_topics": "discussions",
+    "discussion_replies": "replies",
+    "notifications": "notifications",
+}
+
+class ResyncRequired(Exception):
+    """The requested version predates the retained change log."""
+
+def record_changes(db, table, ids, operation="upsert"):
+    """Log a set-based write to `table` that touched the rows `ids`."""
+    entity_type = TRACKED_TABLES.get(table)
+    if entity_type is None or not ids:
+        return
+    now = datetime.utcnow()
+    db.execute(insert(Change), [
+        {"entity_type": entity_type, "entity_id": entity_id, "operation": operation, "changed_date": now}
+        for entity_id in ids
+    ])
+
+def record_changes_from(db, table, id_query, operation="upsert"):
+    """
+    Log a set-based write to the rows whose ids `id_query` selects, with one
+    INSERT ... SELECT. Run it before the write so both see the same rows.
+    """
+    entity_type = TRACKED_TABLES.get(table)
+    if entity_type is None:
+        return
+    selected = id_query.subquery()
+    db.execute(insert(Change).from_select(
+        ["entity_type", "entity_id", "operation", "changed_date"],
+        select(literal(entity_type), selected.c[0], literal(operation), literal(datetime.utcnow()))
+    ))
+
+@event.listens_for(Session, "after_flush")
+def _record_flushed_changes(session, flush_context):
+    rows = []
+    now = datetime.utcnow()
+    for instances, operation in ((session.new, "upsert"), (session.dirty, "upsert"), (session.deleted, "delete")):
+        for instance in instances:
+            entity_type = TRACKED_TABLES.get(getattr(instance, "__tablename__", None))
+            if entity_type is None:
+                continue
+            if operation == "upsert" and instance not in session.new and not session.is_modified(instance):
+                continue
+            rows.append({
+                "entity_type": entity_type, "entity_id": instance.id, "operation": operation, "changed_date": now
+            })
+    if rows:
+        # Straight to the connection: already inside the flush's transaction
+        session.connection().execute(insert(Change.__table__), rows)
+
+def latest_version(db):
+    return db.execute(select(func.max(Change.version))).scalar() or 0
+
+def changes_since(db, since, limit=100, types=None):
+    """
+    Return (version, has_more, changes) for the changes after `since`.
+
+    Each entity appears once with its latest operation; upserts carry the row as
+    it is now. `version` is the cursor for the next call.
+    """
+    oldest = db.execute(select(func.min(Change.version))).scalar()
+    if oldest is not None and since < oldest - 1:
+        raise ResyncRequired()
+
+    query = select(Change.version, Change.entity_type, Change.entity_id, Change.operation).where(
+        Change.version > since
+    )
+    if types:
+        query = query.where(Change.entity_type.in_(types))
+    rows = db.execute(query.order_by(Change.version).limit(limit + 1)).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if not rows:
+        return since, False, []
+
+    # Latest operation per entity, in version order
+    latest = {}
+    for row in rows:
+        latest.pop((row.entity_type, row.entity_id), None)
+        latest[(row.entity_type, row.entity_id)] = row
+
+    current = {}
+    upserts = {}
+    for (entity_type, entity_id), row in latest.items():
+        if row.operation == "upsert":
+            upserts.setdefault(entity_type, []).append(entity_id)
+    for entity_type, ids in upserts.items():
+        columns = DATASETS[entity_type]
+        id_column = next(column for column in columns if column.name == "id")
+        for values in db.execute(select(*columns).where(id_column.in_(ids))):
+            data = {column.name: plain(value) for column, value in zip(columns, values)}
+            current[(entity_type, values[columns.index(id_column)])] = data
+
+    changes = []
+    for key, row in latest.items():
+        data = current.get(key) if row.operation == "upsert" else None
+        # A row upserted and then removed by an unlogged write reads as deleted
+        operation = row.operation if row.operation == "delete" or data is not None else "delete"
+        changes.append({
+            "version": row.version, "type": row.entity_type, "id": row.entity_id, "op": operation, "data": data
+        })
+    return rows[-1].version, has_more, changes
+
+def prune_changes(db, cutoff):
+    """Delete changes logged before `cutoff`, always keeping the newest. Returns rows removed."""
+    newest = latest_version(db)
+    result = db.execute(
+        delete(Change).where(Change.changed_date < cutoff, Change.version < newest)
+    )
+    db.commit()
+    return result.rowcount
+
+def prune_expired_changes(db, now=None):
+    if TTL_DAYS <= 0:
+        return 0
+    return prune_changes(db, (now or datetime.utcnow()) - timedelta(days=TTL_DAYS))
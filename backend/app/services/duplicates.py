@@ -0,0 +1,191 @@
+# backend/app/services/duplicates.py
+"""
+Likely duplicates of a proposal among existing proposals and chart phonemes.
+
+Every proposal (symbol, sound_name, category) and every distinct phoneme
+(symbol, description) is split into character trigrams per field, and an
+inverted index maps each (field, trigram) to the entries containing it. A
+lookup only visits the posting lists of its own trigrams, counts the trigrams
+each entry shares per field and ranks the entries by weighted Jaccard
+similarity, so its cost follows the number of entries that share text with the
+query rather than the size of the tables.
+
+The index is built with two queries and afterwards maintained in place by
+create_proposal and the delete routes, which pass the proposals generation read
+before their commit, as with the leaderboards. Any other write to the
+proposals or phonemes tables (imports, for instance) makes the next lookup
+rebuild it.
+"""
+import threading
+import unicodedata
+from collections import defaultdict
+
+from sqlalchemy import func, select
+
+from ..models.phoneme import Phoneme
+from ..models.proposal import Proposal
+from .invalidation import generation, reads_lagging
+from .metrics import record_cache
+
+GRAM_SIZE = 3
+MAX_LIMIT = 50
+# Field weights; a score only counts the fields both entries have
+WEIGHTS = {"symbol": 0.5, "name": 0.4, "category": 0.1}
+MIN_SCORE = 0.3
+
+def normalize(field, text):
+    text = " ".join(unicodedata.normalize("NFC", text or "").split())
+    # IPA symbols are case sensitive, names and categories are not
+    return text if field == "symbol" else text.casefold()
+
+def trigrams(text):
+    """Character trigrams of each word, padded so short symbols still yield some."""
+    grams = set()
+    for word in text.split():
+        padded = " " * (GRAM_SIZE - 1) + word + " "
+        grams.update(padded[index:index + GRAM_SIZE] for index in range(len(padded) - GRAM_SIZE + 1))
+    return grams
+
+def field_grams(fields):
+    return {field: trigrams(normalize(field, value)) for field, value in fields.items() if value}
+
+def proposal_fields(proposal):
+    return {"symbol": proposal.symbol, "name": proposal.sound_name, "category": proposal.category}
+
+class DuplicateIndex:
+    """Trigram postings and per-entry gram counts for one proposals/phonemes generation."""
+
+    def __init__(self):
+        self.postings = defaultdict(set)
+        self.sizes = {}
+        self.entries = {}
+
+    @classmethod
+    def build(cls, db):
+        index = cls()
+        for row in db.execute(select(
+            Proposal.id, Proposal.symbol, Proposal.sound_name, Proposal.category, Proposal.status
+        )):
+            index.add_proposal(row)
+        # A symbol appears once per language; index each distinct sound once
+        for row in db.execute(
+            select(
+                Phoneme.symbol, Phoneme.description, func.min(Phoneme.id).label("id"),
+                func.count().label("languages")
+            ).where(Phoneme.symbol.isnot(None)).group_by(Phoneme.symbol, Phoneme.description)
+        ):
+            index.add(("phoneme", row.id), {"symbol": row.symbol, "name": row.description}, {
+                "type": "phoneme", "id": row.id, "symbol": row.symbol, "name": row.description,
+                "languages": row.languages
+            })
+        return index
+
+    def add(self, key, fields, entry):
+        grams = field_grams(fields)
+        for field, field_set in grams.items():
+            for gram in field_set:
+                self.postings[field, gram].add(key)
+        self.sizes[key] = {field: len(field_set) for field, field_set in grams.items()}
+        self.entries[key] = entry
+
+    def add_proposal(self, proposal):
+        self.add(("proposal", proposal.id), proposal_fields(proposal), {
+            "type": "proposal", "id": proposal.id, "symbol": proposal.symbol, "name": proposal.sound_name,
+            "category": proposal.category, "status": proposal.status
+        })
+
+    def remove(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        self.sizes.pop(key)
+        fields = {"symbol": entry["symbol"], "name": entry["name"], "category": entry.get("category")}
+        for field, field_set in field_grams(fields).items():
+            for gram in field_set:
+                keys = self.postings.get((field, gram))
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self.postings[field, gram]
+
+    def search(self, fields, limit=10, min_score=MIN_SCORE, exclude=None):
+        """Entries ranked by weighted trigram similarity to `fields`, best first."""
+        grams = field_grams(fields)
+        shared = defaultdict(lambda: defaultdict(int))
+        for field, field_set in grams.items():
+            for gram in field_set:
+                for key in self.postings.get((field, gram), ()):
+                    shared[key][field] += 1
+
+        ranked = []
+        for key, counts in shared.items():
+            if key == exclude:
+                continue
+            sizes = self.sizes[key]
+            total = weight = 0.0
+            for field, field_set in grams.items():
+                if field not in sizes:
+                    continue
+                common = counts.get(field, 0)
+                total += WEIGHTS[field] * common / (len(field_set) + sizes[field] - common)
+                weight += WEIGHTS[field]
+            score = total / weight if weight else 0.0
+            if score >= min_score:
+                ranked.append((score, key))
+
+        ranked.sort(key=lambda item: (-item[0], item[1][0], str(item[1][1])))
+        return [dict(self.entries[key], score=round(score, 4)) for score, key in ranked[:limit]]
+
+class Duplicates:
+    """The index for the current proposals/phonemes generation."""
+
+    def __init__(self):
+        self._index = None
+        self._token = None
+        self._lock = threading.Lock()
+
+    def token(self):
+        return generation("proposals", "phonemes")
+
+    def get_index(self, db):
+        token = self.token()
+        with self._lock:
+            if token == self._token:
+                record_cache("proposal_duplicates", True)
+                return self._index
+
+        record_cache("proposal_duplicates", False)
+        lagging = reads_lagging()
+        index = DuplicateIndex.build(db)
+        with self._lock:
+            if self.token() == token and not lagging:
+                self._index = index
+                self._token = token
+        return index
+
+    def find(self, db, symbol, sound_name=None, category=None, limit=10, exclude=None):
+        fields = {"symbol": symbol, "name": sound_name, "category": category}
+        index = self.get_index(db)
+        with self._lock:
+            return index.search(fields, min(limit, MAX_LIMIT), exclude=exclude)
+
+    def record(self, token_before, added=(), removed=()):
+        """
+        Apply a committed write to proposals: `added` proposals and `removed` ids.
+        `token_before` is self.token() read just before the commit; pass no
+        proposals for writes that leave the indexed fields alone (votes, status).
+        """
+        token_after = self.token()
+        proposals_before, phonemes_before = token_before
+        with self._lock:
+            if self._token != token_before or token_after != (proposals_before + 1, phonemes_before):
+                # Somebody else wrote as well; the index rebuilds on next read
+                return False
+            for proposal_id in removed:
+                self._index.remove(("proposal", proposal_id))
+            for proposal in added:
+                self._index.add_proposal(proposal)
+            self._token = token_after
+        return True
+
+duplicates = Duplicates()
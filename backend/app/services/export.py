@@ -0,0 +1,120 @@
+# backend/app/services/export.py
+"""
+Streaming dataset export as NDJSON or CSV.
+
+Rows are read through a streaming cursor EXPORT_BATCH_SIZE at a time
+(yield_per) and encoded into chunks of about EXPORT_CHUNK_SIZE bytes, optionally
+gzip-compressed on the fly, so memory use does not grow with the table. Used by
+GET /api/export/{dataset}, scripts/export_data.py and the change feed.
+
+    for chunk in export_stream("proposals", "csv", compress=True):
+        output.write(chunk)
+
+Each stream opens its own read session, since a response body is still being
+produced after the request's dependencies have finished.
+"""
+import csv
+import enum
+import io
+import json
+import os
+import uuid
+import zlib
+from datetime import date, datetime
+
+from sqlalchemy import select
+
+from ..database import ReadSessionLocal
+from ..models.allophone import Allophone
+from ..models.discussion import DiscussionTopic, DiscussionReply
+from ..models.language import Language
+from ..models.notification import Notification
+from ..models.phoneme import Phoneme
+from ..models.proposal import Proposal
+
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+EXPORT_CHUNK_SIZE = 64 * 1024
+FORMATS = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+def columns(model, exclude=()):
+    return [column for column in model.__table__.columns if column.name not in exclude]
+
+# Exported columns per dataset; author e-mail addresses stay private
+DATASETS = {
+    "languages": columns(Language),
+    "phonemes": columns(Phoneme),
+    "allophones": columns(Allophone),
+    "proposals": columns(Proposal),
+    "discussions": columns(DiscussionTopic, exclude=("author_email",)),
+    "replies": columns(DiscussionReply),
+    "notifications": columns(Notification),
+}
+
+def plain(value):
+    """A column value as a JSON/CSV friendly scalar."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+def iter_rows(db, dataset):
+    """Yield the dataset's rows as tuples without loading the table."""
+    statement = select(*DATASETS[dataset]).execution_options(yield_per=EXPORT_BATCH_SIZE)
+    for row in db.execute(statement):
+        yield tuple(plain(value) for value in row)
+
+def encode_ndjson(names, rows):
+    buffer = []
+    size = 0
+    for row in rows:
+        line = json.dumps(dict(zip(names, row)), ensure_ascii=False) + "\n"
+        buffer.append(line)
+        size += len(line)
+        if size >= EXPORT_CHUNK_SIZE:
+            yield "".join(buffer).encode("utf-8")
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+def encode_csv(names, rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(names)
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+ENCODERS = {"ndjson": encode_ndjson, "csv": encode_csv}
+
+def gzip_chunks(chunks, level=6):
+    # wbits 31: gzip header and trailer around the deflate stream
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+def export_stream(dataset, fmt="ndjson", compress=False, session_factory=ReadSessionLocal):
+    """Yield the encoded export of a dataset as byte chunks."""
+    names = [column.name for column in DATASETS[dataset]]
+    db = session_factory()
+    try:
+        chunks = ENCODERS[fmt](names, iter_rows(db, dataset))
+        if compress:
+            chunks = gzip_chunks(chunks)
+        yield from chunks
+    finally:
+        db.close()
+
+def export_filename(dataset, fmt, compress=False):
+    return f"{dataset}.{fmt}" + (".gz" if compress else "")
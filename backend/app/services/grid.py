@@ -0,0 +1,154 @@
+# backend/app/services/grid.py
+"""
+Phoneme chart grids, built once per language and data version.
+
+A grid is a flat list of rows x columns slots; a phoneme is placed at index
+row_position * columns + column_position and empty slots stay None, so building
+a 10 x 28 chart allocates one list and one small tuple per phoneme rather than a
+dict per cell. The HTML page and /api/languages/{code}/grid read the same cached
+LanguageGrids, and the API's JSON is encoded once per build.
+
+Grids are rebuilt when the phonemes or languages tables change (see
+app.services.invalidation).
+"""
+import json
+from collections import namedtuple
+
+from sqlalchemy import select
+
+from ..models.phoneme import Phoneme, PhonemeType
+from .invalidation import GenerationCache
+
+CONSONANT_ROWS = (
+    "Nasal", "Plosive", "Implosive", "Sibilant fricative",
+    "Non-sibilant fricative", "Approximant", "Flap", "Trill",
+    "Fricative trill", "Lateral approximant"
+)
+CONSONANT_COLUMNS = 28
+VOWEL_ROWS = ("Near-close", "Mid", "Near-open", "Open")
+VOWEL_COLUMNS = 6
+
+# Consonants whose description matches one of these go to the "Other ones" section
+OTHER_CONSONANT_KEYWORDS = ("bunched", "click", "compressed", "creaky", "lateral approximant")
+OTHER_VOWEL_KEYWORDS = ("near-", "close")
+
+GridCell = namedtuple("GridCell", "id symbol description audio_file impossibility_reason")
+GridRow = namedtuple("GridRow", "label cells")
+
+class Grid:
+    """Fixed-size chart with row labels; cells are GridCell or None."""
+
+    __slots__ = ("labels", "columns", "cells")
+
+    def __init__(self, labels, columns):
+        self.labels = labels
+        self.columns = columns
+        self.cells = [None] * (len(labels) * columns)
+
+    def place(self, row, column, cell):
+        """Put a cell at (row, column); positions outside the chart are ignored."""
+        if row is None or column is None:
+            return False
+        if not (0 <= row < len(self.labels) and 0 <= column < self.columns):
+            return False
+        self.cells[row * self.columns + column] = cell
+        return True
+
+    def get(self, row, column):
+        return self.cells[row * self.columns + column]
+
+    def rows(self):
+        """Rows as (label, cells) pairs, the shape the HTML template iterates."""
+        return [
+            GridRow(label, self.cells[index * self.columns:(index + 1) * self.columns])
+            for index, label in enumerate(self.labels)
+        ]
+
+    def as_dict(self):
+        return {
+            "rows": list(self.labels),
+            "columns": self.columns,
+            "cells": [
+                [cell._asdict() if cell is not None else None for cell in row.cells]
+                for row in self.rows()
+            ],
+        }
+
+class LanguageGrids:
+    """Everything the phoneme charts of one language need, built from a single query."""
+
+    def __init__(self, code, consonants, vowels, impossible, other_consonants, other_vowels):
+        self.code = code
+        self.consonants = consonants
+        self.vowels = vowels
+        self.impossible = impossible
+        self.other_consonants = other_consonants
+        self.other_vowels = other_vowels
+        # Template views and the encoded API response, computed on first use
+        self._rows = {}
+        self._json = None
+
+    def rows(self, name):
+        rows = self._rows.get(name)
+        if rows is None:
+            rows = self._rows[name] = getattr(self, name).rows()
+        return rows
+
+    def to_json(self):
+        """The /grid response body, encoded once per build."""
+        if self._json is None:
+            self._json = json.dumps({
+                "language": self.code,
+                "consonants": self.consonants.as_dict(),
+                "vowels": self.vowels.as_dict(),
+                "impossible": self.impossible.as_dict(),
+            }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return self._json
+
+def build_grids(db, code, language_id):
+    """Load the language's phonemes once and place them into the three charts."""
+    rows = db.execute(
+        select(
+            Phoneme.id,
+            Phoneme.type,
+            Phoneme.symbol,
+            Phoneme.description,
+            Phoneme.audio_file,
+            Phoneme.row_position,
+            Phoneme.column_position,
+            Phoneme.is_extended,
+            Phoneme.impossibility_reason
+        ).where(Phoneme.language_id == language_id)
+    ).all()
+
+    consonants = Grid(CONSONANT_ROWS, CONSONANT_COLUMNS)
+    vowels = Grid(VOWEL_ROWS, VOWEL_COLUMNS)
+    impossible = Grid(CONSONANT_ROWS, CONSONANT_COLUMNS)
+    other_consonants = []
+    other_vowels = []
+
+    for row in rows:
+        cell = GridCell(
+            str(row.id), row.symbol, row.description, row.audio_file, row.impossibility_reason
+        )
+        description = (row.description or "").lower()
+
+        if row.impossibility_reason is not None:
+            impossible.place(row.row_position, row.column_position, cell)
+        elif row.is_extended and row.type == PhonemeType.consonant:
+            consonants.place(row.row_position, row.column_position, cell)
+            if any(keyword in description for keyword in OTHER_CONSONANT_KEYWORDS):
+                other_consonants.append(cell)
+
+        if row.is_extended and row.type == PhonemeType.vowel:
+            vowels.place(row.row_position, row.column_position, cell)
+            if any(keyword in description for keyword in OTHER_VOWEL_KEYWORDS):
+                other_vowels.append(cell)
+
+    return LanguageGrids(code, consonants, vowels, impossible, other_consonants, other_vowels)
+
+grid_cache = GenerationCache("phonemes", "languages", name="phoneme_grid")
+
+def get_language_grids(db, language):
+    """Cached grids for a LanguageEntry from the language registry."""
+    return grid_cache.get(language.code, lambda: build_grids(db, language.code, language.id))
@@ -0,0 +1,169 @@
+# backend/app/services/images.py
+"""
+Resized and recompressed derivatives of chart and proposal images.
+
+Derivatives are produced off the request path by the "image_derivatives"
+background job, queued when a proposal image is uploaded, and for chart images
+by scripts/build_image_derivatives.py, which the deploy runs. They are stored under IMAGE_CACHE_DIR in a
+directory named after the SHA-256 of the source file, so replacing a file yields
+new derivatives and identical files share them:
+
+    var/images/<sha256[:32]>/<width>.<webp|jpeg|png>
+
+/api/images/{path}?w=320 serves the smallest derivative at least that wide, in
+WebP when the client's Accept header allows it, and falls back to the original
+file until derivatives exist; serving never writes. Pillow is optional; without it originals are
+always served. It is imported by the first job that resizes an image, not with
+the app.
+"""
+import hashlib
+import importlib.util
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from .jobs import enqueue, job_handler
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+STATE_DIR = Path(os.getenv("APP_STATE_DIR", BASE_DIR / "var"))
+IMAGE_CACHE_DIR = Path(os.getenv("IMAGE_CACHE_DIR", STATE_DIR / "images"))
+# Chart images ship in static/images; proposal uploads are stored under images/ (see routers/proposals.py)
+IMAGE_ROOTS = (BASE_DIR / "static" / "images", Path("images"))
+IMAGE_WIDTHS = tuple(sorted(int(width) for width in os.getenv("IMAGE_WIDTHS", "160,320,640,1280").split(",")))
+WEBP_QUALITY = int(os.getenv("IMAGE_WEBP_QUALITY", "80"))
+JPEG_QUALITY = int(os.getenv("IMAGE_JPEG_QUALITY", "82"))
+
+# Formats Pillow writes for the fallback variant, by source extension
+FALLBACK_FORMATS = {".jpg": "jpeg", ".jpeg": "jpeg", ".png": "png", ".gif": "png", ".webp": "png", ".bmp": "png"}
+MEDIA_TYPES = {"webp": "image/webp", "jpeg": "image/jpeg", "png": "image/png"}
+# Without Pillow installed originals only
+PILLOW_INSTALLED = importlib.util.find_spec("PIL") is not None
+
+# Source digests by (path, size, mtime), so a request does not re-read the file;
+# least recently used first, at most DIGEST_CACHE_SIZE
+DIGEST_CACHE_SIZE = 4096
+_digests = OrderedDict()
+_lock = threading.Lock()
+
+def available():
+    return PILLOW_INSTALLED
+
+def resolve_source(name):
+    """Map an image reference such as "proposals/<id>.png" to a file, refusing paths outside the roots."""
+    for root in IMAGE_ROOTS:
+        root = root.resolve()
+        path = (root / name).resolve()
+        if path.is_relative_to(root) and path.is_file():
+            return path
+    return None
+
+def source_digest(path):
+    stat = path.stat()
+    key = (str(path), stat.st_size, stat.st_mtime_ns)
+    with _lock:
+        digest = _digests.get(key)
+        if digest is not None:
+            _digests.move_to_end(key)
+            return digest
+
+    sha = hashlib.sha256()
+    with open(path, "rb") as source:
+        for chunk in iter(lambda: source.read(1 << 16), b""):
+            sha.update(chunk)
+    digest = sha.hexdigest()[:32]
+    with _lock:
+        _digests[key] = digest
+        if len(_digests) > DIGEST_CACHE_SIZE:
+            _digests.popitem(last=False)
+    return digest
+
+def fallback_format(path):
+    return FALLBACK_FORMATS.get(path.suffix.lower())
+
+def derivative_path(digest, width, image_format):
+    return IMAGE_CACHE_DIR / digest / f"{width}.{image_format}"
+
+def generate_derivatives(path):
+    """Write every configured width, as WebP and in the source's own format. Returns files written."""
+    if not available():
+        raise RuntimeError("Pillow is not installed")
+    from PIL import Image
+
+    original_format = fallback_format(path)
+    if original_format is None:
+        return 0
+
+    digest = source_digest(path)
+    directory = IMAGE_CACHE_DIR / digest
+    directory.mkdir(parents=True, exist_ok=True)
+    written = 0
+
+    with Image.open(path) as image:
+        image.load()
+        for width in IMAGE_WIDTHS:
+            # Never upscale: widths beyond the original reuse the original size
+            target = min(width, image.width)
+            height = max(1, round(image.height * target / image.width))
+            resized = image if target == image.width else image.resize((target, height), Image.LANCZOS)
+
+            for image_format in ("webp", original_format):
+                destination = derivative_path(digest, width, image_format)
+                if destination.exists():
+                    continue
+                converted = resized
+                if image_format == "jpeg" and converted.mode not in ("RGB", "L"):
+                    converted = converted.convert("RGB")
+                elif converted.mode == "P":
+                    converted = converted.convert("RGBA")
+                options = {"quality": WEBP_QUALITY, "method": 4} if image_format == "webp" else (
+                    {"quality": JPEG_QUALITY, "optimize": True, "progressive": True}
+                    if image_format == "jpeg" else {"optimize": True}
+                )
+                # Write beside the target and rename, so readers never see a partial file
+                temporary = destination.with_name(f".{destination.name}.{os.getpid()}.tmp")
+                converted.save(temporary, image_format.upper(), **options)
+                os.replace(temporary, destination)
+                written += 1
+    return written
+
+def choose_variant(path, width, accept):
+    """
+    Return (file, media_type) for the best existing derivative, or None if none exists yet.
+    """
+    original_format = fallback_format(path)
+    if original_format is None:
+        return None
+
+    digest = source_digest(path)
+    if width is None:
+        width = IMAGE_WIDTHS[-1]
+    target = next((candidate for candidate in IMAGE_WIDTHS if candidate >= width), IMAGE_WIDTHS[-1])
+
+    formats = [original_format]
+    if "image/webp" in (accept or ""):
+        formats.insert(0, "webp")
+    for image_format in formats:
+        candidate = derivative_path(digest, target, image_format)
+        if candidate.exists():
+            return candidate, MEDIA_TYPES[image_format]
+    return None
+
+def queue_derivatives(db, name):
+    """Queue derivative generation for a newly stored image (the caller commits)."""
+    path = resolve_source(name)
+    if path is None or not available() or fallback_format(path) is None:
+        return False
+    enqueue(db, "image_derivatives", {"name": name})
+    return True
+
+@job_handler("image_derivatives")
+def build_derivatives(db, payload):
+    path = resolve_source(payload["name"])
+    if path is None:
+        return
+    written = generate_derivatives(path)
+    logger.info("Wrote %d derivatives of %s", written, payload["name"])
@@ -0,0 +1,176 @@
+# backend/app/services/invalidation.py
+"""
+Cross-process cache invalidation through shared generation counters.
+
+Every worker process maps the same small file (APP_STATE_DIR/generations.bin)
+into memory. It holds 64 counters; a namespace such as a table name is hashed to
+one of them. Committing a session that wrote to a table increments that table's
+counter, and any in-memory cache built from the table compares the counter it
+was built at with the current value, which is a plain memory read with no
+system call. Two namespaces sharing a slot only cause an extra rebuild.
+
+    languages_cache = GenerationCache("languages", name="languages")
+    registry = languages_cache.get("all", lambda: load_languages(db))
+
+Writes that bypass the ORM session (raw SQL, other programs) should call
+bump("table_name") themselves. The counters are per host; deployments spread
+over several machines need a shared signal instead.
+"""
+import mmap
+import os
+import struct
+import threading
+import zlib
+from pathlib import Path
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from .metrics import record_cache
+
+try:
+    import fcntl
+except ImportError:  # Windows: a single development process, the thread lock is enough
+    fcntl = None
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+STATE_DIR = Path(os.getenv("APP_STATE_DIR", BASE_DIR / "var"))
+GENERATION_FILE = STATE_DIR / "generations.bin"
+SLOTS = 64
+SLOT = struct.Struct("<Q")
+
+class GenerationCounters:
+    """Fixed array of 64-bit counters in a shared memory-mapped file."""
+
+    def __init__(self, path=GENERATION_FILE):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._file = None
+        self._map = None
+
+    def _open(self):
+        with self._lock:
+            if self._map is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "a+b")
+                if os.path.getsize(self.path) < SLOTS * SLOT.size:
+                    self._file.truncate(SLOTS * SLOT.size)
+                self._map = mmap.mmap(self._file.fileno(), SLOTS * SLOT.size)
+        return self._map
+
+    @staticmethod
+    def slot(namespace):
+        return zlib.crc32(namespace.encode()) % SLOTS
+
+    def value(self, namespace):
+        mapped = self._map or self._open()
+        return SLOT.unpack_from(mapped, self.slot(namespace) * SLOT.size)[0]
+
+    def bump(self, namespace):
+        mapped = self._map or self._open()
+        offset = self.slot(namespace) * SLOT.size
+        with self._lock:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+            try:
+                value = SLOT.unpack_from(mapped, offset)[0] + 1
+                SLOT.pack_into(mapped, offset, value)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        return value
+
+counters = GenerationCounters()
+
+def generation(*namespaces):
+    """Current generation token for one or more namespaces."""
+    if len(namespaces) == 1:
+        return counters.value(namespaces[0])
+    return tuple(counters.value(namespace) for namespace in namespaces)
+
+def bump(*namespaces):
+    """Invalidate every cache built from these namespaces, in all processes."""
+    for namespace in namespaces:
+        counters.bump(namespace)
+
+# Read paths that may serve data older than the counters (the read replica)
+# register a check here; values computed while one lags are not cached.
+_lag_checks = []
+
+def register_lag_check(check):
+    _lag_checks.append(check)
+
+def reads_lagging():
+    return any(check() for check in _lag_checks)
+
+class GenerationCache:
+    """
+    Values computed from database state, recomputed when any of the given
+    namespaces (usually table names) has been written since they were built.
+    """
+
+    def __init__(self, *namespaces, name=None):
+        self.namespaces = namespaces
+        self.name = name or "_".join(namespaces)
+        self._entries = {}
+
+    def token(self):
+        return generation(*self.namespaces)
+
+    def get(self, key, compute):
+        token = self.token()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == token:
+            record_cache(self.name, True)
+            return entry[1]
+
+        record_cache(self.name, False)
+        lagging = reads_lagging()
+        value = compute()
+        if not lagging:
+            self._entries[key] = (token, value)
+        return value
+
+    def peek(self, key):
+        """Return the cached value if it is still current, else None."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == self.token():
+            return entry[1]
+        return None
+
+    def put(self, key, value, token=None):
+        """Store a value updated in place, as current for `token` (default: now)."""
+        self._entries[key] = (self.token() if token is None else token, value)
+
+    def clear(self):
+        self._entries.clear()
+
+# Track the tables a session writes and bump them once the transaction commits.
+
+def _touched(session):
+    return session.info.setdefault("touched_tables", set())
+
+@event.listens_for(Session, "after_flush")
+def _record_flushed_tables(session, flush_context):
+    touched = _touched(session)
+    for instance in list(session.new) + list(session.dirty) + list(session.deleted):
+        table = getattr(instance, "__tablename__", None)
+        if table:
+            touched.add(table)
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_bulk_tables(orm_execute_state):
+    if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None:
+            _touched(orm_execute_state.session).add(table.name)
+
+@event.listens_for(Session, "after_commit")
+def _bump_committed_tables(session):
+    touched = session.info.pop("touched_tables", None)
+    if touched:
+        bump(*touched)
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_tables(session):
+    session.info.pop("touched_tables", None)
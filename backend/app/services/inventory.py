@@ -0,0 +1,124 @@
+# backend/app/services/inventory.py
+"""
+Phoneme inventory bitmaps for cross-language comparison.
+
+Every distinct symbol in the phonemes table gets a bit position in a global
+dictionary, and each language's inventory is a Python int with those bits set.
+Shared sounds, union and Jaccard similarity are then single bitwise operations
+and a popcount, regardless of how many languages are compared.
+
+Impossible phonemes (impossibility_reason set) are not part of an inventory.
+The bitmaps are rebuilt from one query whenever the phonemes or languages
+tables change, e.g. after scripts/import_extended_ipa.py commits.
+"""
+from sqlalchemy import select
+
+from ..models.language import Language
+from ..models.phoneme import Phoneme
+from .invalidation import GenerationCache
+
+def popcount(bitmap):
+    return bin(bitmap).count("1")
+
+def jaccard(a, b):
+    union = popcount(a | b)
+    return popcount(a & b) / union if union else 0.0
+
+class Inventories:
+    """Global symbol dictionary plus one bitmap per language code."""
+
+    def __init__(self, symbols, bitmaps, names):
+        self.symbols = symbols
+        self.bitmaps = bitmaps
+        self.names = names
+
+    @classmethod
+    def build(cls, db):
+        languages = db.execute(select(Language.id, Language.code, Language.name)).all()
+        rows = db.execute(
+            select(Phoneme.language_id, Phoneme.symbol).where(
+                Phoneme.impossibility_reason.is_(None),
+                Phoneme.symbol.isnot(None)
+            ).distinct()
+        ).all()
+
+        symbols = sorted({row.symbol for row in rows})
+        positions = {symbol: bit for bit, symbol in enumerate(symbols)}
+        codes = {language.id: language.code for language in languages}
+        bitmaps = {language.code: 0 for language in languages}
+        for row in rows:
+            code = codes.get(row.language_id)
+            if code is not None:
+                bitmaps[code] |= 1 << positions[row.symbol]
+
+        names = {language.code: language.name for language in languages}
+        return cls(symbols, bitmaps, names)
+
+    def decode(self, bitmap):
+        """Symbols whose bits are set, in dictionary order."""
+        symbols = []
+        while bitmap:
+            low = bitmap & -bitmap
+            symbols.append(self.symbols[low.bit_length() - 1])
+            bitmap ^= low
+        return symbols
+
+    def compare(self, codes):
+        """Shared, combined and per-language unique symbols plus pairwise Jaccard similarity."""
+        bitmaps = [self.bitmaps[code] for code in codes]
+        union = 0
+        for bitmap in bitmaps:
+            union |= bitmap
+        shared = union
+        for bitmap in bitmaps:
+            shared &= bitmap
+
+        unique = {}
+        for index, code in enumerate(codes):
+            others = 0
+            for other_index, bitmap in enumerate(bitmaps):
+                if other_index != index:
+                    others |= bitmap
+            unique[code] = self.decode(bitmaps[index] & ~others)
+
+        similarity = [
+            {"a": codes[i], "b": codes[j], "jaccard": round(jaccard(bitmaps[i], bitmaps[j]), 4)}
+            for i in range(len(codes))
+            for j in range(i + 1, len(codes))
+        ]
+        return {
+            "languages": [
+                {"code": code, "name": self.names.get(code), "size": popcount(bitmap)}
+                for code, bitmap in zip(codes, bitmaps)
+            ],
+            "shared": self.decode(shared),
+            "union_size": popcount(union),
+            "unique": unique,
+            "similarity": similarity,
+        }
+
+    def similar(self, code, limit=10):
+        """Other languages ranked by Jaccard similarity to `code`."""
+        bitmap = self.bitmaps[code]
+        ranked = sorted(
+            (
+                (jaccard(bitmap, other), popcount(bitmap & other), other_code)
+                for other_code, other in self.bitmaps.items()
+                if other_code != code
+            ),
+            reverse=True
+        )
+        return [
+            {
+                "code": other_code,
+                "name": self.names.get(other_code),
+                "jaccard": round(score, 4),
+                "shared": shared
+            }
+            for score, shared, other_code in ranked[:limit]
+        ]
+
+inventory_cache = GenerationCache("phonemes", "languages", name="inventories")
+
+def get_inventories(db):
+    return inventory_cache.get("all", lambda: Inventories.build(db))
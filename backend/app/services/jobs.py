@@ -0,0 +1,242 @@
+# backend/app/services/jobs.py
+"""
+Durable background jobs stored in the background_jobs table.
+
+A route enqueues a job in the same session as the rows it writes, so the job is
+committed (or rolled back) together with them and survives a restart. A small
+pool of worker threads claims runnable jobs oldest first, runs the handler
+registered for their kind and retries failures with exponential backoff.
+
+    @job_handler("delete_files")
+    def delete_files(db, payload):
+        ...
+
+    enqueue(db, "delete_files", {"paths": [...]})
+    db.commit()
+
+Workers run inside each app process (JOB_WORKERS threads, default 1) or in a
+dedicated process started with scripts/run_jobs.py. Claiming is a conditional
+UPDATE, so any number of workers can share the table.
+"""
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import event, func, select, update, delete
+
+from ..models.job import Job
+from .metrics import REGISTRY, Counter
+
+logger = logging.getLogger(__name__)
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "1"))
+POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "2"))
+JOB_TIMEOUT = int(os.getenv("JOB_TIMEOUT", "600"))
+RETENTION_HOURS = int(os.getenv("JOB_RETENTION_HOURS", "24"))
+MAX_BACKOFF = 3600
+
+HANDLERS = {}
+
+jobs_processed = REGISTRY.register(Counter(
+    "background_jobs_processed_total", "Background jobs run by kind and result.",
+    ("kind", "result")
+))
+
+# Set after a session that enqueued jobs commits, so idle workers wake up at once
+_wakeup = threading.Event()
+
+def job_handler(kind):
+    """Register `function(db, payload)` as the handler for jobs of `kind`."""
+    def register(function):
+        HANDLERS[kind] = function
+        return function
+    return register
+
+def _wake_workers(session):
+    session.info.pop("wake_workers", None)
+    _wakeup.set()
+
+def enqueue(db, kind, payload=None, delay=0, max_attempts=5):
+    """Add a job to the session; it becomes visible to workers when the session commits."""
+    job = Job(
+        kind=kind,
+        payload=json.dumps(payload or {}),
+        status="queued",
+        attempts=0,
+        max_attempts=max_attempts,
+        run_after=datetime.utcnow() + timedelta(seconds=delay),
+        created_date=datetime.utcnow()
+    )
+    db.add(job)
+    # once=True registers a wrapper, so event.contains() cannot tell it is there
+    if not db.info.get("wake_workers"):
+        db.info["wake_workers"] = True
+        event.listen(db, "after_commit", _wake_workers, once=True)
+    return job
+
+def claim_next(db, worker_id):
+    """Atomically mark the oldest runnable job as running and return it, or None."""
+    while True:
+        job_id = db.execute(
+            select(Job.id).where(
+                Job.status == "queued",
+                Job.run_after <= datetime.utcnow()
+            ).order_by(Job.run_after).limit(1)
+        ).scalar()
+        if job_id is None:
+            db.rollback()
+            return None
+
+        claimed = db.execute(
+            update(Job).where(Job.id == job_id, Job.status == "queued").values(
+                status="running",
+                locked_by=worker_id,
+                started_date=datetime.utcnow(),
+                attempts=Job.attempts + 1
+            )
+        ).rowcount
+        db.commit()
+        if claimed:
+            return db.get(Job, job_id)
+        # Another worker won the race for this job; try the next one
+
+def run_job(db, job):
+    """Run one claimed job and record success, a scheduled retry or final failure."""
+    handler = HANDLERS.get(job.kind)
+    try:
+        if handler is None:
+            raise LookupError(f"No handler registered for job kind '{job.kind}'")
+        handler(db, json.loads(job.payload))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        job = db.get(Job, job.id)
+        job.last_error = f"{type(e).__name__}: {e}"
+        if job.attempts < job.max_attempts:
+            job.status = "queued"
+            job.run_after = datetime.utcnow() + timedelta(seconds=min(2 ** job.attempts, MAX_BACKOFF))
+            result = "retry"
+        else:
+            job.status = "failed"
+            job.finished_date = datetime.utcnow()
+            result = "failed"
+        logger.warning("Job %s (%s) attempt %d failed: %s", job.id, job.kind, job.attempts, job.last_error)
+    else:
+        job.status = "done"
+        job.finished_date = datetime.utcnow()
+        job.last_error = None
+        result = "done"
+    job.locked_by = None
+    db.commit()
+    jobs_processed.inc(job.kind, result)
+    return result
+
+def requeue_stale(db, timeout=JOB_TIMEOUT):
+    """
+    Return jobs stuck in 'running' (e.g. the worker died) to the queue, or fail
+    them if they have used all their attempts. Returns the number requeued.
+    """
+    now = datetime.utcnow()
+    stale = [Job.status == "running", Job.started_date < now - timedelta(seconds=timeout)]
+    # A job that keeps killing its worker must not be retried forever
+    db.execute(
+        update(Job).where(*stale, Job.attempts >= Job.max_attempts).values(
+            status="failed", locked_by=None, finished_date=now,
+            last_error=f"Timed out after {timeout} seconds on its last attempt"
+        )
+    )
+    count = db.execute(
+        update(Job).where(*stale).values(status="queued", locked_by=None)
+    ).rowcount
+    db.commit()
+    return count
+
+def purge_finished(db, hours=RETENTION_HOURS):
+    """Delete completed jobs older than `hours`; failed jobs are kept for inspection."""
+    count = db.execute(
+        delete(Job).where(
+            Job.status == "done",
+            Job.finished_date < datetime.utcnow() - timedelta(hours=hours)
+        )
+    ).rowcount
+    db.commit()
+    return count
+
+def queue_stats(db):
+    """Queue depth by status and the lag of the oldest runnable job."""
+    counts = dict(db.execute(select(Job.status, func.count(Job.id)).group_by(Job.status)).all())
+    oldest = db.execute(
+        select(func.min(Job.run_after)).where(
+            Job.status == "queued",
+            Job.run_after <= datetime.utcnow()
+        )
+    ).scalar()
+    return {
+        "queued": counts.get("queued", 0),
+        "running": counts.get("running", 0),
+        "done": counts.get("done", 0),
+        "failed": counts.get("failed", 0),
+        "lag_seconds": round((datetime.utcnow() - oldest).total_seconds(), 3) if oldest else 0.0,
+        "workers": JOB_WORKERS,
+        "handlers": sorted(HANDLERS),
+    }
+
+class WorkerPool:
+    """Worker threads that poll the job table until stopped."""
+
+    def __init__(self, session_factory, size=JOB_WORKERS, poll_interval=POLL_INTERVAL):
+        self.session_factory = session_factory
+        self.size = size
+        self.poll_interval = poll_interval
+        self.threads = []
+        self.stopping = threading.Event()
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+
+    def start(self):
+        db = self.session_factory()
+        try:
+            requeued = requeue_stale(db)
+            if requeued:
+                logger.info("Requeued %d stale background jobs", requeued)
+        finally:
+            db.close()
+
+        for index in range(self.size):
+            thread = threading.Thread(
+                target=self.work, args=(f"{self.name}:{index}",),
+                name=f"job-worker-{index}", daemon=True
+            )
+            thread.start()
+            self.threads.append(thread)
+
+    def stop(self, timeout=10):
+        self.stopping.set()
+        _wakeup.set()
+        for thread in self.threads:
+            thread.join(timeout)
+
+    def work(self, worker_id):
+        last_maintenance = 0.0
+        while not self.stopping.is_set():
+            db = self.session_factory()
+            try:
+                if time.monotonic() - last_maintenance > 300:
+                    requeue_stale(db)
+                    purge_finished(db)
+                    last_maintenance = time.monotonic()
+
+                job = claim_next(db, worker_id)
+                if job is not None:
+                    run_job(db, job)
+                    continue
+            except Exception:
+                logger.exception("Background job worker %s failed", worker_id)
+            finally:
+                db.close()
+
+            _wakeup.wait(self.poll_interval)
+            _wakeup.clear()
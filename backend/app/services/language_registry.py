@@ -0,0 +1,47 @@
+# backend/app/services/language_registry.py
+"""
+Process-wide registry of languages, so routes resolve a language code without
+querying the languages table.
+
+The table is tiny and almost never written. It is loaded at startup and reloaded
+on first use after the "languages" generation moves, i.e. after any session in
+any worker commits a change to it (see app.services.invalidation).
+"""
+from fastapi import Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..database import get_read_db
+from ..models.language import Language
+from .invalidation import GenerationCache
+
+class LanguageEntry:
+    """Read-only copy of a languages row."""
+
+    __slots__ = ("id", "code", "name")
+
+    def __init__(self, id, code, name):
+        self.id = id
+        self.code = code
+        self.name = name
+
+registry_cache = GenerationCache("languages", name="language_registry")
+
+def load_languages(db):
+    rows = db.execute(select(Language.id, Language.code, Language.name).order_by(Language.name)).all()
+    return {row.code: LanguageEntry(row.id, row.code, row.name) for row in rows}
+
+def get_registry(db):
+    """All languages by code; only touches the database when the table has changed."""
+    return registry_cache.get("all", lambda: load_languages(db))
+
+def find_language(db, code):
+    """Return the LanguageEntry for a code, or None."""
+    return get_registry(db).get(code)
+
+def get_language_entry(lang_code: str, db: Session = Depends(get_read_db)):
+    """Route dependency resolving the {lang_code} path parameter, 404 for unknown codes."""
+    language = find_language(db, lang_code)
+    if language is None:
+        raise HTTPException(status_code=404, detail="Language not found")
+    return language
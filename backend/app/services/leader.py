@@ -0,0 +1,61 @@
+# backend/app/services/leader.py
+"""
+Single-runner election among the worker processes of one host.
+
+gunicorn starts every worker from the same app, so startup hooks run once per
+worker. Background work that must run once per host (notification retention,
+the in-process job pool) waits until its process holds an exclusive lock on
+APP_STATE_DIR/<name>.lock:
+
+    await wait_until_leader("notification-retention")
+
+The other workers keep retrying every LEADER_RETRY_INTERVAL seconds, so the work
+moves to another worker when the holder exits, e.g. when gunicorn recycles it
+after max_requests. Like the generation counters, this is per host.
+"""
+import asyncio
+import logging
+import os
+
+from .invalidation import STATE_DIR
+
+try:
+    import fcntl
+except ImportError:  # Windows: a single development process, always the leader
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+RETRY_INTERVAL = float(os.getenv("LEADER_RETRY_INTERVAL", "30"))
+
+# Lock files held by this process, by name; closing one releases the lock
+_held = {}
+
+def try_acquire(name):
+    """Take the lock `name` without waiting. Returns True if this process holds it."""
+    if name in _held:
+        return True
+    if fcntl is None:
+        _held[name] = None
+        return True
+
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    lock_file = open(STATE_DIR / f"{name}.lock", "a+b")
+    try:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return False
+    _held[name] = lock_file
+    return True
+
+def release(name):
+    lock_file = _held.pop(name, None)
+    if lock_file is not None:
+        lock_file.close()
+
+async def wait_until_leader(name, retry_interval=RETRY_INTERVAL):
+    """Return once this process holds the lock `name`; cancel the caller to stop waiting."""
+    while not try_acquire(name):
+        await asyncio.sleep(retry_interval)
+    logger.info("Process %d runs %s", os.getpid(), name)
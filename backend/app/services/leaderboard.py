@@ -0,0 +1,153 @@
+# backend/app/services/leaderboard.py
+"""
+Vote-ranked proposal leaderboards kept in memory.
+
+A board holds the best CAPACITY proposals for one (status, category) filter,
+ordered by votes (highest first), then submission date (oldest first). It is
+loaded with one query over ix_proposals_status_votes and afterwards maintained
+in place by vote_proposal and update_proposal_status, so reading the top K
+costs O(K) however many proposals exist.
+
+Invariant: every matching proposal outside a board ranks below the board's
+last entry. A proposal voted below that line leaves the board; the board is
+reloaded once it holds fewer entries than a reader asks for while more exist.
+
+In-place updates are only applied when the caller's commit is the sole change
+to the proposals generation since the boards were loaded. Any other write, in
+this worker or another (creates, deletes, bulk updates), makes every board
+reload on its next read.
+"""
+import bisect
+import threading
+from datetime import datetime
+
+from sqlalchemy import select
+
+from ..models.proposal import Proposal
+from .invalidation import generation, reads_lagging
+from .metrics import record_cache
+
+MAX_LIMIT = 100
+# Spare entries so a few downvotes do not force a reload
+CAPACITY = MAX_LIMIT * 2
+
+FIELDS = (
+    "id", "symbol", "sound_name", "category", "rationale", "example_language",
+    "submitted_date", "status", "votes", "audio_file", "image_file"
+)
+
+def snapshot(proposal):
+    """Plain dict copy of a Proposal row with the fields the API returns."""
+    return {field: getattr(proposal, field) for field in FIELDS}
+
+def rank_key(entry):
+    return (-(entry["votes"] or 0), entry["submitted_date"] or datetime.min, str(entry["id"]))
+
+class Board:
+    """Sorted top entries for one filter."""
+
+    def __init__(self, status, category, entries, complete):
+        self.status = status
+        self.category = category
+        self.entries = entries
+        self.keys = [rank_key(entry) for entry in entries]
+        # True when the board holds every matching proposal
+        self.complete = complete
+
+    @classmethod
+    def load(cls, db, status, category):
+        query = select(*(getattr(Proposal, field) for field in FIELDS))
+        if status:
+            query = query.where(Proposal.status == status)
+        if category:
+            query = query.where(Proposal.category == category)
+        rows = db.execute(
+            query.order_by(Proposal.votes.desc(), Proposal.submitted_date, Proposal.id).limit(CAPACITY + 1)
+        ).all()
+        entries = [dict(row._mapping) for row in rows[:CAPACITY]]
+        return cls(status, category, entries, complete=len(rows) <= CAPACITY)
+
+    def matches(self, entry):
+        return (not self.status or entry["status"] == self.status) and (
+            not self.category or entry["category"] == self.category
+        )
+
+    def remove(self, proposal_id):
+        for index, entry in enumerate(self.entries):
+            if entry["id"] == proposal_id:
+                del self.entries[index]
+                del self.keys[index]
+                return True
+        return False
+
+    def offer(self, entry):
+        """Insert an entry if it ranks inside the board (or the board holds everything)."""
+        key = rank_key(entry)
+        if not self.complete and (not self.keys or key > self.keys[-1]):
+            # Ranks below the line: an unseen proposal might be ahead of it
+            return
+        index = bisect.bisect_left(self.keys, key)
+        self.keys.insert(index, key)
+        self.entries.insert(index, entry)
+        if len(self.entries) > CAPACITY:
+            self.entries.pop()
+            self.keys.pop()
+            self.complete = False
+
+    def apply(self, entry):
+        self.remove(entry["id"])
+        if self.matches(entry):
+            self.offer(entry)
+
+    def usable_for(self, limit):
+        return self.complete or len(self.entries) >= limit
+
+class Leaderboards:
+    """Boards for every filter read so far, valid for one proposals generation."""
+
+    def __init__(self):
+        self._boards = {}
+        self._token = None
+        self._lock = threading.Lock()
+
+    def token(self):
+        return generation("proposals")
+
+    def top(self, db, status=None, category=None, limit=10):
+        limit = min(limit, MAX_LIMIT)
+        key = (status or None, category or None)
+        token = self.token()
+        with self._lock:
+            if token != self._token:
+                self._boards = {}
+                self._token = token
+            board = self._boards.get(key)
+            if board is not None and board.usable_for(limit):
+                record_cache("proposal_leaderboard", True)
+                return [dict(entry) for entry in board.entries[:limit]]
+
+        record_cache("proposal_leaderboard", False)
+        lagging = reads_lagging()
+        board = Board.load(db, *key)
+        with self._lock:
+            if self._token == token and not lagging:
+                self._boards[key] = board
+        return [dict(entry) for entry in board.entries[:limit]]
+
+    def record(self, proposal, token_before):
+        """
+        Apply a committed vote or status change of `proposal` to every board.
+        `token_before` is self.token() read just before the commit.
+        """
+        entry = snapshot(proposal)
+        token_after = self.token()
+        with self._lock:
+            if self._token != token_before or token_after != token_before + 1:
+                # Somebody else wrote proposals as well; boards reload on next read
+                return False
+            for board in self._boards.values():
+                board.apply(entry)
+            self._token = token_after
+        return True
+
+leaderboards = Leaderboards()
@@ -0,0 +1,290 @@
+# backend/app/services/metrics.py
+"""
+In-process metrics registry with Prometheus text exposition.
+
+Request latency is recorded by MetricsMiddleware per route template, SQL
+statement counts and time come from SQLAlchemy engine events, and pool gauges
+are read from the engine when /metrics is scraped. Everything is kept in plain
+dicts behind one lock per metric, so recording costs a few dictionary updates.
+"""
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+
+from sqlalchemy import event
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 500)
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names, values, extra=None):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+class Metric:
+    type_name = "untyped"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def header(self):
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+    def samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {value}" for labels, value in items]
+
+    def value(self, *labels):
+        return self._values.get(labels, 0)
+
+class Counter(Metric):
+    type_name = "counter"
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+class Gauge(Metric):
+    type_name = "gauge"
+
+    def __init__(self, name, documentation, labelnames=(), callback=None):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+
+    def set(self, value, *labels):
+        with self._lock:
+            self._values[labels] = value
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, *labels, amount=1):
+        self.inc(*labels, amount=-amount)
+
+    def samples(self):
+        if self.callback is not None:
+            for labels, value in self.callback():
+                self.set(value, *labels)
+        return super().samples()
+
+class Histogram(Metric):
+    type_name = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, *labels):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def value(self, *labels):
+        entry = self._values.get(labels)
+        return {"count": entry[2], "sum": entry[1]} if entry else {"count": 0, "sum": 0.0}
+
+    def samples(self):
+        with self._lock:
+            items = [(labels, list(counts), total, count) for labels, (counts, total, count) in self._values.items()]
+
+        lines = []
+        for labels, counts, total, count in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                bucket_labels = _format_labels(self.labelnames, labels, f'le="{le}"')
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {count}")
+        return lines
+
+class Registry:
+    def __init__(self):
+        self._metrics = {}
+
+    def register(self, metric):
+        self._metrics[metric.name] = metric
+        return metric
+
+    def get(self, name):
+        return self._metrics.get(name)
+
+    def render(self):
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.header())
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+REGISTRY = Registry()
+
+http_requests = REGISTRY.register(Counter(
+    "http_requests_total", "HTTP requests by route template and status code.",
+    ("method", "route", "status")
+))
+http_request_duration = REGISTRY.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template.",
+    ("method", "route")
+))
+http_requests_in_progress = REGISTRY.register(Gauge(
+    "http_requests_in_progress", "HTTP requests currently being served."
+))
+request_sql_statements = REGISTRY.register(Histogram(
+    "http_request_sql_statements", "SQL statements issued per request.",
+    ("method", "route"), buckets=STATEMENT_BUCKETS
+))
+request_sql_duration = REGISTRY.register(Histogram(
+    "http_request_sql_seconds", "Time spent in SQL per request.",
+    ("method", "route")
+))
+sql_statements = REGISTRY.register(Counter(
+    "sql_statements_total", "SQL statements executed by the process."
+))
+sql_duration = REGISTRY.register(Counter(
+    "sql_duration_seconds_total", "Time spent executing SQL statements."
+))
+cache_requests = REGISTRY.register(Counter(
+    "cache_requests_total", "Cache lookups by cache name and result (hit or miss).",
+    ("cache", "result")
+))
+upload_bytes = REGISTRY.register(Counter(
+    "upload_bytes_total", "Bytes received in file uploads by kind.",
+    ("kind",)
+))
+uploads = REGISTRY.register(Counter(
+    "uploads_total", "File uploads received by kind.",
+    ("kind",)
+))
+
+class RequestStats:
+    """SQL activity of the request currently being served."""
+    __slots__ = ("statements", "sql_seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.sql_seconds = 0.0
+
+# Set by MetricsMiddleware; engine events add to it from whichever thread runs the query
+current_request = ContextVar("current_request_stats", default=None)
+
+# Pools of instrumented engines by name, read when the pool gauges are scraped
+_pools = {}
+
+def _pool_stats(method):
+    def collect():
+        return [
+            ((name,), getattr(pool, method)())
+            for name, pool in list(_pools.items())
+            if callable(getattr(pool, method, None))
+        ]
+    return collect
+
+REGISTRY.register(Gauge(
+    "db_pool_checked_out", "Connections currently checked out of the pool.",
+    ("engine",), callback=_pool_stats("checkedout")
+))
+REGISTRY.register(Gauge(
+    "db_pool_overflow", "Connections opened beyond the pool size.",
+    ("engine",), callback=_pool_stats("overflow")
+))
+REGISTRY.register(Gauge(
+    "db_pool_size", "Configured pool size.",
+    ("engine",), callback=_pool_stats("size")
+))
+
+def record_cache(cache, hit):
+    cache_requests.inc(cache, "hit" if hit else "miss")
+
+def record_upload(kind, size):
+    uploads.inc(kind)
+    upload_bytes.inc(kind, amount=size)
+
+def instrument_engine(engine, name="default"):
+    """Count statements and SQL time, and expose the engine's pool as gauges."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+        sql_statements.inc()
+        sql_duration.inc(amount=elapsed)
+        stats = current_request.get()
+        if stats is not None:
+            stats.statements += 1
+            stats.sql_seconds += elapsed
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_start_time"):
+            connection.info["query_start_time"].pop()
+
+    _pools[name] = engine.pool
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording latency and SQL activity per route template."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        root_path = scope.get("root_path", "")
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = RequestStats()
+        token = current_request.set(stats)
+        http_requests_in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_requests_in_progress.dec()
+            current_request.reset(token)
+
+            method = scope["method"]
+            route = route_template(scope, root_path)
+            http_requests.inc(method, route, status_code)
+            http_request_duration.observe(elapsed, method, route)
+            request_sql_statements.observe(stats.statements, method, route)
+            request_sql_duration.observe(stats.sql_seconds, method, route)
+
+def route_template(scope, original_root_path=""):
+    """Return the matched path template, so /api/proposals/{proposal_id} is one label."""
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    mount_path = scope.get("root_path", "")[len(original_root_path):]
+    if mount_path:
+        return f"{mount_path}/*"
+    return "<unmatched>"
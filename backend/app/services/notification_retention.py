@@ -0,0 +1,166 @@
+# backend/app/services/notification_retention.py
+"""
+Notification retention: digest roll-ups, TTL pruning and vacuuming.
+
+Read notifications older than NOTIFICATION_DIGEST_AFTER_DAYS are folded into one
+NotificationDigest row per (related_entity_type, related_entity_id) and deleted.
+Anything older than NOTIFICATION_TTL_DAYS is deleted whether it was read or not,
+and digests whose newest notification is older than NOTIFICATION_DIGEST_TTL_DAYS
+are dropped (0 keeps them forever). Work is done in batches so each write
+transaction holds the SQLite write lock only briefly. Removals are not logged
+for /api/changes: a tombstone per row would grow the change log by as much as
+the notifications table shrinks.
+
+Run it from cron with scripts/notification_retention.py, or in-process by
+setting NOTIFICATION_RETENTION_INTERVAL (seconds) on one worker.
+"""
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, delete, text
+from starlette.concurrency import run_in_threadpool
+
+from ..models.notification import Notification, NotificationDigest
+from .changes import prune_expired_changes
+
+logger = logging.getLogger(__name__)
+
+DIGEST_AFTER_DAYS = int(os.getenv("NOTIFICATION_DIGEST_AFTER_DAYS", "30"))
+TTL_DAYS = int(os.getenv("NOTIFICATION_TTL_DAYS", "180"))
+DIGEST_TTL_DAYS = int(os.getenv("NOTIFICATION_DIGEST_TTL_DAYS", "0"))
+RETENTION_INTERVAL = int(os.getenv("NOTIFICATION_RETENTION_INTERVAL", "0"))
+VACUUM_MIN_ROWS = int(os.getenv("NOTIFICATION_VACUUM_MIN_ROWS", "10000"))
+# Stays below SQLite's historical limit of 999 bound parameters per statement
+BATCH_SIZE = 900
+
+def compact_read_notifications(db, cutoff, batch_size=BATCH_SIZE):
+    """Fold read notifications created before `cutoff` into digests. Returns rows removed."""
+    removed = 0
+    while True:
+        rows = db.execute(
+            select(
+                Notification.id,
+                Notification.related_entity_type,
+                Notification.related_entity_id,
+                Notification.title,
+                Notification.created_date
+            ).where(
+                Notification.is_read == True,
+                Notification.created_date < cutoff
+            ).order_by(Notification.created_date).limit(batch_size)
+        ).all()
+        if not rows:
+            return removed
+
+        groups = {}
+        for row in rows:
+            key = (row.related_entity_type, row.related_entity_id)
+            group = groups.get(key)
+            if group is None:
+                groups[key] = [1, row.title, row.created_date, row.created_date]
+            else:
+                group[0] += 1
+                # Rows arrive oldest first, so the last one seen is the newest
+                group[1] = row.title
+                group[3] = row.created_date
+
+        existing = {}
+        entity_ids = [entity_id for _, entity_id in groups if entity_id is not None]
+        if entity_ids:
+            digests = db.query(NotificationDigest).filter(NotificationDigest.related_entity_id.in_(entity_ids))
+            existing.update(((d.related_entity_type, d.related_entity_id), d) for d in digests)
+        if any(entity_id is None for _, entity_id in groups):
+            digests = db.query(NotificationDigest).filter(NotificationDigest.related_entity_id.is_(None))
+            existing.update(((d.related_entity_type, None), d) for d in digests)
+
+        for key, (count, title, first, last) in groups.items():
+            digest = existing.get(key)
+            if digest is None:
+                db.add(NotificationDigest(
+                    related_entity_type=key[0],
+                    related_entity_id=key[1],
+                    notification_count=count,
+                    latest_title=title,
+                    first_created_date=first,
+                    last_created_date=last,
+                    updated_date=datetime.utcnow()
+                ))
+            else:
+                digest.notification_count += count
+                digest.first_created_date = min(filter(None, [digest.first_created_date, first]))
+                if digest.last_created_date is None or last >= digest.last_created_date:
+                    digest.last_created_date = last
+                    digest.latest_title = title
+                digest.updated_date = datetime.utcnow()
+
+        db.execute(delete(Notification).where(Notification.id.in_([row.id for row in rows])))
+        db.commit()
+        removed += len(rows)
+
+def prune_expired(db, model, date_column, cutoff, batch_size=BATCH_SIZE):
+    """Delete rows of `model` whose `date_column` is before `cutoff`, in batches. Returns rows removed."""
+    removed = 0
+    while True:
+        ids = db.execute(
+            select(model.id).where(date_column < cutoff).limit(batch_size)
+        ).scalars().all()
+        if not ids:
+            return removed
+        db.execute(delete(model).where(model.id.in_(ids)))
+        db.commit()
+        removed += len(ids)
+
+def vacuum(engine):
+    """Return freed pages to the filesystem and refresh planner statistics."""
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        if engine.dialect.name == "sqlite":
+            conn.execute(text("VACUUM"))
+            conn.execute(text("ANALYZE"))
+        else:
+            conn.execute(text(f"VACUUM ANALYZE {Notification.__tablename__}"))
+            conn.execute(text(f"VACUUM ANALYZE {NotificationDigest.__tablename__}"))
+
+def run_retention(db, now=None, vacuum_min_rows=VACUUM_MIN_ROWS):
+    """Apply the whole retention policy once and return what was done."""
+    now = now or datetime.utcnow()
+    stats = {
+        "compacted": compact_read_notifications(db, now - timedelta(days=DIGEST_AFTER_DAYS)),
+        "expired": 0,
+        "expired_digests": 0,
+        "expired_changes": prune_expired_changes(db, now),
+        "vacuumed": False,
+    }
+    if TTL_DAYS > 0:
+        stats["expired"] = prune_expired(
+            db, Notification, Notification.created_date, now - timedelta(days=TTL_DAYS)
+        )
+    if DIGEST_TTL_DAYS > 0:
+        stats["expired_digests"] = prune_expired(
+            db, NotificationDigest, NotificationDigest.last_created_date, now - timedelta(days=DIGEST_TTL_DAYS)
+        )
+
+    removed = stats["compacted"] + stats["expired"] + stats["expired_digests"] + stats["expired_changes"]
+    if removed and removed >= vacuum_min_rows:
+        db.close()
+        vacuum(db.get_bind())
+        stats["vacuumed"] = True
+    return stats
+
+async def retention_loop(session_factory, interval=RETENTION_INTERVAL):
+    """Run the retention policy every `interval` seconds, off the event loop."""
+    def run_once():
+        db = session_factory()
+        try:
+            return run_retention(db)
+        finally:
+            db.close()
+
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            stats = await run_in_threadpool(run_once)
+            logger.info("Notification retention: %s", stats)
+        except Exception:
+            logger.exception("Notification retention failed")
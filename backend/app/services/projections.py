@@ -0,0 +1,81 @@
+# backend/app/services/projections.py
+"""
+Column-projected reads for list endpoints and the main page.
+
+Selecting columns rather than entities returns plain Row tuples: no instances
+are built, nothing enters the identity map and nothing is tracked for changes,
+which is all a response that is serialized straight away needs. Each statement
+names only the columns its response shows and is built once at import;
+endpoints add their filters and paging to it, and SQLAlchemy's compiled cache
+recognizes the result, so a request only binds parameters.
+
+Rows have attribute access, so templates and orm_mode schemas read them like
+entities. Topics come back as dicts so their replies can be attached.
+"""
+from sqlalchemy import bindparam, func, select
+
+from ..models.discussion import DiscussionTopic, DiscussionReply
+from ..models.notification import Notification
+from ..models.proposal import Proposal
+
+# Fields of schemas.proposal.Proposal
+PROPOSAL_LIST = select(
+    Proposal.id, Proposal.symbol, Proposal.sound_name, Proposal.category, Proposal.rationale,
+    Proposal.example_language, Proposal.audio_file, Proposal.image_file,
+    Proposal.submitted_date, Proposal.status, Proposal.votes
+).order_by(Proposal.submitted_date.desc())
+
+# Fields of schemas.notification.Notification
+NOTIFICATION_LIST = select(
+    Notification.id, Notification.title, Notification.message, Notification.related_entity_type,
+    Notification.related_entity_id, Notification.is_read, Notification.created_date
+).order_by(Notification.created_date.desc())
+
+UNREAD_COUNT = select(func.count()).select_from(Notification).where(Notification.is_read == False)
+
+# Fields of schemas.discussion.Topic, without the replies
+TOPIC_LIST = select(
+    DiscussionTopic.id, DiscussionTopic.title, DiscussionTopic.content, DiscussionTopic.author_name,
+    DiscussionTopic.author_email, DiscussionTopic.created_date, DiscussionTopic.reply_count,
+    DiscussionTopic.last_reply_at
+).order_by(DiscussionTopic.created_date.desc())
+
+# Fields of schemas.discussion.TopicSummary
+TOPIC_SUMMARIES = select(
+    DiscussionTopic.id, DiscussionTopic.title, DiscussionTopic.author_name, DiscussionTopic.created_date,
+    DiscussionTopic.reply_count, DiscussionTopic.last_reply_at
+).order_by(DiscussionTopic.created_date.desc())
+
+# Fields of schemas.discussion.Reply
+REPLY_LIST = select(
+    DiscussionReply.id, DiscussionReply.topic_id, DiscussionReply.content, DiscussionReply.author_name,
+    DiscussionReply.created_date
+)
+
+REPLIES_OF_TOPICS = REPLY_LIST.where(
+    DiscussionReply.topic_id.in_(bindparam("topic_ids", expanding=True))
+).order_by(DiscussionReply.created_date, DiscussionReply.id)
+
+# The main page: the columns index.html shows
+INDEX_PROPOSALS = select(
+    Proposal.id, Proposal.symbol, Proposal.sound_name, Proposal.category, Proposal.rationale,
+    Proposal.example_language, Proposal.image_file, Proposal.submitted_date, Proposal.status, Proposal.votes
+).order_by(Proposal.submitted_date.desc())
+
+INDEX_TOPICS = select(
+    DiscussionTopic.id, DiscussionTopic.title, DiscussionTopic.content, DiscussionTopic.author_name,
+    DiscussionTopic.created_date
+).order_by(DiscussionTopic.created_date.desc())
+
+# Topic ids per replies query, as selectinload batches them
+IN_BATCH_SIZE = 500
+
+def with_replies(db, topics):
+    """Topic rows as dicts with their replies attached, one query per IN_BATCH_SIZE topics."""
+    topics = [dict(row._mapping, replies=[]) for row in topics]
+    by_id = {topic["id"]: topic for topic in topics}
+    ids = list(by_id)
+    for start in range(0, len(ids), IN_BATCH_SIZE):
+        for reply in db.execute(REPLIES_OF_TOPICS, {"topic_ids": ids[start:start + IN_BATCH_SIZE]}):
+            by_id[reply.topic_id]["replies"].append(reply)
+    return topics
@@ -0,0 +1,60 @@
+# backend/app/services/proposal_tasks.py
+"""
+Background job handlers for proposal side effects.
+"""
+import os
+import uuid
+from datetime import datetime
+
+from sqlalchemy import select
+
+from ..models.notification import Notification
+from ..models.proposal import Proposal
+from .jobs import job_handler
+
+@job_handler("delete_files")
+def delete_files(db, payload):
+    """Remove files left behind by a deleted row; missing files are not an error."""
+    for path in payload.get("paths", []):
+        if os.path.exists(path):
+            os.remove(path)
+
+@job_handler("proposal_status_notification")
+def notify_proposal_status(db, payload):
+    """Create a notification announcing a moderation decision."""
+    proposal = db.get(Proposal, uuid.UUID(payload["proposal_id"]))
+    if proposal is None:
+        return
+    
+    status = payload["status"]
+    db.add(Notification(
+        id=uuid.uuid4(),
+        title=f"Proposal {status}",
+        message=f"The proposal for {proposal.symbol} ({proposal.sound_name}) is now {status}.",
+        related_entity_type="proposal",
+        related_entity_id=proposal.id,
+        is_read=False,
+        created_date=datetime.utcnow()
+    ))
+
+@job_handler("proposal_status_notifications")
+def notify_proposal_statuses(db, payload):
+    """Create the notifications for a bulk moderation decision."""
+    ids = [uuid.UUID(proposal_id) for proposal_id in payload["proposal_ids"]]
+    status = payload["status"]
+    now = datetime.utcnow()
+    proposals = db.execute(
+        select(Proposal.id, Proposal.symbol, Proposal.sound_name).where(Proposal.id.in_(ids))
+    ).all()
+    db.add_all([
+        Notification(
+            id=uuid.uuid4(),
+            title=f"Proposal {status}",
+            message=f"The proposal for {proposal.symbol} ({proposal.sound_name}) is now {status}.",
+            related_entity_type="proposal",
+            related_entity_id=proposal.id,
+            is_read=False,
+            created_date=now
+        )
+        for proposal in proposals
+    ])
@@ -0,0 +1,120 @@
+# backend/app/services/replica.py
+"""
+In-memory read replica of the SQLite database.
+
+With READ_REPLICA=true, routes that only read take their session from
+get_read_db, which is bound to an in-memory copy of ipa_symbols.db made with the
+SQLite backup API. Readers then never wait on the database file's locks while a
+write is committing, and never hold a lock a writer needs.
+
+The copy is refreshed lazily: opening a read connection compares the generation
+counters of the replicated tables (see app.services.invalidation) with the ones
+the copy was taken at, by this process or another one, or by the import
+scripts. A copy of the whole database is taken at most once per
+READ_REPLICA_MAX_LAG_MS; in between, and while one is being taken, readers keep
+getting the previous copy. A reader therefore sees every write committed at
+least READ_REPLICA_MAX_LAG_MS (plus the time a copy takes) before its first
+query, and possibly later ones; values computed while the copy lags are not
+kept by the generation caches (see invalidation.reads_lagging). A copy is replaced, never modified, so sessions
+already reading from the previous copy keep a consistent snapshot until they
+close; a long one, such as a streamed export, keeps that copy in memory until
+then.
+
+Tables not read through the replica (the job queue, and the change log, which
+/api/changes reads from the database itself) are not watched, so their churn
+does not force copies.
+"""
+import itertools
+import os
+import sqlite3
+import threading
+import time
+
+from .invalidation import generation, register_lag_check
+from .metrics import REGISTRY, Counter
+
+READ_REPLICA = os.getenv("READ_REPLICA", "false").lower() == "true"
+MAX_LAG = float(os.getenv("READ_REPLICA_MAX_LAG_MS", "1000")) / 1000
+IGNORED_TABLES = {"background_jobs", "schema_versions", "changes"}
+
+refreshes = REGISTRY.register(Counter(
+    "read_replica_refreshes_total", "Copies of the database taken for the in-memory read replica."
+))
+refresh_seconds = REGISTRY.register(Counter(
+    "read_replica_refresh_seconds_total", "Time spent copying the database for the read replica."
+))
+
+class ReadReplica:
+    """Current in-memory copy of a SQLite engine's database, per process."""
+
+    def __init__(self, source, metadata):
+        self.source = source
+        self.metadata = metadata
+        self._names = itertools.count(1)
+        # _lock guards the current copy, _copy_lock is held while taking a new one
+        self._lock = threading.Lock()
+        self._copy_lock = threading.Lock()
+        self._copied_at = None
+        register_lag_check(self.lagging)
+        self._uri = None
+        # Keeps the current copy alive while no session has it open
+        self._anchor = None
+        self._token = None
+
+    def token(self):
+        tables = sorted(set(self.metadata.tables) - IGNORED_TABLES)
+        return tuple(generation(table) for table in tables)
+
+    def lagging(self):
+        """True while the copy misses writes the generation counters know of."""
+        return self._token != self.token()
+
+    def refresh(self):
+        """Replace the copy now if a watched table changed since it was taken."""
+        with self._copy_lock:
+            self._refresh(self.token())
+
+    def _refresh(self, token):
+        # Called with _copy_lock held
+        if token == self._token:
+            return
+        started = time.perf_counter()
+        uri = f"file:ipa_replica_{os.getpid()}_{next(self._names)}?mode=memory&cache=shared"
+        anchor = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        source = self.source.raw_connection()
+        try:
+            source.driver_connection.backup(anchor)
+        finally:
+            source.close()
+
+        with self._lock:
+            previous = self._anchor
+            self._uri, self._anchor, self._token = uri, anchor, token
+            self._copied_at = started
+            if previous is not None:
+                # The old copy is freed once the last session reading it closes
+                previous.close()
+        refreshes.inc()
+        refresh_seconds.inc(amount=time.perf_counter() - started)
+
+    def _due(self, token):
+        return token != self._token and (
+            self._copied_at is None or time.perf_counter() - self._copied_at >= MAX_LAG
+        )
+
+    def connect(self):
+        """DBAPI connection to the current copy; the creator of the read engine."""
+        token = self.token()
+        if self._due(token):
+            # Only the first reader waits for a copy; later ones use the previous one meanwhile
+            if self._copy_lock.acquire(blocking=self._uri is None):
+                try:
+                    if self._due(token):
+                        self._refresh(token)
+                finally:
+                    self._copy_lock.release()
+        with self._lock:
+            # Opened under the lock so the copy cannot be dropped in between
+            connection = sqlite3.connect(self._uri, uri=True, check_same_thread=False)
+        connection.execute("PRAGMA query_only = ON")
+        return connection
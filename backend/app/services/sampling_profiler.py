@@ -0,0 +1,264 @@
+# backend/app/services/sampling_profiler.py
+"""
+Opt-in statistical profiler for production requests.
+
+A fraction of requests (PROFILE_SAMPLE_RATE), and requests sent with an
+`X-Profile: <PROFILE_TOKEN>` header, are profiled: while they run, a background
+thread wakes every PROFILE_INTERVAL_MS, takes the stack of every thread with
+sys._current_frames() and counts the stacks that belong to a profiled request.
+Nothing is traced, so the cost is a few stack walks per interval while a
+profiled request is in flight and nothing otherwise.
+
+A stack belongs to a request when it runs inside the request's coroutine (the
+ProfilerMiddleware frame holding the profile is on the stack) or inside a
+threadpool call made on its behalf. Threadpool workers run each call in a copy
+of the caller's contextvars.Context, which the sampler finds among the
+worker's outermost frame locals and looks the profile up in.
+
+Samples are kept as folded stacks ("outer;inner;leaf count"), the input format
+of flamegraph.pl and speedscope. The PROFILE_TOP_N slowest profiles and the
+PROFILE_HISTORY most recent ones are served by /api/debug/profiles.
+"""
+import contextvars
+import heapq
+import itertools
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter as Tally, deque
+
+from .metrics import REGISTRY, Counter, route_template
+
+SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_TOKEN = os.getenv("PROFILE_TOKEN", "")
+INTERVAL = float(os.getenv("PROFILE_INTERVAL_MS", "5")) / 1000
+TOP_N = int(os.getenv("PROFILE_TOP_N", "20"))
+HISTORY_SIZE = int(os.getenv("PROFILE_HISTORY", "50"))
+PROFILER_ENABLED = SAMPLE_RATE > 0 or bool(PROFILE_TOKEN)
+
+PROFILE_HEADER = b"x-profile"
+# How many of a thread's outermost frames are searched for a copied Context
+CONTEXT_SEARCH_DEPTH = 8
+
+profiled_requests = REGISTRY.register(Counter(
+    "profiled_requests_total", "Requests profiled by the sampling profiler, by trigger.", ("trigger",)
+))
+
+current_profile = contextvars.ContextVar("current_sampling_profile", default=None)
+
+def frame_name(code, module):
+    return f"{module}:{getattr(code, 'co_qualname', code.co_name)}"
+
+class RequestProfile:
+    """Folded stacks sampled while serving one request."""
+
+    def __init__(self, method, path):
+        self.id = uuid.uuid4().hex[:12]
+        self.method = method
+        self.path = path
+        self.route = path
+        self.status = 500
+        self.started = time.perf_counter()
+        self.timestamp = time.time()
+        self.duration = None
+        self.stacks = Tally()
+
+    @property
+    def samples(self):
+        return sum(self.stacks.values())
+
+    def folded(self):
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def hotspots(self, limit=10):
+        """Frames with the most samples on top of the stack (self) and anywhere in it (total)."""
+        leaf = Tally()
+        total = Tally()
+        for stack, count in self.stacks.items():
+            frames = stack.split(";")
+            leaf[frames[-1]] += count
+            for name in set(frames):
+                total[name] += count
+        return {
+            "self": [{"frame": name, "samples": count} for name, count in leaf.most_common(limit)],
+            "total": [{"frame": name, "samples": count} for name, count in total.most_common(limit)],
+        }
+
+    def summary(self):
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "route": self.route,
+            "status": self.status,
+            "duration_ms": round((self.duration or 0) * 1000, 3),
+            "samples": self.samples,
+            "interval_ms": INTERVAL * 1000,
+            "timestamp": self.timestamp,
+        }
+
+class Sampler:
+    """Background thread sampling the stacks of the requests being profiled."""
+
+    def __init__(self, interval=INTERVAL):
+        self.interval = interval
+        self.active = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def start(self, profile):
+        with self._lock:
+            self.active.add(profile)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+                self._thread.start()
+        self._wake.set()
+
+    def stop(self, profile):
+        with self._lock:
+            self.active.discard(profile)
+            if not self.active:
+                self._wake.clear()
+
+    def _run(self):
+        own = threading.get_ident()
+        while True:
+            self._wake.wait()
+            time.sleep(self.interval)
+            # Held for the sweep, so a stopped profile gets no more samples
+            with self._lock:
+                if not self.active:
+                    continue
+                for thread_id, frame in sys._current_frames().items():
+                    if thread_id != own:
+                        self.sample(frame, self.active)
+
+    def sample(self, frame, active):
+        """Count the stack ending in `frame` if it runs for one of the `active` profiles."""
+        stack = []
+        while frame is not None:
+            stack.append(frame)
+            frame = frame.f_back
+        stack.reverse()
+
+        profile, start = self.owner(stack, active)
+        if profile is None:
+            return
+        names = [frame_name(frame.f_code, frame.f_globals.get("__name__", "?")) for frame in stack[start:]]
+        if names:
+            profile.stacks[";".join(names)] += 1
+
+    def owner(self, stack, active):
+        """The profile a stack (outermost frame first) runs for, and where its part of the stack starts."""
+        for index, frame in enumerate(stack):
+            if frame.f_code is _MIDDLEWARE_CODE:
+                profile = frame.f_locals.get("profile")
+                if profile in active:
+                    return profile, index + 1
+            elif index < CONTEXT_SEARCH_DEPTH:
+                for value in frame.f_locals.values():
+                    if isinstance(value, contextvars.Context):
+                        profile = value.get(current_profile)
+                        # An idle worker still holds the context of its last call
+                        if profile in active and not _is_idle(stack, index):
+                            return profile, index + 1
+        return None, None
+
+def _is_idle(stack, index):
+    # Waiting for work, or handing a result back to the event loop
+    if index + 1 >= len(stack):
+        return True
+    module = stack[index + 1].f_globals.get("__name__", "")
+    return module == "queue" or module.startswith("asyncio")
+
+sampler = Sampler()
+
+_order = itertools.count()
+_slowest = []
+recent = deque(maxlen=HISTORY_SIZE)
+_store_lock = threading.Lock()
+
+def keep(profile):
+    """Add a finished profile to the recent history and, if slow enough, the slowest TOP_N."""
+    with _store_lock:
+        recent.append(profile)
+        entry = (profile.duration, next(_order), profile)
+        if len(_slowest) < TOP_N:
+            heapq.heappush(_slowest, entry)
+        elif entry > _slowest[0]:
+            heapq.heapreplace(_slowest, entry)
+
+def profiles(order="slowest", route=None, limit=20):
+    with _store_lock:
+        if order == "recent":
+            selected = list(reversed(recent))
+        else:
+            selected = [entry[2] for entry in sorted(_slowest, reverse=True)]
+    if route:
+        selected = [profile for profile in selected if profile.route == route]
+    return selected[:limit]
+
+def get_profile(profile_id):
+    with _store_lock:
+        for profile in itertools.chain((entry[2] for entry in _slowest), recent):
+            if profile.id == profile_id:
+                return profile
+    return None
+
+def merged_folded(selected):
+    """Folded stacks of several profiles added together, e.g. all kept profiles of one route."""
+    stacks = Tally()
+    for profile in selected:
+        stacks.update(profile.stacks)
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+def trigger(scope):
+    """Why a request should be profiled ("header" or "sampled"), or None."""
+    if PROFILE_TOKEN:
+        for name, value in scope.get("headers", []):
+            if name == PROFILE_HEADER and value.decode("latin-1") == PROFILE_TOKEN:
+                return "header"
+    if SAMPLE_RATE > 0 and random.random() < SAMPLE_RATE:
+        return "sampled"
+    return None
+
+class ProfilerMiddleware:
+    """Pure ASGI middleware profiling sampled requests and naming the profile in X-Profile-Id."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        reason = trigger(scope) if scope["type"] == "http" else None
+        if reason is None:
+            await self.app(scope, receive, send)
+            return
+
+        profiled_requests.inc(reason)
+        profile = RequestProfile(scope["method"], scope["path"])
+        root_path = scope.get("root_path", "")
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                profile.status = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"x-profile-id", profile.id.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        token = current_profile.set(profile)
+        sampler.start(profile)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            sampler.stop(profile)
+            current_profile.reset(token)
+            profile.duration = time.perf_counter() - profile.started
+            profile.route = route_template(scope, root_path)
+            keep(profile)
+
+_MIDDLEWARE_CODE = ProfilerMiddleware.__call__.__code__
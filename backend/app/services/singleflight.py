@@ -0,0 +1,54 @@
+# backend/app/services/singleflight.py
+"""
+Single-flight coalescing of identical concurrent computations.
+
+    html = await single_flight.run(("index", generation(...)), render_index)
+
+The first caller for a key starts `function` in the threadpool; callers that
+arrive with the same key while it runs await the same result instead of
+repeating the queries. Nothing is cached: once the call finishes the next
+caller computes afresh. Keys should include the generation of the tables the
+result is built from (see app.services.invalidation), so a request that starts
+after a write never receives a result computed before it.
+
+The computation runs as its own task and must open its own database session:
+it outlives the caller that started it if that client disconnects.
+"""
+import asyncio
+
+from starlette.concurrency import run_in_threadpool
+
+from .metrics import REGISTRY, Counter
+
+coalesced_requests = REGISTRY.register(Counter(
+    "singleflight_requests_total", "Single-flight calls by name and whether they shared a running call.",
+    ("name", "result")
+))
+
+class SingleFlight:
+    """In-flight calls of one event loop, by key."""
+
+    def __init__(self):
+        self._calls = {}
+
+    async def run(self, key, function, *args):
+        name = key[0] if isinstance(key, tuple) else key
+        task = self._calls.get(key)
+        if task is None:
+            coalesced_requests.inc(name, "leader")
+            task = asyncio.ensure_future(run_in_threadpool(function, *args))
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            coalesced_requests.inc(name, "shared")
+        # A cancelled caller must not cancel the computation the others wait for
+        return await asyncio.shield(task)
+
+    def _forget(self, key, task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+    def in_flight(self):
+        return len(self._calls)
+
+single_flight = SingleFlight()
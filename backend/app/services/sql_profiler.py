@@ -0,0 +1,185 @@
+# backend/app/services/sql_profiler.py
+"""
+Opt-in per-request SQL profiler and N+1 detector (SQL_DEBUG=true).
+
+Every statement issued while a request is served is recorded and grouped by
+shape, i.e. the SQL text with whitespace and expanded IN lists normalized. A
+shape repeated SQL_N_PLUS_ONE_THRESHOLD times or more in one request is flagged
+as a probable N+1 pattern, typically a lazy relationship such as
+Phoneme.allophones or DiscussionTopic.replies loaded inside a loop.
+
+The summary is returned in X-SQL-* response headers and kept in a bounded
+history served by /api/debug/sql. Statements slower than SQL_SLOW_QUERY_MS are
+logged together with their query plan.
+"""
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+from collections import deque
+from contextvars import ContextVar
+
+from sqlalchemy import event
+
+from .metrics import route_template
+
+logger = logging.getLogger(__name__)
+
+SQL_DEBUG = os.getenv("SQL_DEBUG", "false").lower() == "true"
+N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "5"))
+SLOW_QUERY_MS = float(os.getenv("SQL_SLOW_QUERY_MS", "100"))
+HISTORY_SIZE = int(os.getenv("SQL_DEBUG_HISTORY", "100"))
+
+_WHITESPACE = re.compile(r"\s+")
+_IN_LIST = re.compile(r"\((?:\s*(?:\?|%\(\w+\)s|:\w+|__\[POSTCOMPILE_\w+\])\s*,?)+\)")
+
+def statement_shape(statement):
+    """Normalize a statement so repeated executions with other parameters group together."""
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    return _IN_LIST.sub("(?)", shape)
+
+class RequestProfile:
+    """Statements recorded while serving one request."""
+
+    def __init__(self):
+        self.id = uuid.uuid4().hex[:12]
+        self.statements = []
+        self._lock = threading.Lock()
+
+    def record(self, statement, duration):
+        with self._lock:
+            self.statements.append((statement, duration))
+
+    def summary(self):
+        shapes = {}
+        for statement, duration in self.statements:
+            shape = shapes.setdefault(statement_shape(statement), [0, 0.0])
+            shape[0] += 1
+            shape[1] += duration
+
+        grouped = sorted(
+            (
+                {"statement": shape, "count": count, "total_ms": round(total * 1000, 3)}
+                for shape, (count, total) in shapes.items()
+            ),
+            key=lambda entry: (entry["count"], entry["total_ms"]),
+            reverse=True
+        )
+        return {
+            "id": self.id,
+            "statements": len(self.statements),
+            "sql_ms": round(sum(duration for _, duration in self.statements) * 1000, 3),
+            "shapes": grouped,
+            "n_plus_one": [entry for entry in grouped if entry["count"] >= N_PLUS_ONE_THRESHOLD],
+        }
+
+current_profile = ContextVar("current_sql_profile", default=None)
+history = deque(maxlen=HISTORY_SIZE)
+
+def explain(cursor, statement, parameters, dialect_name):
+    """Return the query plan of a statement using a fresh DBAPI cursor (no engine events)."""
+    prefix = "EXPLAIN QUERY PLAN " if dialect_name == "sqlite" else "EXPLAIN "
+    plan_cursor = cursor.connection.cursor()
+    try:
+        plan_cursor.execute(prefix + statement, parameters)
+        return [" | ".join(str(column) for column in row) for row in plan_cursor.fetchall()]
+    except Exception as e:
+        return [f"plan unavailable: {e}"]
+    finally:
+        plan_cursor.close()
+
+def instrument_engine(engine):
+    """Record statements into the current request profile and log slow queries with their plan."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("profiler_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - conn.info["profiler_start_time"].pop()
+        profile = current_profile.get()
+        if profile is not None:
+            profile.record(statement, duration)
+
+        if duration * 1000 >= SLOW_QUERY_MS and not executemany and statement.lstrip().upper().startswith("SELECT"):
+            plan = explain(cursor, statement, parameters, conn.dialect.name)
+            logger.warning(
+                "Slow query (%.1f ms): %s\nParameters: %r\nPlan:\n  %s",
+                duration * 1000, statement_shape(statement), parameters, "\n  ".join(plan)
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("profiler_start_time"):
+            connection.info["profiler_start_time"].pop()
+
+class SQLProfilerMiddleware:
+    """Pure ASGI middleware attaching a SQL profile to each request and reporting it in headers."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile()
+        token = current_profile.set(profile)
+        root_path = scope.get("root_path", "")
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                summary = profile.summary()
+                headers = list(message.get("headers", []))
+                headers.extend([
+                    (b"x-sql-debug-id", profile.id.encode()),
+                    (b"x-sql-query-count", str(summary["statements"]).encode()),
+                    (b"x-sql-time-ms", str(summary["sql_ms"]).encode()),
+                    (b"x-sql-n-plus-one", str(len(summary["n_plus_one"])).encode()),
+                ])
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_profile.reset(token)
+            summary = profile.summary()
+            summary.update({
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": route_template(scope, root_path),
+                "status": status_code,
+                "timestamp": time.time(),
+            })
+            history.append(summary)
+
+            for entry in summary["n_plus_one"]:
+                logger.warning(
+                    "Possible N+1 in %s %s: %d x %s",
+                    summary["method"], summary["route"], entry["count"], entry["statement"]
+                )
+
+def recent_profiles(limit=20, n_plus_one_only=False, route=None):
+    """Return the most recent request summaries, newest first."""
+    profiles = list(history)
+    profiles.reverse()
+    if n_plus_one_only:
+        profiles = [profile for profile in profiles if profile["n_plus_one"]]
+    if route:
+        profiles = [profile for profile in profiles if profile["route"] == route]
+    return profiles[:limit]
+
+def get_profile(profile_id):
+    for profile in history:
+        if profile["id"] == profile_id:
+            return profile
+    return None
@@ -0,0 +1,322 @@
+# backend/benchmarks/loadtest.py
+"""
+HTTP load test against a local uvicorn serving a seeded benchmark database.
+
+Starts `uvicorn app.main:app` on the database created by benchmarks/seed.py,
+drives a weighted mix of requests at a fixed concurrency and writes throughput
+and p50/p95/p99 latency per scenario as JSON, so two releases can be compared.
+
+Usage:
+    python benchmarks/seed.py --database benchmarks/bench.db --scale 0.1
+    python benchmarks/loadtest.py --database benchmarks/bench.db --concurrency 32 \\
+        --duration 60 --output results/1.1.0.json
+    python benchmarks/loadtest.py --database benchmarks/bench.db --compare results/1.1.0.json
+    python benchmarks/loadtest.py --url http://staging:8000 --database benchmarks/bench.db
+"""
+import argparse
+import http.client
+import json
+import os
+import platform
+import random
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlsplit
+
+current_dir = Path(__file__).resolve().parent
+backend_dir = current_dir.parent
+
+DEFAULT_DATABASE = current_dir / "bench.db"
+
+# name: (weight, method, path template)
+SCENARIOS = {
+    "root": (5, "GET", "/"),
+    "languages": (5, "GET", "/api/languages"),
+    "extended_phonemes": (20, "GET", "/api/languages/{lang_code}/extended-phonemes"),
+    "impossible_phonemes": (5, "GET", "/api/languages/{lang_code}/impossible-phonemes"),
+    "proposals": (5, "GET", "/api/proposals?status=pending&category={category}"),
+    "proposal": (15, "GET", "/api/proposals/{proposal_id}"),
+    "vote": (10, "PUT", "/api/proposals/{proposal_id}/vote?vote={vote}"),
+    "discussions": (10, "GET", "/api/discussions?skip={skip}&limit=10"),
+    "discussion": (10, "GET", "/api/discussions/{topic_id}"),
+    "reply": (3, "POST", "/api/discussions/{topic_id}/replies"),
+    "notifications": (2, "GET", "/api/notifications?is_read=false"),
+}
+
+def load_fixtures(database, sample_size=2000):
+    """Sample real ids from the seeded database so requests hit existing rows."""
+    conn = sqlite3.connect(database)
+    try:
+        def sample(query):
+            return [row[0] for row in conn.execute(query, (sample_size,))]
+
+        return {
+            "lang_code": sample("SELECT code FROM languages ORDER BY random() LIMIT ?"),
+            "proposal_id": sample("SELECT id FROM proposals ORDER BY random() LIMIT ?"),
+            "topic_id": sample("SELECT id FROM discussion_topics ORDER BY random() LIMIT ?"),
+            "category": sample("SELECT DISTINCT category FROM proposals LIMIT ?"),
+        }
+    finally:
+        conn.close()
+
+def build_request(name, fixtures, rng):
+    _, method, template = SCENARIOS[name]
+    path = template.format(
+        lang_code=rng.choice(fixtures["lang_code"]),
+        proposal_id=rng.choice(fixtures["proposal_id"]),
+        topic_id=rng.choice(fixtures["topic_id"]),
+        category=rng.choice(fixtures["category"]),
+        vote=rng.choice((1, -1)),
+        skip=rng.randrange(0, 200, 10),
+    )
+    body = None
+    if name == "reply":
+        body = json.dumps({"content": f"load test reply {uuid.uuid4()}", "author_name": "loadtest"})
+    return method, path, body
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def summarize(latencies, errors, elapsed):
+    values = sorted(latencies)
+    return {
+        "requests": len(values),
+        "errors": errors,
+        "throughput_rps": round(len(values) / elapsed, 2) if elapsed else 0,
+        "p50_ms": _ms(percentile(values, 0.50)),
+        "p95_ms": _ms(percentile(values, 0.95)),
+        "p99_ms": _ms(percentile(values, 0.99)),
+        "max_ms": _ms(values[-1] if values else None),
+    }
+
+def _ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 2)
+
+class LoadTest:
+    def __init__(self, base_url, fixtures, weights, concurrency, duration, warmup, timeout):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.fixtures = fixtures
+        self.names = list(weights)
+        self.weights = [weights[name] for name in self.names]
+        self.concurrency = concurrency
+        self.duration = duration
+        self.warmup = warmup
+        self.timeout = timeout
+        self.results = {name: ([], [0]) for name in self.names}
+        self.lock = threading.Lock()
+        self.error_samples = {}
+
+    def record_error(self, name, error):
+        with self.lock:
+            samples = self.error_samples.setdefault(name, {})
+            samples[error] = samples.get(error, 0) + 1
+
+    def worker(self, worker_id, start_at, record_from, stop_at):
+        rng = random.Random(worker_id)
+        conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        local = {name: ([], [0]) for name in self.names}
+
+        while time.perf_counter() < start_at:
+            time.sleep(0.001)
+
+        while True:
+            now = time.perf_counter()
+            if now >= stop_at:
+                break
+            name = rng.choices(self.names, self.weights)[0]
+            method, path, body = build_request(name, self.fixtures, rng)
+            headers = {"Content-Type": "application/json"} if body else {}
+            began = time.perf_counter()
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+                response.read()
+                ok = response.status < 400
+                error = None if ok else f"HTTP {response.status}"
+                if response.will_close or response.status >= 500:
+                    # uvicorn drops the connection after an unhandled exception
+                    conn.close()
+            except (OSError, http.client.HTTPException) as e:
+                ok = False
+                error = f"{type(e).__name__}: {e}"
+                conn.close()
+                conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            latency = time.perf_counter() - began
+
+            if began >= record_from:
+                latencies, errors = local[name]
+                if ok:
+                    latencies.append(latency)
+                else:
+                    errors[0] += 1
+                    self.record_error(name, error)
+
+        conn.close()
+        with self.lock:
+            for name, (latencies, errors) in local.items():
+                self.results[name][0].extend(latencies)
+                self.results[name][1][0] += errors[0]
+
+    def run(self):
+        start_at = time.perf_counter() + 0.5
+        record_from = start_at + self.warmup
+        stop_at = record_from + self.duration
+        threads = [
+            threading.Thread(target=self.worker, args=(index, start_at, record_from, stop_at), daemon=True)
+            for index in range(self.concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        scenarios = {
+            name: summarize(latencies, errors[0], self.duration)
+            for name, (latencies, errors) in self.results.items()
+        }
+        all_latencies = [value for latencies, _ in self.results.values() for value in latencies]
+        all_errors = sum(errors[0] for _, errors in self.results.values())
+        return {
+            "overall": summarize(all_latencies, all_errors, self.duration),
+            "scenarios": scenarios,
+            "errors": self.error_samples,
+        }
+
+def start_server(database, port, workers):
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{Path(database).resolve()}")
+    # Every simulated user shares one address; keep the per-client write limit out of the numbers
+    env.setdefault("ADMISSION_WRITE_RATE", "0")
+    command = [
+        sys.executable, "-m", "uvicorn", "app.main:app",
+        "--host", "127.0.0.1", "--port", str(port),
+        "--workers", str(workers), "--log-level", "warning",
+    ]
+    process = subprocess.Popen(command, cwd=str(backend_dir), env=env)
+
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("uvicorn exited before becoming ready")
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+            conn.request("GET", "/api/languages")
+            conn.getresponse().read()
+            conn.close()
+            return process
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("uvicorn did not become ready within 60s")
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=str(backend_dir), capture_output=True, text=True
+        ).stdout.strip() or None
+    except OSError:
+        return None
+
+def compare(report, baseline):
+    """Print throughput and p95 change per scenario relative to a previous report."""
+    print(f"\n{'scenario':<22} {'rps':>10} {'Δ rps':>9} {'p95 ms':>10} {'Δ p95':>9}")
+    rows = [("overall", report["overall"], baseline.get("overall", {}))]
+    rows += [
+        (name, result, baseline.get("scenarios", {}).get(name, {}))
+        for name, result in report["scenarios"].items()
+    ]
+    for name, result, previous in rows:
+        print(
+            f"{name:<22} {result['throughput_rps']:>10} {_delta(result['throughput_rps'], previous.get('throughput_rps')):>9} "
+            f"{result['p95_ms'] or '-':>10} {_delta(result['p95_ms'], previous.get('p95_ms')):>9}"
+        )
+
+def _delta(value, previous):
+    if not value or not previous:
+        return "-"
+    return f"{(value - previous) / previous * 100:+.1f}%"
+
+def parse_weights(overrides):
+    weights = {name: weight for name, (weight, _, _) in SCENARIOS.items()}
+    for override in overrides:
+        name, _, weight = override.partition("=")
+        if name not in SCENARIOS:
+            raise SystemExit(f"Unknown scenario '{name}'. Choose from: {', '.join(SCENARIOS)}")
+        weights[name] = float(weight)
+    return {name: weight for name, weight in weights.items() if weight > 0}
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the API against a seeded database.")
+    parser.add_argument("--database", default=str(DEFAULT_DATABASE), help="Database created by benchmarks/seed.py")
+    parser.add_argument("--url", help="Test an already running server instead of starting uvicorn")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent client connections")
+    parser.add_argument("--duration", type=float, default=30, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=5, help="Unmeasured seconds before the run")
+    parser.add_argument("--timeout", type=float, default=30, help="Per-request timeout in seconds")
+    parser.add_argument("--scenario", action="append", default=[], metavar="NAME=WEIGHT",
+                        help="Override a scenario weight (0 disables it); repeatable")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--compare", help="Previous JSON report to compare against")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.database):
+        raise SystemExit(f"{args.database} not found. Run benchmarks/seed.py first.")
+
+    weights = parse_weights(args.scenario)
+    fixtures = load_fixtures(args.database)
+    server = None
+    base_url = args.url
+    if base_url is None:
+        server = start_server(args.database, args.port, args.workers)
+        base_url = f"http://127.0.0.1:{args.port}"
+
+    try:
+        print(f"Running {args.duration:.0f}s at concurrency {args.concurrency} against {base_url}...")
+        results = LoadTest(
+            base_url, fixtures, weights, args.concurrency, args.duration, args.warmup, args.timeout
+        ).run()
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    report = {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "database": os.path.basename(args.database),
+        "concurrency": args.concurrency,
+        "duration_s": args.duration,
+        "workers": args.workers,
+        "weights": weights,
+        **results,
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            f.write(output)
+        print(f"Report written to {args.output}")
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(report, json.load(f))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+# backend/benchmarks/seed.py
+"""
+Seed a synthetic database for load testing.
+
+The defaults describe the large-scale dataset we benchmark releases against:
+50 languages x 500 phonemes (with allophones), 100k proposals, 1M notifications
+and 50k discussion topics. Use --scale to shrink or grow every count at once.
+
+Usage:
+    python benchmarks/seed.py --database benchmarks/bench.db
+    python benchmarks/seed.py --database /tmp/small.db --scale 0.01
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import bindparam, create_engine, event, insert, update
+
+# Add the parent directory to the Python path
+current_dir = Path(__file__).resolve().parent
+backend_dir = current_dir.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.migrations import migrate
+from app.models import (
+    Language, Phoneme, PhonemeType, Allophone, Proposal,
+    DiscussionTopic, DiscussionReply, Notification
+)
+
+DEFAULT_DATABASE = current_dir / "bench.db"
+BATCH_SIZE = 10000
+
+CONSONANT_ROWS = 10
+CONSONANT_COLUMNS = 28
+VOWEL_ROWS = 4
+VOWEL_COLUMNS = 6
+SYMBOLS = [chr(code) for code in range(0x0250, 0x02B0)] + [chr(code) for code in range(0x1D00, 0x1D80)]
+WORDS = (
+    "voiced voiceless bilabial dental alveolar retroflex palatal velar uvular "
+    "glottal nasal plosive fricative trill flap approximant lateral rounded "
+    "unrounded close open mid front back central creaky breathy"
+).split()
+STATUSES = ["pending", "approved", "rejected"]
+CATEGORIES = ["consonant", "vowel", "diacritic", "suprasegmental"]
+ENTITY_TYPES = ["proposal", "discussion"]
+
+def words(rng, count):
+    return " ".join(rng.choice(WORDS) for _ in range(count))
+
+def random_date(rng, start, days):
+    return start + timedelta(seconds=rng.randrange(days * 86400))
+
+def insert_rows(conn, model, rows):
+    """Insert an iterable of dicts in executemany batches and return the row count."""
+    total = 0
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            conn.execute(insert(model), batch)
+            total += len(batch)
+            batch = []
+    if batch:
+        conn.execute(insert(model), batch)
+        total += len(batch)
+    return total
+
+def seed(database, languages=50, phonemes=500, allophones=2, proposals=100000,
+         notifications=1000000, topics=50000, replies=4, seed_value=42):
+    """Create a fresh database at `database` filled with synthetic data."""
+    rng = random.Random(seed_value)
+    start = datetime.utcnow() - timedelta(days=3 * 365)
+
+    if os.path.exists(database):
+        os.remove(database)
+
+    engine = create_engine(f"sqlite:///{database}")
+
+    @event.listens_for(engine, "connect")
+    def fast_pragmas(dbapi_connection, connection_record):
+        # Durability does not matter while seeding a throwaway database
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=OFF")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.close()
+
+    migrate(engine)
+    counts = {}
+
+    with engine.begin() as conn:
+        language_ids = [uuid.uuid4() for _ in range(languages)]
+        counts["languages"] = insert_rows(conn, Language, (
+            {
+                "id": language_id,
+                "code": "english" if index == 0 else f"lang{index:03d}",
+                "name": "English" if index == 0 else f"Language {index}"
+            }
+            for index, language_id in enumerate(language_ids)
+        ))
+
+        phoneme_ids = []
+
+        def phoneme_rows():
+            for language_id in language_ids:
+                for index in range(phonemes):
+                    phoneme_id = uuid.uuid4()
+                    phoneme_ids.append(phoneme_id)
+                    is_vowel = rng.random() < 0.2
+                    impossible = not is_vowel and rng.random() < 0.1
+                    yield {
+                        "id": phoneme_id,
+                        "language_id": language_id,
+                        "type": PhonemeType.vowel if is_vowel else PhonemeType.consonant,
+                        "symbol": rng.choice(SYMBOLS) + rng.choice(SYMBOLS[:16] + [""]),
+                        "ipa": rng.choice(SYMBOLS),
+                        "example": words(rng, 2),
+                        "description": words(rng, 4),
+                        "audio_file": f"audio/synthetic_{index % 200}.mp3",
+                        "row_position": rng.randrange(VOWEL_ROWS if is_vowel else CONSONANT_ROWS),
+                        "column_position": rng.randrange(VOWEL_COLUMNS if is_vowel else CONSONANT_COLUMNS),
+                        "is_extended": rng.random() < 0.9,
+                        "articulation_type": rng.choice(WORDS),
+                        "articulation_place": rng.choice(WORDS),
+                        "impossibility_reason": words(rng, 5) if impossible else None
+                    }
+
+        counts["phonemes"] = insert_rows(conn, Phoneme, phoneme_rows())
+        counts["allophones"] = insert_rows(conn, Allophone, (
+            {
+                "id": uuid.uuid4(),
+                "phoneme_id": phoneme_id,
+                "symbol": rng.choice(SYMBOLS),
+                "environment": words(rng, 3),
+                "example": words(rng, 2),
+                "description": words(rng, 4),
+                "audio_file": None
+            }
+            for phoneme_id in phoneme_ids
+            for _ in range(allophones)
+        ))
+
+        counts["proposals"] = insert_rows(conn, Proposal, (
+            {
+                "id": uuid.uuid4(),
+                "symbol": rng.choice(SYMBOLS),
+                "sound_name": words(rng, 3),
+                "category": rng.choice(CATEGORIES),
+                "rationale": words(rng, 40),
+                "example_language": f"Language {rng.randrange(languages)}",
+                "audio_file": None,
+                "image_file": None,
+                "submitted_date": random_date(rng, start, 3 * 365),
+                "status": rng.choice(STATUSES),
+                "votes": int(rng.paretovariate(1.5)) - 1
+            }
+            for _ in range(proposals)
+        ))
+
+        topic_ids = [uuid.uuid4() for _ in range(topics)]
+        counts["discussion_topics"] = insert_rows(conn, DiscussionTopic, (
+            {
+                "id": topic_id,
+                "title": words(rng, 6),
+                "content": words(rng, 80),
+                "author_name": f"user{rng.randrange(5000)}",
+                "author_email": None,
+                "created_date": random_date(rng, start, 3 * 365)
+            }
+            for topic_id in topic_ids
+        ))
+        # Reply counts follow a long tail so a few threads are very popular
+        reply_stats = {}
+
+        def reply_rows():
+            for topic_id in topic_ids:
+                for _ in range(min(int(rng.expovariate(1 / replies)), replies * 50)):
+                    row = {
+                        "id": uuid.uuid4(),
+                        "topic_id": topic_id,
+                        "content": words(rng, 30),
+                        "author_name": f"user{rng.randrange(5000)}",
+                        "created_date": random_date(rng, start, 3 * 365)
+                    }
+                    count, latest = reply_stats.get(topic_id, (0, row["created_date"]))
+                    reply_stats[topic_id] = (count + 1, max(latest, row["created_date"]))
+                    yield row
+
+        counts["discussion_replies"] = insert_rows(conn, DiscussionReply, reply_rows())
+        # The migrations ran on empty tables, so fill in the denormalized reply stats
+        if reply_stats:
+            conn.execute(
+                update(DiscussionTopic).where(DiscussionTopic.id == bindparam("topic_id")).values(
+                    reply_count=bindparam("count"), last_reply_at=bindparam("latest")
+                ),
+                [
+                    {"topic_id": topic_id, "count": count, "latest": latest}
+                    for topic_id, (count, latest) in reply_stats.items()
+                ]
+            )
+
+        counts["notifications"] = insert_rows(conn, Notification, (
+            {
+                "id": uuid.uuid4(),
+                "title": words(rng, 4),
+                "message": words(rng, 15),
+                "related_entity_type": rng.choice(ENTITY_TYPES),
+                "related_entity_id": uuid.uuid4(),
+                "is_read": rng.random() < 0.9,
+                "created_date": random_date(rng, start, 3 * 365)
+            }
+            for _ in range(notifications)
+        ))
+
+    engine.dispose()
+    return counts
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed a synthetic benchmark database.")
+    parser.add_argument("--database", default=str(DEFAULT_DATABASE), help="SQLite file to (re)create")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every row count by this factor")
+    parser.add_argument("--languages", type=int, default=50)
+    parser.add_argument("--phonemes", type=int, default=500, help="Phonemes per language")
+    parser.add_argument("--allophones", type=int, default=2, help="Allophones per phoneme")
+    parser.add_argument("--proposals", type=int, default=100000)
+    parser.add_argument("--notifications", type=int, default=1000000)
+    parser.add_argument("--topics", type=int, default=50000)
+    parser.add_argument("--replies", type=int, default=4, help="Mean replies per topic")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed, for reproducible datasets")
+    args = parser.parse_args()
+
+    def scaled(value):
+        return max(1, int(value * args.scale))
+
+    print(f"Seeding {args.database} (scale {args.scale})...")
+    started = time.perf_counter()
+    counts = seed(
+        args.database,
+        languages=scaled(args.languages),
+        phonemes=scaled(args.phonemes),
+        allophones=args.allophones,
+        proposals=scaled(args.proposals),
+        notifications=scaled(args.notifications),
+        topics=scaled(args.topics),
+        replies=args.replies,
+        seed_value=args.seed
+    )
+    for table, count in counts.items():
+        print(f"  {table:<20} {count:>10,}")
+    print(f"Done in {time.perf_counter() - started:.1f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+# backend/gunicorn.conf.py
+"""
+Production server settings: `gunicorn -c gunicorn.conf.py app.main:app`.
+
+Send SIGHUP to the master to reload code and replace workers gracefully, SIGTTIN
+or SIGTTOU to add or remove a worker. Caches in each worker are kept consistent
+through app.services.invalidation, so any worker may handle a write.
+"""
+import multiprocessing
+import os
+
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WORKERS", min(multiprocessing.cpu_count(), 4)))
+worker_class = "app.server.ProductionWorker"
+
+# Let in-flight requests finish on restart, and recycle workers now and then
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+timeout = int(os.getenv("WORKER_TIMEOUT", "60"))
+keepalive = int(os.getenv("KEEPALIVE", "5"))
+max_requests = int(os.getenv("MAX_REQUESTS", "10000"))
+max_requests_jitter = int(os.getenv("MAX_REQUESTS_JITTER", "1000"))
+
+# Each worker imports the app itself, so a HUP reload picks up new code
+preload_app = False
+forwarded_allow_ips = os.getenv("FORWARDED_ALLOW_IPS", "127.0.0.1")
+
+accesslog = os.getenv("ACCESS_LOG") or None
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info")
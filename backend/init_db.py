@@ -4,47 +4,39 @@ Initialize the database by creating all tables and importing initial data.
 """
 import os
 import sys
-from sqlalchemy import create_engine, inspect
 import importlib
 import argparse
 
 # Add the parent directory to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.database import Base, engine
+from app.database import engine
+from app.migrations import migrate, check_schema
 
 def init_db(force=False):
-    """Initialize the database tables."""
+    """Initialize the database tables by applying all pending migrations."""
     print("Checking database...")
     
-    # Import all model files to register them with Base
-    for root, dirs, files in os.walk(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app', 'models')):
-        for file in files:
-            if file.endswith('.py') and file != '__init__.py':
-                module_path = os.path.join(root, file).replace('/', '.').replace('\\', '.').replace('.py', '')
-                module_path = module_path.split('app.')[-1]  # Extract the part after 'app.'
-                try:
-                    importlib.import_module(f"app.{module_path}")
-                    print(f"Imported {module_path}")
-                except Exception as e:
-                    print(f"Warning: Could not import {module_path}: {e}")
+    if force:
+        print("Force flag set. Recreating all tables...")
     
-    # Check if tables exist
-    inspector = inspect(engine)
-    tables = inspector.get_table_names()
-    
-    if len(tables) == 0 or force:
-        if force:
-            print("Force flag set. Recreating all tables...")
-        else:
-            print("No tables found. Creating tables...")
-        
-        Base.metadata.create_all(bind=engine)
-        print("Database tables created successfully.")
+    applied = migrate(engine, force=force)
+    if applied:
+        print(f"Applied migrations: {', '.join(str(version) for version in applied)}")
     else:
-        print(f"Database already contains {len(tables)} tables.")
+        print("Database schema is already up to date.")
         print("If you want to recreate all tables, run with --force flag.")
 
+def check_db():
+    """Compare the recorded schema version with the one this code expects."""
+    current, latest = check_schema(engine)
+    if current == latest:
+        print(f"Database schema is up to date (version {current}).")
+        return True
+    
+    print(f"Database schema is at version {current}, expected {latest}. Run 'python init_db.py migrate'.")
+    return False
+
 def load_sample_data():
     """Load sample data into the database."""
     from app.models.language import Language
@@ -81,16 +73,26 @@ def load_sample_data():
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Initialize the database.')
+    parser.add_argument('command', nargs='?', default='init', choices=['init', 'migrate', 'check'],
+                        help='init: migrate and offer to import data (default), '
+                             'migrate: apply pending migrations only, '
+                             'check: exit non-zero if migrations are pending')
     parser.add_argument('--force', action='store_true', help='Force recreate all tables')
     parser.add_argument('--sample', action='store_true', help='Load sample data')
     
     args = parser.parse_args()
     
+    if args.command == 'check':
+        sys.exit(0 if check_db() else 1)
+    
     init_db(args.force)
     
     if args.sample:
         load_sample_data()
     
+    if args.command == 'migrate':
+        sys.exit(0)
+    
     # Ask if user wants to run data extraction and import scripts
     if os.path.exists(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'extract_extended_phonemes.py')):
         answer = input("Do you want to extract and import extended IPA data? (y/n): ")
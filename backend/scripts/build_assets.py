@@ -0,0 +1,115 @@
+# backend/scripts/build_assets.py
+"""
+Minify and fingerprint the frontend assets into static/dist.
+
+Each asset is written as <name>.<first 8 hex of its SHA-256>.<ext> and listed in
+static/dist/manifest.json, which the templates read through asset_url(). Files
+from earlier builds are removed unless --keep is given (keep them while old
+pages may still be cached by clients of a rolling deploy).
+
+The minifier is deliberately conservative: it drops comments and indentation
+but never rewrites code, so the output behaves exactly like the source.
+
+Usage:
+    python scripts/build_assets.py [--keep]
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+# Add the parent directory to the Python path
+current_dir = Path(__file__).resolve().parent
+backend_dir = current_dir.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.services.assets import DIST_DIR, MANIFEST_FILE
+
+STATIC_DIR = backend_dir / "static"
+ASSETS = ["css/style.css", "js/app.js", "js/main.js"]
+
+CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+CSS_SPACE = re.compile(r"\s*([{};,>])\s*")
+# A space before ":" can be a descendant selector (".menu :hover"), so only strip after it
+CSS_COLON = re.compile(r":\s+")
+
+def minify_css(source):
+    source = CSS_COMMENT.sub("", source)
+    source = re.sub(r"\s+", " ", source)
+    source = CSS_SPACE.sub(r"\1", source)
+    source = CSS_COLON.sub(":", source)
+    return source.replace(";}", "}").strip() + "\n"
+
+def minify_js(source):
+    """Drop comment-only lines, comment blocks and indentation; statements are left untouched."""
+    lines = []
+    in_block = False
+    in_template = False
+    for line in source.splitlines():
+        if in_template:
+            # Inside a multi-line template literal whitespace is content
+            kept = line
+        else:
+            kept = line.strip()
+            if in_block:
+                end = kept.find("*/")
+                if end < 0:
+                    continue
+                in_block = False
+                kept = kept[end + 2:].strip()
+            # A comment opening the line ends at its own */; code may follow it
+            while kept.startswith("/*"):
+                end = kept.find("*/", 2)
+                if end < 0:
+                    in_block = True
+                    kept = ""
+                else:
+                    kept = kept[end + 2:].strip()
+            if not kept or kept.startswith("//"):
+                continue
+        lines.append(kept)
+        if kept.count("`") % 2:
+            in_template = not in_template
+    return "\n".join(lines) + "\n"
+
+MINIFIERS = {".css": minify_css, ".js": minify_js}
+
+def build(keep=False):
+    DIST_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = {}
+    for asset in ASSETS:
+        source_path = STATIC_DIR / asset
+        with open(source_path, encoding="utf-8") as source:
+            content = MINIFIERS[source_path.suffix](source.read()).encode("utf-8")
+
+        digest = hashlib.sha256(content).hexdigest()[:8]
+        name = f"{source_path.stem}.{digest}{source_path.suffix}"
+        with open(DIST_DIR / name, "wb") as output:
+            output.write(content)
+        manifest[asset] = name
+        print(f"  {asset} -> {name} ({source_path.stat().st_size} -> {len(content)} bytes)")
+
+    if not keep:
+        current = set(manifest.values())
+        for path in DIST_DIR.iterdir():
+            if path.name != MANIFEST_FILE.name and path.name not in current:
+                path.unlink()
+
+    # Replace the manifest atomically so a running server never reads half of it
+    temporary = MANIFEST_FILE.with_suffix(".tmp")
+    with open(temporary, "w", encoding="utf-8") as output:
+        json.dump(manifest, output, indent=2, sort_keys=True)
+    os.replace(temporary, MANIFEST_FILE)
+    print(f"Wrote {MANIFEST_FILE}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Minify and fingerprint static assets.")
+    parser.add_argument("--keep", action="store_true", help="Keep files from previous builds")
+    args = parser.parse_args()
+    build(keep=args.keep)
+
+if __name__ == "__main__":
+    main()
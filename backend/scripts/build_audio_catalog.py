@@ -0,0 +1,47 @@
+# backend/scripts/build_audio_catalog.py
+"""
+Update the audio catalog and report audio_file references without a file.
+
+Only files whose size or modification time changed since the last run are read
+again. Exits with status 1 when --strict is given and references are dangling.
+
+Usage:
+    python scripts/build_audio_catalog.py [--strict]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add the parent directory to the Python path
+current_dir = Path(__file__).resolve().parent
+backend_dir = current_dir.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.database import SessionLocal
+from app.services import invalidation  # noqa: F401 - tells running workers the catalog changed
+from app.services.audio_catalog import build_catalog, dangling_references
+
+def main():
+    parser = argparse.ArgumentParser(description="Catalog audio files and check references to them.")
+    parser.add_argument("--strict", action="store_true", help="Fail if any reference is dangling")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        stats = build_catalog(db)
+        db.commit()
+        print(f"Audio catalog: {stats['added']} added, {stats['updated']} updated, "
+              f"{stats['unchanged']} unchanged, {stats['removed']} removed")
+
+        dangling = dangling_references(db)
+    finally:
+        db.close()
+
+    for table, row_id, reference in dangling:
+        print(f"  dangling: {table} {row_id} -> {reference}")
+    print(f"{len(dangling)} dangling audio reference(s)")
+    if dangling and args.strict:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
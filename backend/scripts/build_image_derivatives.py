@@ -0,0 +1,63 @@
+# backend/scripts/build_image_derivatives.py
+"""
+Generate resized/WebP derivatives for every chart image and proposal upload.
+
+The app queues the same work as a background job when a proposal image is
+uploaded; chart images only get derivatives from this script, which the
+Dockerfiles and `start.sh --production` run. Use --prune to delete derivatives
+whose source file no longer exists.
+
+Usage:
+    python scripts/build_image_derivatives.py [--prune]
+"""
+import argparse
+import shutil
+import sys
+from pathlib import Path
+
+# Add the parent directory to the Python path
+current_dir = Path(__file__).resolve().parent
+backend_dir = current_dir.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.services import images
+
+def source_files():
+    for root in images.IMAGE_ROOTS:
+        if root.is_dir():
+            for path in sorted(root.rglob("*")):
+                if path.is_file() and images.fallback_format(path) is not None:
+                    yield path
+
+def main():
+    parser = argparse.ArgumentParser(description="Build image derivatives.")
+    parser.add_argument("--prune", action="store_true", help="Delete derivatives of files that no longer exist")
+    args = parser.parse_args()
+
+    if not images.available():
+        print("Pillow is not installed; run 'pip install Pillow' to build derivatives.")
+        sys.exit(1)
+
+    digests = set()
+    total = 0
+    for path in source_files():
+        try:
+            written = images.generate_derivatives(path)
+        except Exception as e:
+            print(f"  {path}: failed ({e})")
+            continue
+        digests.add(images.source_digest(path))
+        total += written
+        print(f"  {path}: {written} new file(s)")
+    print(f"Wrote {total} derivative(s) for {len(digests)} image(s) into {images.IMAGE_CACHE_DIR}")
+
+    if args.prune and images.IMAGE_CACHE_DIR.is_dir():
+        removed = 0
+        for directory in images.IMAGE_CACHE_DIR.iterdir():
+            if directory.is_dir() and directory.name not in digests:
+                shutil.rmtree(directory)
+                removed += 1
+        print(f"Pruned {removed} stale derivative set(s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# backend/scripts/export_data.py
+"""
+Export a dataset as NDJSON or CSV with constant memory use.
+
+Usage:
+    python scripts/export_data.py proposals
+    python scripts/export_data.py notifications --format csv --gzip -o notifications.csv.gz
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add the parent directory to the Python path
+current_dir = Path(__file__).resolve().parent
+backend_dir = current_dir.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.database import SessionLocal
+from app.services.export import DATASETS, FORMATS, export_stream
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream a dataset to a file or stdout.")
+    parser.add_argument("dataset", choices=sorted(DATASETS))
+    parser.add_argument("--format", choices=sorted(FORMATS), default="ndjson")
+    parser.add_argument("--gzip", action="store_true", help="Compress the output with gzip")
+    parser.add_argument("-o", "--output", help="Output file (default: stdout)")
+    args = parser.parse_args()
+
+    chunks = export_stream(args.dataset, args.format, compress=args.gzip, session_factory=SessionLocal)
+    if args.output is None:
+        for chunk in chunks:
+            sys.stdout.buffer.write(chunk)
+        sys.stdout.buffer.flush()
+        return
+
+    written = 0
+    with open(args.output, "wb") as output:
+        for chunk in chunks:
+            output.write(chunk)
+            written += len(chunk)
+    print(f"Wrote {written} bytes to {args.output}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,9 @@ from app.database import Base
 from app.models.language import Language
 from app.models.phoneme import Phoneme, PhonemeType
 from app.models.allophone import Allophone
+from app.services import invalidation  # noqa: F401 - tells running workers the data changed
+from app.services import changes  # noqa: F401 - logs imported rows for /api/changes
+from app.services.audio_catalog import build_catalog, dangling_references
 
 # Create database connection
 engine = create_engine("sqlite:///./ipa_symbols.db")
@@ -75,4 +78,10 @@ for lang_code, lang_data in data.items():
                             db.add(allophone)
                         db.commit()
 
+# Check that every imported audio file reference points at a real file
+build_catalog(db)
+db.commit()
+for table, row_id, reference in dangling_references(db):
+    print(f"Warning: {table} {row_id} refers to missing audio file {reference}")
+
 print("Data import completed!")
@@ -17,6 +17,10 @@ try:
     from app.models.language import Language
     from app.models.phoneme import Phoneme, PhonemeType
     from app.models.allophone import Allophone
+    from app.services import invalidation  # noqa: F401 - tells running workers the data changed
+    from app.services import changes  # noqa: F401 - logs imported rows for /api/changes
+    from app.services.inventory import get_inventories
+    from app.services.audio_catalog import build_catalog, dangling_references
 except ImportError as e:
     print(f"Error importing modules: {e}")
     sys.exit(1)
@@ -100,6 +104,18 @@ def import_extended_phonemes():
             # Save changes to database
             db.commit()
             print(f"Successfully imported {import_count} phonemes")
+            
+            # The commit bumped the phonemes generation, so running workers rebuild theirs too
+            inventories = get_inventories(db)
+            print(f"Rebuilt inventory bitmaps: {len(inventories.symbols)} symbols across {len(inventories.bitmaps)} languages")
+            
+            # Check that every imported audio_file points at a real file
+            build_catalog(db)
+            db.commit()
+            dangling = dangling_references(db)
+            for table, row_id, reference in dangling:
+                print(f"Warning: {table} {row_id} refers to missing audio file {reference}")
+            print(f"Checked audio references: {len(dangling)} dangling")
         except Exception as e:
             db.rollback()
             print(f"Error during database operations: {e}")
@@ -0,0 +1,39 @@
+# backend/scripts/notification_retention.py
+"""
+Apply the notification retention policy once (suitable for cron).
+
+Usage:
+    python scripts/notification_retention.py
+    python scripts/notification_retention.py --no-vacuum
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add the parent directory to the Python path
+current_dir = Path(__file__).resolve().parent
+backend_dir = current_dir.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.database import SessionLocal
+from app.services import notification_retention
+
+def main():
+    parser = argparse.ArgumentParser(description="Roll up, prune and vacuum old notifications.")
+    parser.add_argument("--no-vacuum", action="store_true", help="Skip VACUUM even if many rows were removed")
+    args = parser.parse_args()
+
+    print(f"Rolling read notifications older than {notification_retention.DIGEST_AFTER_DAYS} days into digests, "
+          f"deleting notifications older than {notification_retention.TTL_DAYS} days...")
+    db = SessionLocal()
+    try:
+        vacuum_min_rows = float("inf") if args.no_vacuum else notification_retention.VACUUM_MIN_ROWS
+        stats = notification_retention.run_retention(db, vacuum_min_rows=vacuum_min_rows)
+    finally:
+        db.close()
+
+    print(f"Compacted {stats['compacted']} notifications, expired {stats['expired']} notifications "
+          f"and {stats['expired_digests']} digests{', vacuumed' if stats['vacuumed'] else ''}.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# backend/scripts/profile_startup.py
+"""
+Profile how long it takes to import the application and check it against a budget.
+
+Runs `python -X importtime -c "import app.main"` in a fresh interpreter, so the
+numbers match what a newly started worker pays before it can serve requests.
+
+Usage:
+    python scripts/profile_startup.py --budget-ms 1500 --top 20
+    python scripts/profile_startup.py --json > startup_profile.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+current_dir = Path(__file__).resolve().parent
+backend_dir = current_dir.parent
+
+DEFAULT_BUDGET_MS = float(os.getenv("STARTUP_BUDGET_MS", "1500"))
+
+def profile_imports(module="app.main"):
+    """Return a list of (module, self_us, cumulative_us) in import order."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=str(backend_dir),
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        entries.append((name.strip(), int(self_us), int(cumulative_us)))
+    return entries
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile application import time.")
+    parser.add_argument("--module", default="app.main", help="Module to import (default: app.main)")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Fail if the import takes longer")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest modules to show")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    entries = profile_imports(args.module)
+    total_ms = max(cumulative for _, _, cumulative in entries) / 1000
+    slowest = sorted(entries, key=lambda entry: entry[1], reverse=True)[:args.top]
+    within_budget = total_ms <= args.budget_ms
+
+    if args.json:
+        print(json.dumps({
+            "module": args.module,
+            "total_ms": round(total_ms, 1),
+            "budget_ms": args.budget_ms,
+            "within_budget": within_budget,
+            "slowest": [
+                {"module": name, "self_ms": round(self_us / 1000, 1), "cumulative_ms": round(cumulative_us / 1000, 1)}
+                for name, self_us, cumulative_us in slowest
+            ]
+        }, indent=2))
+    else:
+        print(f"Importing {args.module} took {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+        print(f"{'self ms':>10} {'cumulative ms':>14}  module")
+        for name, self_us, cumulative_us in slowest:
+            print(f"{self_us / 1000:>10.1f} {cumulative_us / 1000:>14.1f}  {name}")
+        print("Within budget." if within_budget else "Over budget!")
+
+    sys.exit(0 if within_budget else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# backend/scripts/run_jobs.py
+"""
+Run background job workers in a dedicated process.
+
+Start the web workers with JOB_WORKERS=0 and run this alongside them to keep
+slow side effects out of the API processes entirely.
+
+Usage:
+    python scripts/run_jobs.py --workers 4
+"""
+import argparse
+import logging
+import signal
+import sys
+import threading
+from pathlib import Path
+
+# Add the parent directory to the Python path
+current_dir = Path(__file__).resolve().parent
+backend_dir = current_dir.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.database import SessionLocal
+from app.services import jobs, proposal_tasks, images, audio_catalog  # noqa: F401 - registers job handlers
+from app.services import invalidation, changes  # noqa: F401 - cache generations and change log for job writes
+
+def main():
+    parser = argparse.ArgumentParser(description="Run background job workers.")
+    parser.add_argument("--workers", type=int, default=max(jobs.JOB_WORKERS, 1), help="Worker threads")
+    parser.add_argument("--poll-interval", type=float, default=jobs.POLL_INTERVAL, help="Seconds between polls when idle")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    pool = jobs.WorkerPool(SessionLocal, size=args.workers, poll_interval=args.poll_interval)
+    stopped = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopped.set())
+    signal.signal(signal.SIGINT, lambda *_: stopped.set())
+
+    pool.start()
+    print(f"Running {args.workers} job worker(s) for: {', '.join(sorted(jobs.HANDLERS))}")
+    stopped.wait()
+    print("Stopping job workers...")
+    pool.stop()
+
+if __name__ == "__main__":
+    main()
@@ -73,41 +73,9 @@ except Exception as e:
     cd ..
 fi
 
-# Initialize database
+# Initialize database (applies pending migrations; the app itself never creates tables)
 echo "Initializing database..."
-python -c "
-import os
-import sys
-from sqlalchemy import create_engine, inspect
-from pathlib import Path
-
-# Add the current directory to the Python path
-sys.path.append('.')
-
-try:
-    from app.database import Base, engine
-    
-    # Import models to register with Base
-    from app.models.language import Language
-    from app.models.phoneme import Phoneme, PhonemeType
-    from app.models.allophone import Allophone
-    from app.models.proposal import Proposal
-    from app.models.discussion import DiscussionTopic, DiscussionReply
-    from app.models.notification import Notification
-    
-    # Check if database and tables exist
-    inspector = inspect(engine)
-    tables = inspector.get_table_names()
-    
-    if len(tables) == 0:
-        print('Creating database tables...')
-        Base.metadata.create_all(bind=engine)
-        print('Database tables created successfully.')
-    else:
-        print(f'Database already contains {len(tables)} tables.')
-except Exception as e:
-    print(f'Error initializing database: {e}')
-"
+python init_db.py migrate || echo -e "${RED}Error initializing database.${NC}"
 
 # Import data if database is empty
 echo "Checking if data needs to be imported..."
@@ -141,8 +109,16 @@ except Exception as e:
 "
 
 # Start the FastAPI server
+# APP_ENV=production (or ./start.sh --production) runs multiple gunicorn/uvicorn workers;
+# otherwise a single auto-reloading development server is started.
 echo -e "${GREEN}Starting the FastAPI server...${NC}"
 echo "The server will be available at http://localhost:8000"
 echo "API documentation will be at http://localhost:8000/api/docs"
 echo -e "${BLUE}========================================${NC}"
-uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload
+if [ "$APP_ENV" == "production" ] || [ "$1" == "--production" ]; then
+    python scripts/build_assets.py
+    python scripts/build_image_derivatives.py || echo -e "${RED}Chart images will be served unresized.${NC}"
+    exec gunicorn -c gunicorn.conf.py app.main:app
+else
+    exec uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload
+fi
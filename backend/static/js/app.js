@@ -377,6 +377,7 @@ document.addEventListener('DOMContentLoaded', function() {
                 <p><strong>Category:</strong> ${proposal.category.charAt(0).toUpperCase() + proposal.category.slice(1)}</p>
                 <p><strong>Rationale:</strong> ${proposal.rationale}</p>
                 ${proposal.example_language ? `<p><strong>Example Languages:</strong> ${proposal.example_language}</p>` : ''}
+                ${proposal.image_file ? `<img class="proposal-image" src="${API_BASE_URL}/images/${proposal.image_file}?w=160" loading="lazy" alt="${proposal.sound_name}">` : ''}
             </div>
             <div class="proposal-votes">
                 <button class="vote-btn upvote" data-id="${proposal.id}" data-vote="1">👍 Upvote</button>